@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+
+from app.core.security import require_permission
+from app.core.permissions import Permission
+from app.crud import crud_audit
+from app.db.session import get_db
+from app.schemas.audit import AuditPage
+
+router = APIRouter(
+    prefix="/audit",
+    tags=["audit"],
+    dependencies=[Depends(require_permission(Permission.AUDIT_READ))],
+)
+
+MAX_RANGE = timedelta(days=366)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Query datetimes without an offset are taken as UTC, so they compare with aware ones."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _parse_cursor(cursor: str):
+    try:
+        occurred_at, entry_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(occurred_at), int(entry_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/", response_model=AuditPage)
+def read_audit_log(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    actor_user_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieves audit entries, newest first.
+
+    Defaults to the last 30 days; ranges are capped at one year so every query prunes to a
+    bounded set of monthly partitions.
+    """
+    until = _as_utc(until) or datetime.now(timezone.utc)
+    since = _as_utc(since) or until - timedelta(days=30)
+    if since >= until or until - since > MAX_RANGE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`since` must be before `until` and the range at most one year",
+        )
+    entries = crud_audit.get_audit_entries(
+        db, since=since, until=until, entity_type=entity_type, entity_id=entity_id,
+        actor_user_id=actor_user_id, before=_parse_cursor(cursor) if cursor else None, limit=limit,
+    )
+    next_cursor = None
+    if len(entries) == limit:
+        last = entries[-1]
+        next_cursor = f"{last.occurred_at.isoformat()}_{last.id}"
+    return AuditPage(items=entries, next_cursor=next_cursor)
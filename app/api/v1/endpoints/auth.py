@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Annotated
 from datetime import timedelta
 from sqlalchemy.orm import Session # Import Session
 
 # Import schemas, security functions, and settings
-from app.schemas.token import Token
+from app.schemas.token import Token, RefreshTokenRequest
 from app.schemas.user import UserInDB
 from app.core.security import (
     authenticate_user,
@@ -13,6 +13,8 @@ from app.core.security import (
     get_current_active_user,
 )
 from app.core.config import settings # Import settings
+from app.core.rate_limit import enforce_login_rate_limit
+from app.crud import crud_refresh_token
 
 router = APIRouter(
     prefix="/auth", # Changed prefix to /auth
@@ -22,14 +24,16 @@ from app.db.session import get_db # Import get_db dependency
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
+    request: Request,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: Session = Depends(get_db) # Add DB session dependency
 ):
     """
     Provides an access token for valid user credentials.
 
-    Uses OAuth2 Password Flow.
+    Uses OAuth2 Password Flow. Attempts are rate limited per IP and per username (429).
     """
+    enforce_login_rate_limit(request, form_data.username) # Before any DB or bcrypt work
     user = authenticate_user(db=db, username=form_data.username, password=form_data.password) # Pass db session
     if not user:
         raise HTTPException(
@@ -42,7 +46,37 @@ async def login_for_access_token(
         data={"sub": user.username, "scopes": [role.name for role in user.roles]},
         expires_delta=access_token_expires,
     )
-    return {"access_token": access_token, "token_type": "bearer"}
+    refresh_token = crud_refresh_token.issue_refresh_token(db, user_id=user.id)
+    db.commit()
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(body: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    Exchanges a refresh token for a new access token and a new (rotated) refresh token.
+
+    Costs one indexed lookup and no password hashing. Reusing an old refresh token revokes
+    every token issued from the same login.
+    """
+    rotated = crud_refresh_token.rotate_refresh_token(db, body.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    refresh_token, username, role_names = rotated
+    access_token = create_access_token(
+        data={"sub": username, "scopes": role_names},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"access_token": access_token, "token_type": "bearer", "refresh_token": refresh_token}
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(body: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """Revokes the refresh token and every token rotated from the same login."""
+    crud_refresh_token.revoke_refresh_token(db, body.refresh_token)
+    return None
 
 @router.get("/users/me/", response_model=UserInDB)
 async def read_users_me(
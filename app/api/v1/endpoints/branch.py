@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from typing import List, Optional
 from sqlmodel import Session
 
 from app import crud, schemas
 from app.db import session # Assuming session dependency setup
 from app.db.models.branch import Branch # Import the model for response_model
+from app.schemas.deletion import DeleteResult
 
 router = APIRouter()
 
@@ -41,13 +42,14 @@ def read_branches(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    include_archived: bool = False,
     # Add dependency for current user/permissions if needed
     # current_user: models.User = Depends(deps.get_current_active_user),
 ):
     """
-    Retrieve branches.
+    Retrieve branches (deleted branches only with include_archived).
     """
-    branches = crud.crud_branch.get_branches(db, skip=skip, limit=limit)
+    branches = crud.crud_branch.get_branches(db, skip=skip, limit=limit, include_archived=include_archived)
     return branches
 
 @router.get("/{branch_id}", response_model=schemas.Branch)
@@ -89,20 +91,27 @@ def update_branch(
     updated_branch = crud.crud_branch.update_branch(db=db, db_branch=branch, branch_in=branch_in)
     return updated_branch
 
-@router.delete("/{branch_id}", response_model=schemas.Branch) # Or return status code/message
+@router.delete("/{branch_id}", response_model=DeleteResult)
 def delete_branch(
     *,
     db: Session = Depends(get_db),
     branch_id: int,
+    reassign_to: Optional[int] = None,
+    detach: bool = False,
     # Add dependency for current user/permissions if needed
     # current_user: models.User = Depends(deps.get_current_active_superuser),
 ):
     """
-    Delete a branch.
+    Delete a branch. The branch is archived (hidden from default queries), not removed.
+    Its employees, users and leave move to `reassign_to`, lose their branch with `detach`,
+    or otherwise keep pointing at the archived branch.
     """
     branch = crud.crud_branch.get_branch(db, branch_id=branch_id)
     if not branch:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Branch not found")
-    # Add checks here if deleting a branch with associated users/employees is restricted
-    deleted_branch = crud.crud_branch.delete_branch(db=db, branch_id=branch_id)
-    return deleted_branch # Or return {"message": "Branch deleted successfully"}
\ No newline at end of file
+    if reassign_to is not None:
+        if detach:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Use either reassign_to or detach")
+        if reassign_to == branch_id or not crud.crud_branch.get_branch(db, branch_id=reassign_to):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="reassign_to must be another active branch")
+    return crud.crud_branch.delete_branch(db=db, branch_id=branch_id, reassign_to=reassign_to, detach=detach)
\ No newline at end of file
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List
+
+from app.core import recruitment
+from app.schemas.recruitment import ApplicationAccepted, ApplicationCreate, CareersRequisition
+
+# Public endpoints: no authentication, no database access on the request path
+router = APIRouter(
+    prefix="/careers",
+    tags=["careers"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/requisitions", response_model=List[CareersRequisition])
+def read_open_requisitions():
+    """Open positions, served from a short-lived in-process cache."""
+    return recruitment.open_requisitions.list()
+
+
+@router.post("/requisitions/{requisition_id}/applications", response_model=ApplicationAccepted,
+             status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(recruitment.enforce_apply_rate_limit)])
+def apply(requisition_id: int, application: ApplicationCreate):
+    """
+    Queues an application. It is written with the next batch, normally within a second;
+    repeat submissions of the same email to a requisition are ignored.
+    """
+    if not recruitment.open_requisitions.is_open(requisition_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Requisition not found or closed")
+    recruitment.submit_application(requisition_id, application)
+    return ApplicationAccepted()
@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from app.core.security import require_permission
+from app.core.permissions import Permission
+from app.crud import crud_change_log
+from app.db.session import get_db
+from app.schemas.change_log import ChangeEntry, ChangeFeedPage
+
+router = APIRouter(
+    prefix="/changes",
+    tags=["changes"],
+    dependencies=[Depends(require_permission(Permission.CHANGES_READ))],
+)
+
+LONG_POLL_INTERVAL_SECONDS = 1.0
+
+
+@router.get("/", response_model=ChangeFeedPage)
+async def read_changes(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    wait: int = Query(0, ge=0, le=30, description="Seconds to long-poll when no changes are available"),
+    db: Session = Depends(get_db),
+):
+    """
+    Returns changes to employees and leave requests after the `since` token, oldest first.
+
+    Consumers store `next_token` and pass it back as `since` to receive only new deltas.
+    With `wait`, the request is held open until changes arrive or the timeout expires.
+    """
+    try:
+        position = crud_change_log.parse_token(since)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid `since` token")
+
+    def poll():
+        entries = crud_change_log.get_changes_since(db, since=position, limit=limit)
+        if not entries:
+            db.rollback()  # End the read transaction so the next poll sees a fresh snapshot
+        return entries
+
+    deadline = time.monotonic() + wait
+    while True:
+        # Queries run in a worker thread so a long-poll never blocks the event loop
+        entries = await asyncio.to_thread(poll)
+        if entries or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(LONG_POLL_INTERVAL_SECONDS)
+
+    changes = [
+        ChangeEntry(
+            token=crud_change_log.format_token(entry.txid, entry.id),
+            entity_type=entry.entity_type,
+            entity_id=entry.entity_id,
+            operation=entry.operation,
+            changed_at=entry.changed_at,
+            data=entry.data,
+        )
+        for entry in entries
+    ]
+    next_token = changes[-1].token if changes else crud_change_log.format_token(*position)
+    return ChangeFeedPage(changes=changes, next_token=next_token)
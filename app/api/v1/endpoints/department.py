@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.core.security import require_role
+from app.core.security import require_permission
+from app.core.permissions import Permission
 from app.db.session import get_db
 from app.crud import crud_department
+from app.schemas.deletion import DeleteResult
 from app.schemas.department import Department, DepartmentCreate, DepartmentUpdate
 
 router = APIRouter(prefix="/department",
                    tags=["department"],
-                   dependencies=[Depends(require_role(["system"]))],  # Apply auth to all routes in this router
+                   dependencies=[Depends(require_permission(Permission.DEPARTMENT_MANAGE))],  # Apply auth to all routes in this router
                    responses={404: {"description": "Not found"}},)
 
 
@@ -36,6 +38,12 @@ def update_department(department_id: int, department: DepartmentUpdate, db: Sess
     return crud_department.update_department(db, department_id, department)
 
 
-@router.delete("/{department_id}", response_model=Department)
-def delete_department(department_id: int, db: Session = Depends(get_db)):
-    return crud_department.delete_department(db, department_id)
+@router.delete("/{department_id}", response_model=DeleteResult)
+def delete_department(department_id: int, reassign_to: Optional[int] = None, db: Session = Depends(get_db)):
+    """Deletes a department, moving its employees to `reassign_to` or clearing their department."""
+    if reassign_to is not None and (reassign_to == department_id or not crud_department.get_department(db, reassign_to)):
+        raise HTTPException(status_code=400, detail="reassign_to must be another existing department")
+    result = crud_department.delete_department(db, department_id, reassign_to=reassign_to)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Department not found")
+    return result
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Annotated, Optional
+from datetime import date
 from sqlalchemy.orm import Session  # Import Session
 
 # Import schemas, security, CRUD, DB dependency, and Employee schema for response
 from app.schemas.employee import Employee, EmployeeCreate, EmployeeUpdate  # Import Employee and EmployeeUpdate
+from app.schemas.employee_history import EmployeeVersion
 from app.schemas.user import UserInDB
-from app.core.security import get_current_active_user, require_role
-from app.crud import crud_employee  # Import employee CRUD functions
+from app.core.security import get_current_active_user, require_permission
+from app.core.permissions import Permission, has_permission
+from app.crud import crud_employee, crud_employee_history  # Import employee CRUD functions
 from app.db.session import get_db  # Import DB session dependency
 
 router = APIRouter(
@@ -20,11 +23,17 @@ router = APIRouter(
 
 # --- Employee Endpoints ---
 
+
+def _check_archive_access(current_user: UserInDB, include_archived: bool) -> None:
+    """Terminated employees are visible only to users who may read employee history."""
+    if include_archived and not has_permission(current_user, Permission.EMPLOYEE_HISTORY_READ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view archived employees")
+
 # Requires 'manager' or 'admin' role
 
 
 @router.post("/", response_model=Employee, status_code=status.HTTP_201_CREATED,
-             dependencies=[Depends(require_role(["manager"]))])
+             dependencies=[Depends(require_permission(Permission.EMPLOYEE_WRITE))])
 async def create_employee(
     employee: EmployeeCreate,
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
@@ -42,29 +51,47 @@ async def create_employee(
 
 
 @router.get("/", response_model=List[Employee],
-            dependencies=[Depends(require_role(["employee"]))])
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_READ))])
 async def read_employees(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     skip: int = 0,  # Add pagination
     limit: int = 100,
+    include_archived: bool = False,
     db: Session = Depends(get_db)  # Add DB session dependency
 ):
-    """Retrieves a list of all employees."""
-    employees = crud_employee.get_employees(db, skip=skip, limit=limit)
+    """Retrieves a list of active employees (terminated ones too with include_archived)."""
+    _check_archive_access(current_user, include_archived)
+    employees = crud_employee.get_employees(db, skip=skip, limit=limit, include_archived=include_archived)
     return employees
 
+# Requires 'admin' role; declared before /{employee_id} so "as-of" is not parsed as an id
+
+
+@router.get("/as-of", response_model=List[EmployeeVersion],
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_HISTORY_READ))])
+async def read_employees_as_of(
+    on: date,
+    after_employee_id: Optional[int] = None,
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db)
+):
+    """Salary, position and department of every employee on a date, ordered by employee id."""
+    return crud_employee_history.get_snapshot_as_of(db, on, after_employee_id=after_employee_id, limit=limit)
+
 # Requires at least 'employee' role
 
 
 @router.get("/{employee_id}", response_model=Employee,
-            dependencies=[Depends(require_role(["employee"]))])
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_READ))])
 async def read_employee(
     employee_id: int,
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    include_archived: bool = False,
     db: Session = Depends(get_db)  # Add DB session dependency
 ):
     """Retrieves a specific employee by their ID."""
-    db_employee = crud_employee.get_employee(db, employee_id=employee_id)
+    _check_archive_access(current_user, include_archived)
+    db_employee = crud_employee.get_employee(db, employee_id=employee_id, include_archived=include_archived)
     if db_employee is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
     return db_employee
@@ -73,7 +100,7 @@ async def read_employee(
 
 
 @router.put("/{employee_id}", response_model=Employee,
-            dependencies=[Depends(require_role(["manager"]))])
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_WRITE))])
 async def update_employee(
     employee_id: int,
     employee_update: EmployeeUpdate,  # Use EmployeeUpdate schema
@@ -99,16 +126,35 @@ async def update_employee(
 
 
 @router.delete("/{employee_id}", status_code=status.HTTP_204_NO_CONTENT,
-               dependencies=[Depends(require_role(["admin"]))])
+               dependencies=[Depends(require_permission(Permission.EMPLOYEE_DELETE))])
 async def delete_employee(
     employee_id: int,
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     db: Session = Depends(get_db)  # Add DB session dependency
 ):
-    """Deletes an employee by their ID."""
+    """Terminates an employee: the record is archived and hidden from default queries."""
     # Use CRUD function to delete
     deleted_employee = crud_employee.delete_employee(db=db, employee_id=employee_id)
     if deleted_employee is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
     # Return None with 204 status code (already set in decorator)
     return None
+
+# Requires 'admin' role
+
+
+@router.get("/{employee_id}/history", response_model=List[EmployeeVersion],
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_HISTORY_READ))])
+async def read_employee_history(employee_id: int, db: Session = Depends(get_db)):
+    """All salary/position/department versions of an employee, oldest first."""
+    return crud_employee_history.get_employee_history(db, employee_id)
+
+
+@router.get("/{employee_id}/as-of", response_model=EmployeeVersion,
+            dependencies=[Depends(require_permission(Permission.EMPLOYEE_HISTORY_READ))])
+async def read_employee_as_of(employee_id: int, on: date, db: Session = Depends(get_db)):
+    """The employee's salary, position and department as they were on a date."""
+    version = crud_employee_history.get_employee_as_of(db, employee_id, on)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No employee version on that date")
+    return version
\ No newline at end of file
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Response, status
+
+from app.core.startup import pipeline
+from app.db.statements import statements
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+def read_liveness():
+    """The process is up and serving HTTP (it may still be warming up)."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def read_readiness(response: Response):
+    """503 until the startup pipeline has finished; includes the per-phase startup timings."""
+    report = pipeline.report()
+    if not report["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
+@router.get("/statements")
+def read_statement_stats():
+    """Compiled-cache outcomes (cache_hit, cache_miss, ...) per prebuilt hot statement since startup."""
+    return statements.stats()
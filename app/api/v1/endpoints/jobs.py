@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from app.core import jobs
+from app.core.security import require_permission
+from app.core.permissions import Permission
+from app.schemas.job import JobMetrics
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    dependencies=[Depends(require_permission(Permission.JOBS_READ))],
+)
+
+
+@router.get("/metrics", response_model=JobMetrics)
+def read_job_metrics():
+    """
+    Returns the in-process worker's counters and the current queue depth per status.
+
+    Counters are zero when the worker runs as a separate process (`python -m app.core.jobs`).
+    """
+    metrics = jobs.worker.metrics.snapshot()
+    metrics.queue_depth = jobs.queue_depth()
+    return metrics
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Response
+
+from app.core.jwt_keys import key_ring
+
+router = APIRouter(tags=["authentication"])
+
+
+@router.get("/.well-known/jwks.json")
+def read_jwks(response: Response):
+    """
+    Publishes the public keys that sign access tokens (empty for HS256).
+
+    Other services fetch and cache this document to validate tokens locally, picking the
+    key by the token's `kid` header.
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return key_ring.jwks()
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Annotated
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from typing import List, Annotated, Optional
+from datetime import date
 from sqlalchemy.orm import Session  # Import Session
 
 # Import schemas, security functions, CRUD, and DB dependency
-from app.schemas.leave import LeaveRequest, LeaveRequestCreate, LeaveStatus
+from app.schemas.leave import LeaveRequest, LeaveRequestCreate, LeaveStatus, LeaveBatchAction, LeaveBatchResult
 from app.schemas.user import UserInDB
-from app.core.security import get_current_active_user, require_role
-from app.crud import crud_leave  # Import leave CRUD functions
+from app.core.security import get_current_active_user, require_permission
+from app.core.permissions import Permission, has_permission
+from app.crud import crud_leave, crud_employee  # Import leave and employee CRUD functions
 from app.db.session import get_db  # Import DB session dependency (adjust path if needed)
+from app.core.pubsub import leave_events, leave_topic
 
 router = APIRouter(
     prefix="/leave",
@@ -16,6 +23,8 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+SSE_KEEPALIVE_SECONDS = 15
+
 # --- (Mock database removed) ---
 
 # --- Leave Request Endpoints ---
@@ -24,7 +33,7 @@ router = APIRouter(
 
 
 @router.post("/", response_model=LeaveRequest, status_code=status.HTTP_201_CREATED,
-             dependencies=[Depends(require_role(["employee"]))])
+             dependencies=[Depends(require_permission(Permission.LEAVE_CREATE))])
 async def create_leave_request(
     leave_request: LeaveRequestCreate,
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
@@ -45,14 +54,17 @@ async def create_leave_request(
     # For now, assume the employee_id in the request is valid and intended
 
     # Create request using CRUD function
-    db_leave_request = crud_leave.create_leave_request(db=db, leave_request=leave_request)
+    try:
+        db_leave_request = crud_leave.create_leave_request(db=db, leave_request=leave_request)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
     return db_leave_request
 
 # Requires 'manager' or 'admin' role to view all requests
 
 
 @router.get("/", response_model=List[LeaveRequest],
-            dependencies=[Depends(require_role(["manager"]))])
+            dependencies=[Depends(require_permission(Permission.LEAVE_READ_ALL))])
 async def read_all_leave_requests(
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     skip: int = 0,
@@ -64,31 +76,210 @@ async def read_all_leave_requests(
     leave_requests = crud_leave.get_leave_requests(db=db, skip=skip, limit=limit)
     return leave_requests
 
+# Requires at least 'employee' role to view their own requests
+
+
+@router.get("/me", response_model=List[LeaveRequest],
+            dependencies=[Depends(require_permission(Permission.LEAVE_READ_OWN))])
+async def read_my_leave_requests(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    status_filter: Optional[LeaveStatus] = Query(None, alias="status"),
+    start_from: Optional[date] = None,
+    start_to: Optional[date] = None,
+    skip: int = 0,
+    limit: int = Query(100, le=500),
+    include_archived: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Retrieves the current user's own leave requests, newest first (older history with include_archived)."""
+    employee = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+    if employee is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No employee profile linked to this user")
+    return crud_leave.get_leave_requests_by_employee(
+        db=db, employee_id=employee.id, skip=skip, limit=limit,
+        status=status_filter, start_from=start_from, start_to=start_to, include_archived=include_archived,
+    )
+
+# Requires 'manager' or 'admin' role to view the team inbox
+
+
+@router.get("/team", response_model=List[LeaveRequest],
+            dependencies=[Depends(require_permission(Permission.LEAVE_READ_ALL))])
+async def read_team_leave_requests(
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    status_filter: Optional[LeaveStatus] = Query(LeaveStatus.PENDING, alias="status"),
+    start_from: Optional[date] = None,
+    start_to: Optional[date] = None,
+    department_id: Optional[int] = None,
+    branch_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = Query(100, le=500),
+    db: Session = Depends(get_db)
+):
+    """
+    Retrieves leave requests for the manager's team (pending by default).
+
+    The team defaults to the manager's own department and branch; either can be overridden.
+    """
+    if department_id is None:
+        manager_profile = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+        department_id = manager_profile.department_id if manager_profile else None
+    if branch_id is None:
+        branch_id = current_user.branch_id
+    if department_id is None and branch_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not determine the team; pass department_id or branch_id."
+        )
+    return crud_leave.get_leave_requests_for_team(
+        db=db, department_id=department_id, branch_id=branch_id, skip=skip, limit=limit,
+        status=status_filter, start_from=start_from, start_to=start_to,
+    )
+
 # Requires at least 'employee' role to view a specific request
 # TODO: Add logic to ensure employees can only view their own requests unless manager/admin
 
 
 @router.get("/{request_id}", response_model=LeaveRequest,
-            dependencies=[Depends(require_role(["employee"]))])
+            dependencies=[Depends(require_permission(Permission.LEAVE_READ_OWN))])
 async def read_leave_request(
     request_id: int,
     current_user: Annotated[UserInDB, Depends(get_current_active_user)],
     db: Session = Depends(get_db)  # Moved DB session dependency to the end
 ):
     """Retrieves a specific leave request by its ID."""
+    return _get_viewable_leave_request(db, request_id, current_user)
+
+
+def _get_viewable_leave_request(db: Session, request_id: int, current_user: UserInDB):
+    """Fetches a leave request and checks the caller may see it (owner or LEAVE_READ_ALL)."""
     # Retrieve request using CRUD function
     db_request = crud_leave.get_leave_request(db=db, request_id=request_id)
     if db_request is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Leave request not found")
 
-    # Implement access control
-    is_owner = db_request.employee_id == current_user.id
-    is_manager_or_admin = any(role.name in ["manager", "admin"] for role in current_user.roles)
-
-    if not is_owner and not is_manager_or_admin:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view this request")
+    # Implement access control (users who may read all requests skip the profile lookup)
+    if not has_permission(current_user, Permission.LEAVE_READ_ALL):
+        profile = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+        if profile is None or profile.id != db_request.employee_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view this request")
 
     return db_request
 
-# TODO: Add endpoints for updating status (PUT /leave/{request_id}/status) - requires manager/admin
+# Requires at least 'employee' role; replaces client-side polling of GET /leave/{request_id}
+
+
+@router.get("/{request_id}/events", dependencies=[Depends(require_permission(Permission.LEAVE_READ_OWN))])
+async def stream_leave_request_events(
+    request_id: int,
+    request: Request,
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    db: Session = Depends(get_db)
+):
+    """
+    Streams status updates for a leave request as server-sent events.
+
+    The current state is sent immediately, then one `status` event per change. The stream
+    ends after a final status (approved/rejected); comments are sent as keep-alives.
+    """
+    # Subscribe before reading so no change can slip in between the read and the subscription
+    subscription = leave_events.subscribe(leave_topic(request_id))
+    try:
+        db_request = _get_viewable_leave_request(db, request_id, current_user)
+        initial = LeaveRequest.model_validate(db_request).model_dump(mode="json")
+    except HTTPException:
+        subscription.close()
+        raise
+    db.close()  # Do not hold a pooled connection for the lifetime of the stream
+
+    async def event_stream():
+        with subscription:
+            message = initial
+            while True:
+                if message is not None:
+                    yield f"event: status\ndata: {json.dumps(message)}\n\n"
+                    if message["status"] != LeaveStatus.PENDING.value:
+                        return
+                if await request.is_disconnected():
+                    return
+                try:
+                    message = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    message = None
+                    yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# --- Approval Workflow ---
+# Requires 'manager' or 'admin' role to approve or reject requests
+
+
+def _apply_batch_status(db: Session, action: LeaveBatchAction, new_status: LeaveStatus) -> LeaveBatchResult:
+    """Applies a status transition to a batch of requests and reports the ones that were skipped."""
+    updated = crud_leave.update_leave_requests_status(db=db, request_ids=action.request_ids, status=new_status)
+    updated_ids = {leave_request.id for leave_request in updated}
+    skipped = sorted({request_id for request_id in action.request_ids if request_id not in updated_ids})
+    return LeaveBatchResult(updated=updated, skipped=skipped)
+
+
+def _apply_single_status(db: Session, request_id: int, new_status: LeaveStatus) -> LeaveRequest:
+    """Applies a status transition to one request, mapping failures to 404/409."""
+    updated = crud_leave.update_leave_request_status(db=db, request_id=request_id, status=new_status)
+    if updated is None:
+        if crud_leave.get_leave_request(db=db, request_id=request_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Leave request not found")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Leave request cannot be moved to '{new_status.value}' from its current status"
+        )
+    return updated
+
+
+@router.post("/approve", response_model=LeaveBatchResult,
+             dependencies=[Depends(require_permission(Permission.LEAVE_APPROVE))])
+async def approve_leave_requests(
+    action: LeaveBatchAction,
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    db: Session = Depends(get_db)
+):
+    """Approves a batch of pending leave requests in a single statement and transaction."""
+    return _apply_batch_status(db, action, LeaveStatus.APPROVED)
+
+
+@router.post("/reject", response_model=LeaveBatchResult,
+             dependencies=[Depends(require_permission(Permission.LEAVE_APPROVE))])
+async def reject_leave_requests(
+    action: LeaveBatchAction,
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    db: Session = Depends(get_db)
+):
+    """Rejects a batch of pending leave requests in a single statement and transaction."""
+    return _apply_batch_status(db, action, LeaveStatus.REJECTED)
+
+
+@router.post("/{request_id}/approve", response_model=LeaveRequest,
+             dependencies=[Depends(require_permission(Permission.LEAVE_APPROVE))])
+async def approve_leave_request(
+    request_id: int,
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    db: Session = Depends(get_db)
+):
+    """Approves a single pending leave request."""
+    return _apply_single_status(db, request_id, LeaveStatus.APPROVED)
+
+
+@router.post("/{request_id}/reject", response_model=LeaveRequest,
+             dependencies=[Depends(require_permission(Permission.LEAVE_APPROVE))])
+async def reject_leave_request(
+    request_id: int,
+    current_user: Annotated[UserInDB, Depends(get_current_active_user)],
+    db: Session = Depends(get_db)
+):
+    """Rejects a single pending leave request."""
+    return _apply_single_status(db, request_id, LeaveStatus.REJECTED)
+
 # TODO: Add endpoint for deleting requests (DELETE /leave/{request_id}) - requires admin?
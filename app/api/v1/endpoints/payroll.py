@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from app.core.payroll import run_payroll
+from app.core.security import require_permission
+from app.core.permissions import Permission
+from app.crud import crud_payroll
+from app.db.session import get_db
+from app.schemas.payroll import PayrollRun, PayrollRunCreate, Payslip
+
+router = APIRouter(
+    prefix="/payroll",
+    tags=["payroll"],
+    dependencies=[Depends(require_permission(Permission.PAYROLL_MANAGE))],
+)
+
+
+@router.post("/runs", response_model=PayrollRun, status_code=status.HTTP_201_CREATED)
+def create_payroll_run(run_in: PayrollRunCreate, db: Session = Depends(get_db)):
+    """Computes payslips for every employee for the period (one run per period)."""
+    if crud_payroll.get_payroll_run_by_period(db, run_in.period_start, run_in.period_end):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A payroll run for this period already exists")
+    try:
+        return run_payroll(db, run_in.period_start, run_in.period_end)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+
+@router.get("/runs", response_model=List[PayrollRun])
+def read_payroll_runs(skip: int = 0, limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    return crud_payroll.get_payroll_runs(db, skip=skip, limit=limit)
+
+
+@router.get("/runs/{run_id}", response_model=PayrollRun)
+def read_payroll_run(run_id: int, db: Session = Depends(get_db)):
+    payroll_run = crud_payroll.get_payroll_run(db, run_id)
+    if payroll_run is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payroll run not found")
+    return payroll_run
+
+
+@router.get("/runs/{run_id}/payslips", response_model=List[Payslip])
+def read_payslips(
+    run_id: int,
+    after_employee_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """Payslips of a run ordered by employee id; pass the last employee_id as `after_employee_id` for the next page."""
+    if crud_payroll.get_payroll_run(db, run_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Payroll run not found")
+    return crud_payroll.get_payslips(db, run_id, after_employee_id=after_employee_id, limit=limit)
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.security import require_role # Added import
+from typing import List, Optional
+from app.core.security import require_permission # Added import
+from app.core.permissions import Permission
 
 from app.db.session import get_db
 from app.crud import crud_position
+from app.schemas.deletion import DeleteResult
 from app.schemas.position import Position, PositionCreate, PositionUpdate
 
 router = APIRouter(
     prefix="/position",
     tags=["position"],
-    dependencies=[Depends(require_role(["system", "admin"]))], # Apply role check to all routes
+    dependencies=[Depends(require_permission(Permission.POSITION_MANAGE))], # Apply permission check to all routes
     responses={404: {"description": "Not found"}},
     )
 
@@ -33,6 +35,12 @@ def read_position(position_id: int, db: Session = Depends(get_db)):
 def update_position(position_id: int, position: PositionUpdate, db: Session = Depends(get_db)):
     return crud_position.update_position(db, position_id, position)
 
-@router.delete("/{position_id}", response_model=Position)
-def delete_position(position_id: int, db: Session = Depends(get_db)):
-    return crud_position.delete_position(db, position_id)
\ No newline at end of file
+@router.delete("/{position_id}", response_model=DeleteResult)
+def delete_position(position_id: int, reassign_to: Optional[int] = None, db: Session = Depends(get_db)):
+    """Deletes a position, moving its employees to `reassign_to` or clearing their position."""
+    if reassign_to is not None and (reassign_to == position_id or not crud_position.get_position(db, reassign_to)):
+        raise HTTPException(status_code=400, detail="reassign_to must be another existing position")
+    result = crud_position.delete_position(db, position_id, reassign_to=reassign_to)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Position not found")
+    return result
\ No newline at end of file
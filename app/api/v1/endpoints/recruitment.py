@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from app.core.permissions import Permission
+from app.core.recruitment import open_requisitions
+from app.core.security import require_permission
+from app.crud import crud_recruitment
+from app.db.scoping import get_branch_scope
+from app.db.session import get_db
+from app.schemas.recruitment import (
+    Candidate, CandidateStageResult, CandidateStageUpdate, PipelineCounts, PipelineStage,
+    Requisition, RequisitionCreate, RequisitionStatus, RequisitionUpdate,
+)
+
+router = APIRouter(
+    prefix="/recruitment",
+    tags=["recruitment"],
+    dependencies=[Depends(require_permission(Permission.RECRUITMENT_MANAGE))],
+    responses={404: {"description": "Not found"}},
+)
+
+# --- Requisitions ---
+
+
+@router.post("/requisitions", response_model=Requisition, status_code=status.HTTP_201_CREATED)
+def create_requisition(requisition_in: RequisitionCreate, db: Session = Depends(get_db)):
+    branch_scope = get_branch_scope(db)
+    if branch_scope is not None:
+        # Branch-scoped recruiters can only open requisitions in their own branch
+        if requisition_in.branch_id not in (None, branch_scope):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requisition must be in your branch")
+        requisition_in.branch_id = branch_scope
+    requisition = crud_recruitment.create_requisition(db, requisition_in)
+    open_requisitions.invalidate()
+    return requisition
+
+
+@router.get("/requisitions", response_model=List[Requisition])
+def read_requisitions(
+    status_filter: Optional[RequisitionStatus] = Query(None, alias="status"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    return crud_recruitment.get_requisitions(db, status=status_filter, skip=skip, limit=limit)
+
+
+def _get_requisition(db: Session, requisition_id: int):
+    requisition = crud_recruitment.get_requisition(db, requisition_id)
+    if requisition is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Requisition not found")
+    return requisition
+
+
+@router.get("/requisitions/{requisition_id}", response_model=Requisition)
+def read_requisition(requisition_id: int, db: Session = Depends(get_db)):
+    return _get_requisition(db, requisition_id)
+
+
+@router.patch("/requisitions/{requisition_id}", response_model=Requisition)
+def update_requisition(requisition_id: int, requisition_in: RequisitionUpdate, db: Session = Depends(get_db)):
+    """Edits a requisition; setting status to "closed" stops new applications."""
+    requisition = crud_recruitment.update_requisition(db, _get_requisition(db, requisition_id), requisition_in)
+    open_requisitions.invalidate()
+    return requisition
+
+
+@router.get("/requisitions/{requisition_id}/pipeline", response_model=PipelineCounts)
+def read_pipeline_counts(requisition_id: int, db: Session = Depends(get_db)):
+    """Candidate counts per stage, read from the maintained requisition_stage_counts table."""
+    _get_requisition(db, requisition_id)
+    return crud_recruitment.get_stage_counts(db, requisition_id)
+
+# --- Candidates ---
+
+
+@router.get("/requisitions/{requisition_id}/candidates", response_model=List[Candidate])
+def read_candidates(
+    requisition_id: int,
+    stage: Optional[PipelineStage] = None,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """Candidates ordered by id; pass the last id back as `after_id` for the next page."""
+    _get_requisition(db, requisition_id)
+    return crud_recruitment.get_candidates(db, requisition_id, stage=stage, after_id=after_id, limit=limit)
+
+
+@router.get("/candidates/{candidate_id}", response_model=Candidate)
+def read_candidate(candidate_id: int, db: Session = Depends(get_db)):
+    candidate = crud_recruitment.get_candidate(db, candidate_id)
+    if candidate is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Candidate not found")
+    return candidate
+
+
+@router.post("/candidates/stage", response_model=CandidateStageResult)
+def move_candidates(stage_update: CandidateStageUpdate, db: Session = Depends(get_db)):
+    """Moves one or more candidates to a pipeline stage, keeping the stage counts in step."""
+    return crud_recruitment.move_candidates(db, stage_update.candidate_ids, stage_update.stage)
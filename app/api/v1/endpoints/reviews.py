@@ -0,0 +1,131 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, List, Literal, Optional
+from sqlalchemy.orm import Session
+
+from app.core.permissions import Permission, has_permission
+from app.core.security import require_permission
+from app.crud import crud_employee, crud_review
+from app.db.session import get_db
+from app.schemas.review import (
+    Review, ReviewCycle, ReviewCycleCreate, ReviewCycleStatus, ReviewForm, ReviewFormCreate,
+    ReviewLaunchResult, ReviewScoreSummary, ReviewStatus, ReviewSubmit,
+)
+from app.schemas.user import UserInDB
+
+router = APIRouter(
+    prefix="/reviews",
+    tags=["reviews"],
+    responses={404: {"description": "Not found"}},
+)
+
+# --- Forms and Cycles (admin) ---
+
+
+@router.post("/forms", response_model=ReviewForm, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_permission(Permission.REVIEW_MANAGE))])
+def create_review_form(form_in: ReviewFormCreate, db: Session = Depends(get_db)):
+    return crud_review.create_review_form(db, form_in)
+
+
+@router.get("/forms", response_model=List[ReviewForm],
+            dependencies=[Depends(require_permission(Permission.REVIEW_SUBMIT))])
+def read_review_forms(skip: int = 0, limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    return crud_review.get_review_forms(db, skip=skip, limit=limit)
+
+
+@router.post("/cycles", response_model=ReviewCycle, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_permission(Permission.REVIEW_MANAGE))])
+def create_review_cycle(cycle_in: ReviewCycleCreate, db: Session = Depends(get_db)):
+    if crud_review.get_review_form(db, cycle_in.form_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review form not found")
+    return crud_review.create_review_cycle(db, cycle_in)
+
+
+@router.get("/cycles", response_model=List[ReviewCycle],
+            dependencies=[Depends(require_permission(Permission.REVIEW_SUBMIT))])
+def read_review_cycles(skip: int = 0, limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    return crud_review.get_review_cycles(db, skip=skip, limit=limit)
+
+
+def _get_cycle(db: Session, cycle_id: int):
+    cycle = crud_review.get_review_cycle(db, cycle_id)
+    if cycle is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review cycle not found")
+    return cycle
+
+
+@router.post("/cycles/{cycle_id}/launch", response_model=ReviewLaunchResult,
+             dependencies=[Depends(require_permission(Permission.REVIEW_MANAGE))])
+def launch_review_cycle(cycle_id: int, db: Session = Depends(get_db)):
+    """Creates a review for every eligible employee in one set-based insert (safe to repeat)."""
+    cycle = _get_cycle(db, cycle_id)
+    if cycle.status == ReviewCycleStatus.CLOSED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Review cycle is closed")
+    return ReviewLaunchResult(cycle_id=cycle_id, created=crud_review.launch_review_cycle(db, cycle))
+
+
+@router.post("/cycles/{cycle_id}/close", response_model=ReviewCycle,
+             dependencies=[Depends(require_permission(Permission.REVIEW_MANAGE))])
+def close_review_cycle(cycle_id: int, db: Session = Depends(get_db)):
+    """Ends an open cycle; pending reviews stay pending and scores remain readable."""
+    cycle = _get_cycle(db, cycle_id)
+    if cycle.status != ReviewCycleStatus.OPEN:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Only an open review cycle can be closed")
+    return crud_review.close_review_cycle(db, cycle)
+
+
+@router.get("/cycles/{cycle_id}/scores", response_model=List[ReviewScoreSummary],
+            dependencies=[Depends(require_permission(Permission.REVIEW_MANAGE))])
+def read_review_scores(
+    cycle_id: int,
+    group_by: Literal["department", "branch"] = "department",
+    db: Session = Depends(get_db),
+):
+    """Review counts and score statistics per department or branch, aggregated in SQL."""
+    _get_cycle(db, cycle_id)
+    return crud_review.get_score_summary(db, cycle_id, group_by=group_by)
+
+# --- Reviews (reviewers) ---
+
+
+@router.get("/mine", response_model=List[Review])
+def read_my_reviews(
+    current_user: Annotated[UserInDB, Depends(require_permission(Permission.REVIEW_SUBMIT))],
+    cycle_id: Optional[int] = None,
+    status_filter: Optional[ReviewStatus] = Query(None, alias="status"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """Reviews assigned to the current user as reviewer."""
+    profile = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+    if profile is None:
+        return []
+    return crud_review.get_reviews_for_reviewer(
+        db, profile.id, cycle_id=cycle_id, status=status_filter, skip=skip, limit=limit
+    )
+
+
+@router.put("/{review_id}", response_model=Review)
+def submit_review(
+    review_id: int,
+    review_in: ReviewSubmit,
+    current_user: Annotated[UserInDB, Depends(require_permission(Permission.REVIEW_SUBMIT))],
+    db: Session = Depends(get_db),
+):
+    """Submits (or resubmits, while the cycle is open) the scores of a review assigned to the caller."""
+    review = crud_review.get_review(db, review_id)
+    if review is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+    if not has_permission(current_user, Permission.REVIEW_MANAGE):
+        profile = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+        if profile is None or profile.id != review.reviewer_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not the reviewer of this review")
+    cycle = _get_cycle(db, review.cycle_id)
+    if cycle.status != ReviewCycleStatus.OPEN:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Review cycle is not open")
+    form = crud_review.get_review_form(db, cycle.form_id)
+    try:
+        return crud_review.submit_review(db, review, form, review_in)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
@@ -5,10 +5,11 @@ from sqlmodel import Session
 from app import crud
 from app.schemas.role import RoleRead, RoleCreate
 from app.db.session import get_db  # Correct import for DB session
-from app.core.security import require_role  # Import the role checker dependency
+from app.core.security import require_permission  # Import the permission checker dependency
+from app.core.permissions import Permission
 
 router = APIRouter(
-    dependencies=[Depends(require_role(["system"]))]  # Apply role check to all role endpoints
+    dependencies=[Depends(require_permission(Permission.ROLE_MANAGE))]  # Apply permission check to all role endpoints
 )
 
 
@@ -0,0 +1,154 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, List, Optional
+from sqlalchemy.orm import Session
+
+from app.core.permissions import Permission, has_permission
+from app.core.security import require_permission
+from app.crud import crud_employee, crud_training
+from app.db.scoping import get_branch_scope
+from app.db.session import get_db
+from app.schemas.training import (
+    BulkEnrolmentCreate, BulkEnrolmentResult, Course, CourseCreate, Enrolment, EnrolmentCreate, EnrolmentStatus,
+    TrainingSession, TrainingSessionCreate,
+)
+from app.schemas.user import UserInDB
+
+router = APIRouter(
+    prefix="/training",
+    tags=["training"],
+    responses={404: {"description": "Not found"}},
+)
+
+# --- Catalogue ---
+
+
+@router.post("/courses", response_model=Course, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_permission(Permission.TRAINING_MANAGE))])
+def create_course(course_in: CourseCreate, db: Session = Depends(get_db)):
+    return crud_training.create_course(db, course_in)
+
+
+@router.get("/courses", response_model=List[Course],
+            dependencies=[Depends(require_permission(Permission.TRAINING_ENROL))])
+def read_courses(skip: int = 0, limit: int = Query(100, ge=1, le=1000), db: Session = Depends(get_db)):
+    return crud_training.get_courses(db, skip=skip, limit=limit)
+
+
+@router.post("/sessions", response_model=TrainingSession, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(require_permission(Permission.TRAINING_MANAGE))])
+def create_training_session(session_in: TrainingSessionCreate, db: Session = Depends(get_db)):
+    if crud_training.get_course(db, session_in.course_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
+    return crud_training.create_training_session(db, session_in)
+
+
+@router.get("/sessions", response_model=List[TrainingSession],
+            dependencies=[Depends(require_permission(Permission.TRAINING_ENROL))])
+def read_training_sessions(
+    course_id: Optional[int] = None,
+    starts_after: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    return crud_training.get_training_sessions(db, course_id=course_id, starts_after=starts_after, skip=skip, limit=limit)
+
+
+def _get_session(db: Session, session_id: int):
+    training_session = crud_training.get_training_session(db, session_id)
+    if training_session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Training session not found")
+    return training_session
+
+
+@router.get("/sessions/{session_id}", response_model=TrainingSession,
+            dependencies=[Depends(require_permission(Permission.TRAINING_ENROL))])
+def read_training_session(session_id: int, db: Session = Depends(get_db)):
+    return _get_session(db, session_id)
+
+# --- Enrolment ---
+
+
+def _get_own_employee_id(db: Session, current_user: UserInDB) -> int:
+    employee = crud_employee.get_employee_by_user_id(db, user_id=current_user.id)
+    if employee is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No employee profile linked to this user")
+    return employee.id
+
+
+@router.post("/sessions/{session_id}/enrolments", response_model=Enrolment, status_code=status.HTTP_201_CREATED)
+def enrol(
+    session_id: int,
+    enrolment_in: EnrolmentCreate,
+    current_user: Annotated[UserInDB, Depends(require_permission(Permission.TRAINING_ENROL))],
+    db: Session = Depends(get_db),
+):
+    """
+    Books a seat, or a waitlist place once the session is full (check `status` in the response).
+    Enrolling someone else requires TRAINING_MANAGE.
+    """
+    training_session = _get_session(db, session_id)
+    if training_session.starts_at <= datetime.now(timezone.utc):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Training session has already started")
+    if enrolment_in.employee_id is None:
+        employee_id = _get_own_employee_id(db, current_user)
+    else:
+        if not has_permission(current_user, Permission.TRAINING_MANAGE):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to enrol other employees")
+        if crud_employee.get_employee(db, employee_id=enrolment_in.employee_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
+        employee_id = enrolment_in.employee_id
+    enrolment = crud_training.enrol(db, session_id, employee_id)
+    if enrolment is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Already enrolled or waitlisted")
+    return enrolment
+
+
+@router.post("/sessions/{session_id}/enrolments/bulk", response_model=BulkEnrolmentResult,
+             dependencies=[Depends(require_permission(Permission.TRAINING_MANAGE))])
+def bulk_enrol(session_id: int, bulk_in: BulkEnrolmentCreate, db: Session = Depends(get_db)):
+    """Enrols every employee of a department: seats in employee order, the rest waitlisted."""
+    _get_session(db, session_id)
+    return crud_training.bulk_enrol_department(
+        db, session_id, bulk_in.department_id, branch_id=get_branch_scope(db)
+    )
+
+
+@router.get("/sessions/{session_id}/enrolments", response_model=List[Enrolment],
+            dependencies=[Depends(require_permission(Permission.TRAINING_MANAGE))])
+def read_enrolments(
+    session_id: int,
+    status_filter: Optional[EnrolmentStatus] = Query(None, alias="status"),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """Enrolments in booking order; with status=waitlisted this is the waitlist."""
+    _get_session(db, session_id)
+    return crud_training.get_enrolments(db, session_id, status=status_filter, skip=skip, limit=limit)
+
+
+@router.get("/enrolments/me", response_model=List[Enrolment])
+def read_my_enrolments(
+    current_user: Annotated[UserInDB, Depends(require_permission(Permission.TRAINING_ENROL))],
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    return crud_training.get_enrolments_by_employee(db, _get_own_employee_id(db, current_user), skip=skip, limit=limit)
+
+
+@router.delete("/enrolments/{enrolment_id}", response_model=Enrolment)
+def cancel_enrolment(
+    enrolment_id: int,
+    current_user: Annotated[UserInDB, Depends(require_permission(Permission.TRAINING_ENROL))],
+    db: Session = Depends(get_db),
+):
+    """Cancels an enrolment (own, or anyone's with TRAINING_MANAGE); the seat goes to the waitlist."""
+    enrolment = crud_training.get_enrolment(db, enrolment_id)
+    if enrolment is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Enrolment not found")
+    if not has_permission(current_user, Permission.TRAINING_MANAGE) and enrolment.employee_id != _get_own_employee_id(db, current_user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to cancel this enrolment")
+    return crud_training.cancel_enrolment(db, enrolment)
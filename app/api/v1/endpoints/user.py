@@ -6,10 +6,11 @@ from app import crud
 from app.schemas.user import UserBase, UserCreate, UserUpdate  # Import UserUpdate schema
 from app.db.models.user import User  # Import the DB model for response_model if needed, or use schema
 from app.db.session import get_db  # Dependency for DB session
-from app.core.security import require_role  # Import the role checker dependency
+from app.core.security import require_permission  # Import the permission checker dependency
+from app.core.permissions import Permission
 
 router = APIRouter(
-    dependencies=[Depends(require_role(["system"]))]  # Apply role check to all user endpoints
+    dependencies=[Depends(require_permission(Permission.USER_MANAGE))]  # Apply permission check to all user endpoints
 )
 
 # system
@@ -24,7 +25,7 @@ def create_user_endpoint(
     """
     Create new user.
     """
-    user = crud.user.get_user_by_username(db, username=user_in.username)
+    user = crud.user.get_user_by_username(db, username=user_in.username, include_archived=True)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,13 +45,14 @@ def read_users_endpoint(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    include_archived: bool = False,
 ):
     """
-    Retrieve users.
+    Retrieve users (deleted users only with include_archived).
     """
     # Filter users by the "system" role
     # users = crud.user.get_users(db, skip=skip, limit=limit, role_name="system")
-    users = crud.user.get_users(db, skip=skip, limit=limit)
+    users = crud.user.get_users(db, skip=skip, limit=limit, include_archived=include_archived)
     return users
 
 
@@ -0,0 +1,132 @@
+"""
+Audit capture for salary, role and leave-status changes.
+
+Changes are collected from SQLAlchemy session events while a transaction flushes, handed to an
+in-memory buffer only when that transaction commits, and written to the monthly-partitioned
+`audit_log` table in multi-row batches by a background thread. Request latency only pays for
+appending a few dicts to a list.
+"""
+import logging
+from contextvars import ContextVar
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import event, inspect, insert
+from sqlalchemy.orm import Session
+
+from app.core.batching import BatchWriter
+from app.core.config import settings
+from app.db.models.audit import AuditLog
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest
+from app.db.models.user_role_link import UserRoleLink
+from app.db.partitioning import RangePartitions
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Set by the authentication dependency so entries record who made the change
+current_actor_id: ContextVar[Optional[int]] = ContextVar("current_actor_id", default=None)
+
+_PENDING_KEY = "audit_pending"
+
+
+def _json_value(value: Any) -> Any:
+    """Converts enum/date values into JSON-friendly primitives."""
+    if hasattr(value, "value"):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def make_entry(entity_type: str, entity_id: int, field: str, old_value: Any, new_value: Any) -> Dict[str, Any]:
+    return {
+        "occurred_at": datetime.now(timezone.utc),
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "field": field,
+        "old_value": _json_value(old_value),
+        "new_value": _json_value(new_value),
+        "actor_user_id": current_actor_id.get(),
+    }
+
+
+def stage(db: Session, entries: Iterable[Dict[str, Any]]) -> None:
+    """
+    Attaches entries to the session's current transaction.
+    Use this for bulk UPDATE statements, which bypass the flush events below.
+    """
+    db.info.setdefault(_PENDING_KEY, []).extend(entries)
+
+
+# --- Session Events ---
+def _attribute_change(obj: Any, attribute: str):
+    history = inspect(obj).attrs[attribute].history
+    if not history.has_changes():
+        return None
+    old_value = history.deleted[0] if history.deleted else None
+    new_value = history.added[0] if history.added else None
+    return old_value, new_value
+
+
+@event.listens_for(Session, "after_flush")
+def _capture_changes(session: Session, flush_context) -> None:
+    # Attribute history and the new/dirty/deleted collections still reflect the flush here,
+    # and newly inserted rows already have their primary keys.
+    entries: List[Dict[str, Any]] = []
+    for obj in session.new:
+        if isinstance(obj, Employee) and obj.salary is not None:
+            entries.append(make_entry("employee", obj.id, "salary", None, obj.salary))
+        elif isinstance(obj, UserRoleLink):
+            entries.append(make_entry("user", obj.user_id, "role_added", None, obj.role_id))
+    for obj in session.dirty:
+        if isinstance(obj, Employee):
+            change = _attribute_change(obj, "salary")
+            if change:
+                entries.append(make_entry("employee", obj.id, "salary", *change))
+        elif isinstance(obj, LeaveRequest):
+            change = _attribute_change(obj, "status")
+            if change:
+                entries.append(make_entry("leave_request", obj.id, "status", *change))
+    for obj in session.deleted:
+        if isinstance(obj, UserRoleLink):
+            entries.append(make_entry("user", obj.user_id, "role_removed", obj.role_id, None))
+    if entries:
+        stage(session, entries)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    entries = session.info.pop(_PENDING_KEY, None)
+    if entries:
+        audit_writer.extend(entries)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# --- Partition Management ---
+audit_partitions = RangePartitions("audit_log", "month")
+
+
+def ensure_audit_partitions(conn, months: Iterable[date]) -> None:
+    """Creates the monthly partitions (and the default catch-all) for the given months if missing."""
+    audit_partitions.ensure(conn, months)
+
+
+def _write_batch(entries: List[Dict[str, Any]]) -> None:
+    with engine.begin() as conn:
+        ensure_audit_partitions(conn, (entry["occurred_at"].date() for entry in entries))
+        conn.execute(insert(AuditLog.__table__), entries)
+
+
+audit_writer = BatchWriter(
+    "audit",
+    _write_batch,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    max_buffer=settings.AUDIT_MAX_BUFFER,
+)
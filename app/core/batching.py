@@ -0,0 +1,162 @@
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BufferFull(Exception):
+    """Raised by a writer created with `reject_when_full` when `max_buffer` items are already waiting."""
+
+
+class BatchWriter:
+    """
+    Buffers items in memory and hands them to `write_batch` in chunks from a background thread.
+
+    A batch is written when `batch_size` items are waiting or every `flush_interval` seconds,
+    whichever comes first. If the buffer reaches `max_buffer` the producer flushes inline,
+    which applies backpressure instead of dropping data; with `reject_when_full` it raises
+    BufferFull instead, for producers (such as public request handlers) that must not wait on
+    the database. Failed batches are put back at the front of the buffer and retried on the next
+    cycle.
+
+    A batch that fails `max_attempts` times in a row is split in halves, recursively, so the good
+    items are written and the items that fail on their own are parked in `parked` (the oldest
+    are dropped beyond `max_parked`) and logged, rather than blocking everything queued behind
+    them. If no part of the batch can be written at all the cause is assumed to be the database,
+    not the data, and the whole batch is retried as before.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_batch: Callable[[List[Any]], None],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 50_000,
+        max_attempts: int = 3,
+        max_parked: int = 1_000,
+        reject_when_full: bool = False,
+    ):
+        self.name = name
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_attempts = max_attempts
+        self.reject_when_full = reject_when_full
+        self.written = 0
+        self.failed_batches = 0
+        self.parked: Deque[Any] = deque(maxlen=max_parked) # Items that failed on their own
+        self._attempts = 0 # Consecutive failures of the batch at the head of the buffer
+        self._buffer: Deque[Any] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Serializes writers so batches stay in order
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    # --- Producer API ---
+    def add(self, item: Any) -> None:
+        self.extend((item,))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        with self._lock:
+            full = self.reject_when_full and len(self._buffer) >= self.max_buffer
+            if not full:
+                self._buffer.extend(items)
+            size = len(self._buffer)
+        if full:
+            self._wakeup.set()
+            raise BufferFull(f"{self.name}: {size} items waiting")
+        if size >= self.max_buffer and not self.reject_when_full:
+            self.flush()  # Backpressure: the producer pays for the write
+        elif size >= self.batch_size:
+            self._wakeup.set()
+
+    # --- Flushing ---
+    def flush(self) -> int:
+        """Writes everything currently buffered. Returns the number of items written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                if not batch:
+                    break
+                try:
+                    self.write_batch(batch)
+                except Exception:
+                    self.failed_batches += 1
+                    self._attempts += 1
+                    if self._attempts < self.max_attempts:
+                        logger.exception("%s: failed to write batch of %s items; will retry", self.name, len(batch))
+                        self._requeue(batch)
+                        break
+                    logger.exception(
+                        "%s: batch of %s items failed %s times; isolating the failing items",
+                        self.name, len(batch), self._attempts,
+                    )
+                    failing: List[Any] = []
+                    batch_written = self._write_isolating(batch, failing)
+                    if not batch_written:
+                        # Nothing at all could be written: the database is failing, not the data
+                        self._requeue(batch)
+                        break
+                    self._park(failing)
+                    written += batch_written
+                else:
+                    written += len(batch)
+                self._attempts = 0
+        self.written += written
+        return written
+
+    def _requeue(self, batch: List[Any]) -> None:
+        with self._lock:
+            self._buffer.extendleft(reversed(batch))
+
+    def _write_isolating(self, items: List[Any], failing: List[Any]) -> int:
+        """Writes `items` in ever smaller halves; collects those that fail alone. Returns items written."""
+        try:
+            self.write_batch(items)
+            return len(items)
+        except Exception:
+            if len(items) == 1:
+                failing.append(items[0])
+                return 0
+        middle = len(items) // 2
+        return self._write_isolating(items[:middle], failing) + self._write_isolating(items[middle:], failing)
+
+    def _park(self, items: List[Any]) -> None:
+        for item in items:
+            if len(self.parked) == self.parked.maxlen:
+                logger.error("%s: parked items full; dropping %r", self.name, self.parked[0])
+            logger.error("%s: parking an item that cannot be written: %r", self.name, item)
+            self.parked.append(item)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    # --- Lifecycle ---
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread and writes whatever is left in the buffer."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
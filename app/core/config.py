@@ -14,6 +14,20 @@ class Settings(BaseSettings):
     # Security Settings
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Token signing: HS256 uses SECRET_KEY; RS*/ES* use the key files in JWT_KEYS_DIR (see app/core/jwt_keys.py)
+    JWT_ALGORITHM: str = "HS256"
+    JWT_KEYS_DIR: str = "keys"
+    JWT_ACTIVE_KID: Optional[str] = None # Defaults to the newest private key
+    JWT_KEYS_RELOAD_SECONDS: float = 30.0 # Min interval between key-directory reloads triggered by an unknown kid
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+
+    # Password hashing: the first scheme hashes new passwords, older hashes are upgraded on login
+    # Pick costs with `python -m benchmarks.password_hashing` on the production hardware
+    PASSWORD_HASH_SCHEMES: List[str] = ["bcrypt"] # e.g. ["argon2", "bcrypt"]
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536 # KiB
+    ARGON2_PARALLELISM: int = 4
     # BACKEND_CORS_ORIGINS is a list of strings, Pydantic can parse it
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
@@ -28,6 +42,7 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+    POSTGRES_DRIVER: str = "psycopg2" # "psycopg" (psycopg 3) enables server-side prepared statements
     # Construct database URL (adjust if using a different DB)
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
 
@@ -38,10 +53,67 @@ class Settings(BaseSettings):
             return v
         # Access other values via info.data
         return (
-            f"postgresql+psycopg2://{info.data.get('POSTGRES_USER')}:{info.data.get('POSTGRES_PASSWORD')}"
+            f"postgresql+{info.data.get('POSTGRES_DRIVER')}://{info.data.get('POSTGRES_USER')}:{info.data.get('POSTGRES_PASSWORD')}"
             f"@{info.data.get('POSTGRES_SERVER')}:{info.data.get('POSTGRES_PORT')}/{info.data.get('POSTGRES_DB')}"
         )
 
+    # Reference-data cache (branches, departments, positions, roles)
+    # Set a channel name to broadcast invalidations to other workers via Postgres LISTEN/NOTIFY
+    REFERENCE_CACHE_NOTIFY_CHANNEL: Optional[str] = None
+
+    # Background job queue (Postgres table claimed with SKIP LOCKED)
+    JOB_WORKER_IN_PROCESS: bool = False # Run a worker inside each API process
+    JOB_WORKER_CONCURRENCY: int = 4 # Max handlers running at once per worker
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: float = 5.0 # Doubled on every failed attempt
+    JOB_LOCK_TIMEOUT_SECONDS: int = 300 # Running jobs older than this are assumed orphaned
+
+    # Audit log (buffered in memory, written in batches by a background thread)
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_MAX_BUFFER: int = 50_000 # Producers flush inline beyond this (backpressure)
+
+    # Login rate limiting (token buckets: burst size and refill rate; the username buckets are per username and IP)
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 10
+    LOGIN_RATE_LIMIT_USERNAME_BURST: int = 5
+    LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE: float = 2
+    RATE_LIMIT_MAX_KEYS: int = 100_000 # Per limiter; least recently seen keys are evicted
+    RATE_LIMIT_REDIS_URL: Optional[str] = None # Share buckets across workers (requires `redis`)
+
+    # Optional declarative partitioning of leave_requests (applied by `python -m app.db.partitioning migrate`)
+    LEAVE_PARTITION_STRATEGY: Optional[str] = None # None, "start_date" (yearly ranges) or "branch_id" (hash)
+    LEAVE_PARTITION_HASH_MODULUS: int = 16 # Number of hash partitions for the "branch_id" strategy
+    LEAVE_PARTITION_YEARS_AHEAD: int = 1 # Yearly partitions created ahead of time for "start_date"
+
+    # Schema migrations (python -m app.db.migrations)
+    MIGRATION_LOCK_TIMEOUT_SECONDS: float = 5.0 # Fail a DDL step rather than queue behind long transactions
+    MIGRATION_BACKFILL_BATCH_SIZE: int = 5_000 # Rows updated per backfill transaction
+
+    # Payroll runs
+    PAYROLL_SALARY_PERIODS_PER_YEAR: int = 12 # Employee.salary is annual; one run pays salary / this (12, 24, 26 or 52)
+    PAYROLL_INSERT_BATCH_SIZE: int = 10_000 # Payslip rows per multi-row INSERT
+
+    # Recruitment (careers-page applications are queued and inserted in batches)
+    RECRUITMENT_BATCH_SIZE: int = 500 # Applications per multi-row INSERT
+    RECRUITMENT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    RECRUITMENT_MAX_BUFFER: int = 20_000 # Submissions get 503 beyond this
+    RECRUITMENT_OPEN_CACHE_SECONDS: float = 30.0 # How long the open-requisition list is reused
+    CAREERS_APPLY_RATE_LIMIT_IP_BURST: int = 5
+    CAREERS_APPLY_RATE_LIMIT_IP_PER_MINUTE: float = 5
+
+    # Archive tier (python -m app.db.archive)
+    ARCHIVE_LEAVE_AFTER_YEARS: int = 3 # Closed leave, and leave of employees archived, longer ago than this
+    ARCHIVE_BATCH_SIZE: int = 5_000 # Rows moved per transaction
+
+    # Startup pipeline (app.core.startup)
+    STARTUP_WARM_CONNECTIONS: int = 2 # Pooled connections opened before the worker reports ready (<= pool size)
+
+    # Prepared statements (psycopg 3 only; see app.db.statements)
+    DB_PREPARED_STATEMENTS: bool = True # Disable behind PgBouncer in transaction pooling mode
+    DB_PREPARE_THRESHOLD: int = 2 # Executions of a query on one connection before the server prepares it
+
     # Configure Pydantic BaseSettings
     model_config = SettingsConfigDict(
         case_sensitive=True, # Environment variables are typically case-sensitive
@@ -1,12 +1,54 @@
+from typing import List, Optional, Tuple
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 # --- Password Hashing ---
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def build_context(
+    schemes: List[str],
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 4,
+) -> CryptContext:
+    """
+    Builds a CryptContext. The first scheme hashes new passwords; hashes made with any other
+    scheme, with fewer bcrypt rounds, a lower argon2 time cost or a different argon2 memory cost
+    still verify but are flagged for rehashing. (passlib only compares rounds against min_rounds,
+    so the configured costs are also the minimums; argon2 parallelism is not compared.)
+    """
+    options = {}
+    if "bcrypt" in schemes:
+        options.update(bcrypt__rounds=bcrypt_rounds, bcrypt__min_rounds=bcrypt_rounds)
+    if "argon2" in schemes:
+        options.update(
+            argon2__time_cost=argon2_time_cost,
+            argon2__min_rounds=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+pwd_context = build_context(
+    settings.PASSWORD_HASH_SCHEMES,
+    bcrypt_rounds=settings.BCRYPT_ROUNDS,
+    argon2_time_cost=settings.ARGON2_TIME_COST,
+    argon2_memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2_parallelism=settings.ARGON2_PARALLELISM,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed password."""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verifies a password and, if the stored hash uses an outdated scheme or a cost below the
+    current settings (see build_context), returns a replacement hash made with them (otherwise None).
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     """Hashes a plain password."""
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
@@ -0,0 +1,35 @@
+"""
+Default handlers for side effects enqueued by the CRUD write paths.
+
+Handlers receive the job payload (a JSON dict) and must be idempotent: a job can run more than
+once if a worker dies between finishing the handler and recording success.
+"""
+import logging
+
+from app.core.jobs import job_handler
+
+logger = logging.getLogger(__name__)
+
+
+@job_handler("employee.created")
+def handle_employee_created(payload: dict) -> None:
+    """Hook for onboarding notifications and rollups for a new employee."""
+    logger.info("Employee %s created", payload.get("employee_id"))
+
+
+@job_handler("leave.submitted")
+def handle_leave_submitted(payload: dict) -> None:
+    """Hook for notifying approvers about a new leave request."""
+    logger.info("Leave request %s submitted by employee %s", payload.get("request_id"), payload.get("employee_id"))
+
+
+@job_handler("leave.status_changed")
+def handle_leave_status_changed(payload: dict) -> None:
+    """Hook for notifying employees about approved/rejected requests (one job per batch)."""
+    logger.info("Leave requests %s moved to %s", payload.get("request_ids"), payload.get("status"))
+
+
+@job_handler("review.cycle_launched")
+def handle_review_cycle_launched(payload: dict) -> None:
+    """Hook for notifying reviewers that a review cycle has started."""
+    logger.info("Review cycle %s launched with %s new reviews", payload.get("cycle_id"), payload.get("created"))
@@ -0,0 +1,261 @@
+"""
+In-process background job queue backed by the `jobs` table.
+
+Write paths call `enqueue` inside their own transaction, so a job exists if and only if the
+write committed. Workers claim runnable rows with `FOR UPDATE SKIP LOCKED`, which lets any
+number of worker processes share the table without an outside broker.
+
+Run a standalone worker with:
+    python -m app.core.jobs
+"""
+import asyncio
+import inspect
+import logging
+import signal
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models.job import Job
+from app.db.session import SessionLocal
+from app.schemas.job import JobMetrics, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# --- Handler Registry ---
+_handlers: Dict[str, Callable[[dict], Any]] = {}
+
+
+def job_handler(name: str):
+    """Decorator registering a (sync or async) function as the handler for a job name."""
+    def decorator(func: Callable[[dict], Any]) -> Callable[[dict], Any]:
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+# --- Producer API ---
+def enqueue(db: Session, name: str, payload: Optional[dict] = None, delay_seconds: float = 0) -> Job:
+    """
+    Adds a job to the caller's session without committing.
+    The job becomes visible to workers when the caller's transaction commits.
+    """
+    job = Job(
+        name=name,
+        payload=payload or {},
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        run_after=datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+    )
+    db.add(job)
+    return job
+
+
+# --- Queue Operations (each runs in its own short transaction) ---
+@dataclass
+class ClaimedJob:
+    id: int
+    name: str
+    payload: dict
+    attempts: int
+    max_attempts: int
+
+
+def claim_jobs(limit: int) -> List[ClaimedJob]:
+    """Claims up to `limit` runnable jobs, skipping rows locked by other workers."""
+    now = datetime.now(timezone.utc)
+    runnable = (
+        select(Job.id)
+        .where(Job.status == JobStatus.QUEUED, Job.run_after <= now)
+        .order_by(Job.run_after, Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    statement = (
+        update(Job)
+        .where(Job.id.in_(runnable))
+        .values(status=JobStatus.RUNNING, locked_at=now, attempts=Job.attempts + 1)
+        .returning(Job.id, Job.name, Job.payload, Job.attempts, Job.max_attempts)
+        .execution_options(synchronize_session=False)
+    )
+    with SessionLocal() as db:
+        rows = db.execute(statement).all()
+        db.commit()
+    return [ClaimedJob(*row) for row in rows]
+
+
+def mark_succeeded(job_id: int) -> None:
+    """Finished jobs are deleted so the table only holds pending and dead work."""
+    with SessionLocal() as db:
+        db.execute(delete(Job).where(Job.id == job_id))
+        db.commit()
+
+
+def mark_failed(job: ClaimedJob, error: str) -> bool:
+    """Schedules a retry with exponential backoff, or dead-letters the job. Returns True if retried."""
+    retry = job.attempts < job.max_attempts
+    values: Dict[str, Any] = {"last_error": error[:2000], "locked_at": None}
+    if retry:
+        backoff = min(settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1), 3600)
+        values.update(status=JobStatus.QUEUED, run_after=datetime.now(timezone.utc) + timedelta(seconds=backoff))
+    else:
+        values.update(status=JobStatus.FAILED)
+    with SessionLocal() as db:
+        db.execute(update(Job).where(Job.id == job.id).values(**values))
+        db.commit()
+    return retry
+
+
+def requeue_stale_jobs() -> int:
+    """Returns jobs whose worker died mid-run (lock older than JOB_LOCK_TIMEOUT_SECONDS) to the queue."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+    with SessionLocal() as db:
+        result = db.execute(
+            update(Job)
+            .where(Job.status == JobStatus.RUNNING, Job.locked_at < cutoff)
+            .values(status=JobStatus.QUEUED, locked_at=None)
+        )
+        db.commit()
+    return result.rowcount
+
+
+def queue_depth() -> Dict[str, int]:
+    """Counts rows per status in the jobs table."""
+    with SessionLocal() as db:
+        rows = db.execute(select(Job.status, func.count()).group_by(Job.status)).all()
+    return {status.value: count for status, count in rows}
+
+
+# --- Worker ---
+@dataclass
+class WorkerMetrics:
+    claimed: int = 0
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    handler_seconds: float = 0.0
+    in_flight: int = 0
+    by_job: Dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> JobMetrics:
+        return JobMetrics(
+            claimed=self.claimed, succeeded=self.succeeded, retried=self.retried,
+            failed=self.failed, in_flight=self.in_flight, handler_seconds=round(self.handler_seconds, 3),
+        )
+
+
+class JobWorker:
+    """Async worker loop with a hard limit on concurrently running handlers."""
+
+    def __init__(self, concurrency: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.JOB_POLL_INTERVAL_SECONDS
+        self.metrics = WorkerMetrics()
+        self._running: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        # Importing the handler module registers the default handlers
+        import app.core.job_handlers  # noqa: F401
+
+        logger.info("Job worker started (concurrency=%s)", self.concurrency)
+        last_stale_check = 0.0
+        while not self._stopping.is_set():
+            if time.monotonic() - last_stale_check > settings.JOB_LOCK_TIMEOUT_SECONDS:
+                await asyncio.to_thread(requeue_stale_jobs)
+                last_stale_check = time.monotonic()
+
+            free_slots = self.concurrency - len(self._running)
+            claimed: List[ClaimedJob] = []
+            if free_slots > 0:
+                try:
+                    claimed = await asyncio.to_thread(claim_jobs, free_slots)
+                except Exception:
+                    logger.exception("Failed to claim jobs")
+            for job in claimed:
+                self.metrics.claimed += 1
+                task = asyncio.create_task(self._execute(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            self.metrics.in_flight = len(self._running)
+
+            if claimed and len(self._running) < self.concurrency:
+                continue  # More work may be waiting; claim again straight away
+            waiters = [asyncio.create_task(self._stopping.wait())]
+            if self._running:
+                waiters.append(asyncio.create_task(asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)))
+            done, pending = await asyncio.wait(waiters, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+            for waiter in pending:
+                waiter.cancel()
+
+        if self._running:
+            await asyncio.wait(self._running)
+        logger.info("Job worker stopped: %s", self.metrics.snapshot().model_dump())
+
+    async def _execute(self, job: ClaimedJob) -> None:
+        started = time.perf_counter()
+        handler = _handlers.get(job.name)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job '{job.name}'")
+            if inspect.iscoroutinefunction(handler):
+                await handler(job.payload)
+            else:
+                await asyncio.to_thread(handler, job.payload)
+        except Exception as exc:
+            logger.warning("Job %s (%s) failed on attempt %s: %s", job.id, job.name, job.attempts, exc)
+            retried = await asyncio.to_thread(mark_failed, job, repr(exc))
+            if retried:
+                self.metrics.retried += 1
+            else:
+                self.metrics.failed += 1
+        else:
+            await asyncio.to_thread(mark_succeeded, job.id)
+            self.metrics.succeeded += 1
+            self.metrics.by_job[job.name] = self.metrics.by_job.get(job.name, 0) + 1
+        finally:
+            self.metrics.handler_seconds += time.perf_counter() - started
+
+
+# Worker running inside the API process (only started when JOB_WORKER_IN_PROCESS is enabled)
+worker = JobWorker()
+_worker_task: Optional[asyncio.Task] = None
+
+
+async def start_in_process_worker() -> None:
+    global _worker_task
+    if settings.JOB_WORKER_IN_PROCESS and _worker_task is None:
+        _worker_task = asyncio.create_task(worker.run())
+
+
+async def stop_in_process_worker() -> None:
+    global _worker_task
+    if _worker_task is not None:
+        worker.stop()
+        await _worker_task
+        _worker_task = None
+
+
+async def _main() -> None:
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # e.g. Windows
+            pass
+    await worker.run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # Run through the importable module so handlers register into the same registry
+    from app.core import jobs
+    asyncio.run(jobs._main())
@@ -0,0 +1,179 @@
+"""
+Signing and verification keys for access tokens.
+
+With an HS* algorithm the shared SECRET_KEY is used, as before. With RS*/ES* every key in
+JWT_KEYS_DIR is loaded once and kept parsed in memory:
+
+- `<kid>.pem`     private key; can sign, and its public half is published
+- `<kid>.pub.pem` public key of a retired signing key; still accepted until tokens expire
+
+Tokens carry the signing key's `kid` header, and the public keys are published at
+/.well-known/jwks.json, so other services can validate tokens locally. A token signed with a
+kid this worker has not seen (another worker already picked up a rotated key) makes it re-read
+the directory, at most once every JWT_KEYS_RELOAD_SECONDS, before the token is rejected.
+
+Rotate keys with:
+    python -m app.core.jwt_keys generate   # new key becomes active (newest kid wins)
+    python -m app.core.jwt_keys retire <kid>
+"""
+import argparse
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError, jwk, jwt
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_EC_CURVES = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    return algorithm.startswith(("RS", "ES"))
+
+
+class KeyRing:
+    def __init__(
+        self, algorithm: str, keys_dir: str, active_kid: Optional[str], secret: str, reload_interval: float = 30.0,
+    ):
+        self.algorithm = algorithm
+        self.keys_dir = Path(keys_dir)
+        self.requested_kid = active_kid
+        self.secret = secret
+        self.active_kid: Optional[str] = None
+        self._signing_key: Optional[bytes] = None
+        self._verification_keys: Dict[str, Any] = {}  # kid -> parsed jose Key
+        self._jwks: List[dict] = []
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.reload_interval = reload_interval
+        self._loaded_at = 0.0
+
+    # --- Loading ---
+    def load(self) -> None:
+        """(Re)reads the key directory; call again after rotating keys to pick them up without a restart."""
+        with self._lock:
+            verification_keys: Dict[str, Any] = {}
+            jwks: List[dict] = []
+            private_keys: Dict[str, bytes] = {}
+            if is_asymmetric(self.algorithm):
+                for path in sorted(self.keys_dir.glob("*.pem")):
+                    if path.name.endswith(".pub.pem"):
+                        kid = path.name[: -len(".pub.pem")]
+                        public_pem = path.read_bytes()
+                    else:
+                        kid = path.stem
+                        private_pem = path.read_bytes()
+                        private_keys[kid] = private_pem
+                        private_key = serialization.load_pem_private_key(private_pem, password=None)
+                        public_pem = private_key.public_key().public_bytes(
+                            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+                        )
+                    key = jwk.construct(public_pem, self.algorithm)
+                    verification_keys[kid] = key
+                    jwks.append({**key.to_dict(), "kid": kid, "use": "sig"})
+                if not private_keys:
+                    raise RuntimeError(
+                        f"JWT_ALGORITHM={self.algorithm} but no private keys in '{self.keys_dir}'. "
+                        "Create one with: python -m app.core.jwt_keys generate"
+                    )
+                active_kid = self.requested_kid or max(private_keys)  # Newest kid sorts last
+                if active_kid not in private_keys:
+                    raise RuntimeError(f"JWT_ACTIVE_KID '{active_kid}' has no private key in '{self.keys_dir}'")
+                self.active_kid = active_kid
+                self._signing_key = private_keys[active_kid]
+            self._verification_keys = verification_keys
+            self._jwks = jwks
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    # --- Token Operations ---
+    def sign(self, claims: dict) -> str:
+        self._ensure_loaded()
+        if not is_asymmetric(self.algorithm):
+            return jwt.encode(claims, self.secret, algorithm=self.algorithm)
+        return jwt.encode(claims, self._signing_key, algorithm=self.algorithm, headers={"kid": self.active_kid})
+
+    def decode(self, token: str) -> dict:
+        """Verifies a token with the key named by its `kid` header. Raises JWTError if invalid."""
+        self._ensure_loaded()
+        if not is_asymmetric(self.algorithm):
+            return jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._verification_keys.get(kid)
+        if key is None and time.monotonic() - self._loaded_at >= self.reload_interval:
+            # Possibly a key generated after this worker started; unknown kids cannot force more reloads
+            try:
+                self.load()
+            except Exception:  # e.g. a key file still being written; keep the keys already loaded
+                logger.exception("Reloading JWT keys from %s failed", self.keys_dir)
+                self._loaded_at = time.monotonic()
+            key = self._verification_keys.get(kid)
+        if key is None:
+            raise JWTError("Unknown signing key")
+        return jwt.decode(token, key, algorithms=[self.algorithm])
+
+    def jwks(self) -> dict:
+        self._ensure_loaded()
+        return {"keys": list(self._jwks)}
+
+
+key_ring = KeyRing(
+    settings.JWT_ALGORITHM, settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID, settings.SECRET_KEY,
+    reload_interval=settings.JWT_KEYS_RELOAD_SECONDS,
+)
+
+
+# --- Key Management CLI ---
+def generate_key(algorithm: str, keys_dir: Path) -> Path:
+    if algorithm in _EC_CURVES:
+        private_key = ec.generate_private_key(_EC_CURVES[algorithm]())
+    elif algorithm.startswith("RS"):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=3072)
+    else:
+        raise SystemExit(f"Cannot generate keys for {algorithm}; use RS256/RS384/RS512 or ES256/ES384/ES512")
+    keys_dir.mkdir(parents=True, exist_ok=True)
+    kid = datetime.now(timezone.utc).strftime("k%Y%m%d%H%M%S")
+    path = keys_dir / f"{kid}.pem"
+    path.write_bytes(private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    path.chmod(0o600)
+    return path
+
+
+def retire_key(kid: str, keys_dir: Path) -> Path:
+    """Replaces a private key with its public half: it stops signing but still verifies."""
+    private_path = keys_dir / f"{kid}.pem"
+    private_key = serialization.load_pem_private_key(private_path.read_bytes(), password=None)
+    public_path = keys_dir / f"{kid}.pub.pem"
+    public_path.write_bytes(private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ))
+    private_path.unlink()
+    return public_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage JWT signing keys")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("generate", help="Create a new signing key (it becomes active)")
+    retire = commands.add_parser("retire", help="Stop signing with a key but keep accepting its tokens")
+    retire.add_argument("kid")
+    args = parser.parse_args()
+    directory = Path(settings.JWT_KEYS_DIR)
+    if args.command == "generate":
+        print(f"Created {generate_key(settings.JWT_ALGORITHM, directory)}")
+    else:
+        print(f"Retired key; public half kept at {retire_key(args.kid, directory)}")
@@ -0,0 +1,216 @@
+"""
+Payroll runs computed as vectorized batch operations.
+
+A run loads the salary, hire-date, archive-date and branch columns of every employee and the approved leave
+ranges that overlap the period into numpy arrays, computes proration, gross, unpaid-leave
+deductions and net for all employees at once, and writes the payslips with multi-row INSERTs.
+There is no per-employee Python loop, so a 100k-employee run is dominated by the bulk insert.
+
+Until leave types exist, every approved leave day inside the period is treated as unpaid.
+
+    python -m app.core.payroll 2026-10-01 2026-10-31
+"""
+import argparse
+import calendar
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict
+
+import numpy as np
+from sqlalchemy import insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.archive import INCLUDE_ARCHIVED
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest
+from app.db.models.payroll import PayrollRun, Payslip
+from app.db.scoping import UNSCOPED
+from app.schemas.leave import LeaveStatus
+
+
+@dataclass
+class EmployeeColumns:
+    ids: np.ndarray # int64, ascending
+    salaries: np.ndarray # float64 annual salary; NaN when unset
+    hire_dates: np.ndarray # datetime64[D]
+    leave_dates: np.ndarray # datetime64[D] day the employee was archived (last paid day); NaT when active
+    branch_ids: np.ndarray # int64; 0 when unassigned
+
+
+def load_employee_columns(db: Session, period_start: date) -> EmployeeColumns:
+    """Active employees plus those archived during or after the period, who are paid up to that day."""
+    period_start_at = datetime.combine(period_start, datetime.min.time(), tzinfo=timezone.utc)
+    rows = db.execute(
+        select(Employee.id, Employee.salary, Employee.hire_date, Employee.deleted_at, Employee.branch_id)
+        .where(or_(Employee.deleted_at.is_(None), Employee.deleted_at >= period_start_at))
+        .order_by(Employee.id)
+        .execution_options(**UNSCOPED, **INCLUDE_ARCHIVED)
+    ).all()
+    ids, salaries, hire_dates, deleted_ats, branch_ids = zip(*rows) if rows else ((), (), (), (), ())
+    return EmployeeColumns(
+        ids=np.array(ids, dtype=np.int64),
+        salaries=np.array(salaries, dtype=np.float64), # None becomes NaN
+        hire_dates=np.array(hire_dates, dtype="datetime64[D]"),
+        leave_dates=np.array(
+            [d.astimezone(timezone.utc).date() if d else None for d in deleted_ats], dtype="datetime64[D]"
+        ), # None becomes NaT
+        branch_ids=np.array([b or 0 for b in branch_ids], dtype=np.int64),
+    )
+
+
+def load_leave_days(db: Session, employee_ids: np.ndarray, period_start: date, period_end: date) -> np.ndarray:
+    """
+    Approved leave days inside the period per employee, aligned with `employee_ids`. Overlapping
+    requests of one employee are merged first, so a day is never counted twice.
+    """
+    rows = db.execute(
+        select(LeaveRequest.employee_id, LeaveRequest.start_date, LeaveRequest.end_date)
+        .where(LeaveRequest.status == LeaveStatus.APPROVED)
+        .where(LeaveRequest.start_date <= period_end, LeaveRequest.end_date >= period_start)
+        .execution_options(**UNSCOPED)
+    ).all()
+    if not rows or not len(employee_ids):
+        return np.zeros(len(employee_ids), dtype=np.int64)
+    leave_employee_ids, starts, ends = zip(*rows)
+    leave_employee_ids = np.array(leave_employee_ids, dtype=np.int64)
+    first_day = np.datetime64(period_start, "D")
+    # Day offsets from the period start, clipped to the period
+    starts = (np.maximum(np.array(starts, dtype="datetime64[D]"), first_day) - first_day).astype(np.int64)
+    ends = (np.minimum(np.array(ends, dtype="datetime64[D]"), np.datetime64(period_end, "D")) - first_day).astype(np.int64)
+
+    # Map each leave row to its employee's position (ids are sorted)
+    positions = np.searchsorted(employee_ids, leave_employee_ids)
+    positions = np.minimum(positions, len(employee_ids) - 1)
+    known = employee_ids[positions] == leave_employee_ids
+    positions, starts, ends = positions[known], starts[known], ends[known]
+    if not len(positions):
+        return np.zeros(len(employee_ids), dtype=np.int64)
+
+    # Give each employee its own stretch of the number line, so one running maximum over the rows
+    # sorted by (employee, start) is the furthest day already covered for that employee; each row
+    # then only adds the days past it
+    stride = (period_end - period_start).days + 2
+    starts = positions * stride + starts
+    ends = positions * stride + ends
+    order = np.lexsort((starts, positions))
+    positions, starts, ends = positions[order], starts[order], ends[order]
+    covered = np.concatenate(([-1], np.maximum.accumulate(ends)[:-1]))
+    days = np.clip(ends - np.maximum(starts - 1, covered), 0, None)
+    return np.bincount(positions, weights=days, minlength=len(employee_ids)).astype(np.int64)
+
+
+def check_pay_period(period_start: date, period_end: date, periods_per_year: int) -> None:
+    """
+    Raises ValueError unless the dates are exactly one pay period of the configured frequency:
+    a calendar month (12), the 1st-15th or 16th-last of a month (24), or 14 (26) or 7 (52) days.
+    Each run pays salary / periods_per_year, which is only right for such a period.
+    """
+    if period_end < period_start:
+        raise ValueError("period_end must not be before period_start")
+    month_end = date(period_start.year, period_start.month, calendar.monthrange(period_start.year, period_start.month)[1])
+    if periods_per_year == 12:
+        valid = period_start.day == 1 and period_end == month_end
+        expected = "a whole calendar month"
+    elif periods_per_year == 24:
+        valid = (period_start.day, period_end) in ((1, period_start.replace(day=15)), (16, month_end))
+        expected = "the 1st-15th or the 16th-last day of a month"
+    elif periods_per_year in (26, 52):
+        length = 364 // periods_per_year
+        valid = period_end - period_start == timedelta(days=length - 1)
+        expected = f"{length} days"
+    else:
+        raise ValueError(f"Unsupported PAYROLL_SALARY_PERIODS_PER_YEAR={periods_per_year}; use 12, 24, 26 or 52")
+    if not valid:
+        raise ValueError(f"A pay period must be {expected}")
+
+
+def compute_payslips(
+    columns: EmployeeColumns,
+    leave_days: np.ndarray,
+    period_start: date,
+    period_end: date,
+    periods_per_year: int,
+) -> Dict[str, np.ndarray]:
+    """Pure array computation; returns one column per Payslip field for employees paid this period."""
+    days_in_period = (period_end - period_start).days + 1
+    first_day = np.maximum(columns.hire_dates, np.datetime64(period_start, "D"))
+    period_last_day = np.datetime64(period_end, "D")
+    last_day = np.where(
+        np.isnat(columns.leave_dates), period_last_day, np.minimum(columns.leave_dates, period_last_day)
+    )
+    worked_days = np.clip((last_day - first_day).astype(np.int64) + 1, 0, days_in_period)
+
+    base_amount = np.nan_to_num(columns.salaries) / periods_per_year
+    proration = worked_days / days_in_period
+    gross = np.round(base_amount * proration, 2)
+    unpaid_leave_days = np.minimum(leave_days, worked_days)
+    deduction = np.minimum(np.round(base_amount / days_in_period * unpaid_leave_days, 2), gross)
+    net = np.round(gross - deduction, 2)
+
+    paid = worked_days > 0 # Hired after or archived before the period: no payslip
+    return {
+        "employee_id": columns.ids[paid],
+        "branch_id": columns.branch_ids[paid],
+        "base_amount": np.round(base_amount[paid], 2),
+        "worked_days": worked_days[paid],
+        "proration": np.round(proration[paid], 6),
+        "gross": gross[paid],
+        "unpaid_leave_days": unpaid_leave_days[paid],
+        "deduction": deduction[paid],
+        "net": net[paid],
+    }
+
+
+def run_payroll(db: Session, period_start: date, period_end: date) -> PayrollRun:
+    """
+    Computes and stores a payroll run in one transaction. The period must not have a run yet and
+    must be one pay period (see check_pay_period), otherwise ValueError is raised.
+    """
+    check_pay_period(period_start, period_end, settings.PAYROLL_SALARY_PERIODS_PER_YEAR)
+    started = time.monotonic()
+    columns = load_employee_columns(db, period_start)
+    leave_days = load_leave_days(db, columns.ids, period_start, period_end)
+    result = compute_payslips(
+        columns, leave_days, period_start, period_end, settings.PAYROLL_SALARY_PERIODS_PER_YEAR
+    )
+
+    payroll_run = PayrollRun(
+        period_start=period_start,
+        period_end=period_end,
+        created_at=datetime.now(timezone.utc),
+        employee_count=int(len(result["employee_id"])),
+        total_gross=float(result["gross"].sum()),
+        total_deductions=float(result["deduction"].sum()),
+        total_net=float(result["net"].sum()),
+    )
+    db.add(payroll_run)
+    db.flush() # Assign the run id for the payslips
+
+    # Column arrays -> row dicts without touching individual numpy scalars
+    names = list(result)
+    values = [result[name].tolist() for name in names]
+    branch_index = names.index("branch_id")
+    values[branch_index] = [branch_id or None for branch_id in values[branch_index]]
+    rows = [dict(zip(names, row), run_id=payroll_run.id) for row in zip(*values)]
+    batch_size = settings.PAYROLL_INSERT_BATCH_SIZE
+    for offset in range(0, len(rows), batch_size):
+        db.execute(insert(Payslip.__table__), rows[offset:offset + batch_size])
+
+    payroll_run.duration_seconds = round(time.monotonic() - started, 3)
+    db.commit()
+    db.refresh(payroll_run)
+    return payroll_run
+
+
+if __name__ == "__main__":
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Compute and store a payroll run")
+    parser.add_argument("period_start", type=date.fromisoformat)
+    parser.add_argument("period_end", type=date.fromisoformat)
+    args = parser.parse_args()
+    with SessionLocal() as session:
+        run = run_payroll(session, args.period_start, args.period_end)
+        print(f"Run {run.id}: {run.employee_count} payslips, net {run.total_net:.2f} in {run.duration_seconds:.2f}s")
@@ -0,0 +1,129 @@
+"""
+Role -> permission matrix compiled into integer bitmasks.
+
+Roles inherit everything granted to the roles they imply (system > admin > manager > employee).
+The matrix is resolved once at import time into one permission mask and one role mask per role.
+A user's masks are computed on first use and cached on the user object, so every route-level or
+object-level check afterwards is a single bitwise AND.
+"""
+from enum import IntFlag, auto
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+from app.schemas.user import UserInDB
+
+
+class Permission(IntFlag):
+    EMPLOYEE_READ = auto()
+    EMPLOYEE_WRITE = auto()
+    EMPLOYEE_DELETE = auto()
+    LEAVE_CREATE = auto()
+    LEAVE_READ_OWN = auto()
+    LEAVE_READ_ALL = auto()
+    LEAVE_APPROVE = auto()
+    POSITION_MANAGE = auto()
+    DEPARTMENT_MANAGE = auto()
+    USER_MANAGE = auto()
+    ROLE_MANAGE = auto()
+    AUDIT_READ = auto()
+    CHANGES_READ = auto()
+    JOBS_READ = auto()
+    PAYROLL_MANAGE = auto()
+    EMPLOYEE_HISTORY_READ = auto()
+    REVIEW_SUBMIT = auto()
+    REVIEW_MANAGE = auto()
+    RECRUITMENT_MANAGE = auto()
+    TRAINING_ENROL = auto()
+    TRAINING_MANAGE = auto()
+    ALL_BRANCHES = auto()  # Not restricted to the user's own branch (see app.db.scoping)
+
+
+# Permissions granted directly to each role; implied roles add theirs in compile_matrix()
+ROLE_PERMISSIONS: Dict[str, Permission] = {
+    "employee": (
+        Permission.EMPLOYEE_READ | Permission.LEAVE_CREATE | Permission.LEAVE_READ_OWN | Permission.TRAINING_ENROL
+    ),
+    "manager": (
+        Permission.EMPLOYEE_WRITE | Permission.LEAVE_READ_ALL | Permission.LEAVE_APPROVE
+        | Permission.REVIEW_SUBMIT | Permission.RECRUITMENT_MANAGE
+    ),
+    "admin": (
+        Permission.EMPLOYEE_DELETE | Permission.POSITION_MANAGE | Permission.AUDIT_READ
+        | Permission.CHANGES_READ | Permission.JOBS_READ | Permission.PAYROLL_MANAGE
+        | Permission.EMPLOYEE_HISTORY_READ | Permission.REVIEW_MANAGE | Permission.TRAINING_MANAGE
+        | Permission.ALL_BRANCHES
+    ),
+    "system": Permission.DEPARTMENT_MANAGE | Permission.USER_MANAGE | Permission.ROLE_MANAGE,
+}
+
+# Role hierarchy: a role implies the listed roles (and, transitively, theirs)
+ROLE_IMPLIES: Dict[str, List[str]] = {
+    "system": ["admin"],
+    "admin": ["manager"],
+    "manager": ["employee"],
+    "employee": [],
+}
+
+
+def _or_all(values: Iterable[int]) -> int:
+    mask = 0
+    for value in values:
+        mask |= int(value)
+    return mask
+
+
+def compile_matrix() -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """
+    Resolves the hierarchy into three lookups:
+    role -> own bit, role -> permission mask, role -> mask of its own and all implied role bits.
+    """
+    role_bits = {name: 1 << index for index, name in enumerate(sorted(ROLE_IMPLIES))}
+
+    def closure(role: str, path: FrozenSet[str] = frozenset()) -> FrozenSet[str]:
+        if role in path:
+            raise ValueError(f"Cycle in role hierarchy at '{role}'")
+        implied = {role}
+        for parent in ROLE_IMPLIES.get(role, []):
+            implied |= closure(parent, path | {role})
+        return frozenset(implied)
+
+    permission_masks: Dict[str, int] = {}
+    role_masks: Dict[str, int] = {}
+    for role in ROLE_IMPLIES:
+        implied = closure(role)
+        permission_masks[role] = _or_all(ROLE_PERMISSIONS.get(name, 0) for name in implied)
+        role_masks[role] = _or_all(role_bits[name] for name in implied)
+    return role_bits, permission_masks, role_masks
+
+
+ROLE_BITS, PERMISSION_MASKS, ROLE_MASKS = compile_matrix()
+
+
+def role_mask(role_names: Iterable[str]) -> int:
+    """Bits of the named roles; unknown names contribute nothing (so they never match)."""
+    return _or_all(ROLE_BITS.get(name, 0) for name in role_names)
+
+
+@lru_cache(maxsize=1024)
+def _masks_for_roles(role_names: FrozenSet[str]) -> Tuple[int, int]:
+    return (
+        _or_all(PERMISSION_MASKS.get(name, 0) for name in role_names),
+        _or_all(ROLE_MASKS.get(name, 0) for name in role_names),
+    )
+
+
+def user_masks(user: UserInDB) -> Tuple[int, int]:
+    """(permission mask, effective role mask) for a user, computed at most once per user object."""
+    masks = user._masks
+    if masks is None:
+        masks = _masks_for_roles(frozenset(role.name for role in user.roles))
+        user._masks = masks
+    return masks
+
+
+def has_permission(user: UserInDB, permission: Permission) -> bool:
+    return user_masks(user)[0] & permission == permission
+
+
+def has_any_role(user: UserInDB, required_role_mask: int) -> bool:
+    return bool(user_masks(user)[1] & required_role_mask)
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from typing import Any, Dict, Set, Tuple
+
+_Subscriber = Tuple[asyncio.AbstractEventLoop, asyncio.Queue]
+
+
+class Subscription:
+    """A subscriber's queue; use as a context manager so it is always removed."""
+
+    def __init__(self, broker: "PubSub", topic: str, queue: asyncio.Queue):
+        self._broker = broker
+        self.topic = topic
+        self.queue = queue
+
+    async def get(self, timeout: float) -> Any:
+        """Waits for the next message; raises asyncio.TimeoutError after `timeout` seconds."""
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self.topic, self.queue)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PubSub:
+    """
+    Local in-process publish/subscribe keyed by topic.
+
+    `publish` may be called from any thread (sync endpoints run in a threadpool); messages are
+    delivered on each subscriber's event loop. Slow subscribers lose messages rather than
+    growing memory without bound.
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Dict[str, Set[_Subscriber]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str) -> Subscription:
+        """Must be called from a running event loop (e.g. inside an async endpoint)."""
+        queue: asyncio.Queue = asyncio.Queue(self.max_queue_size)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add((asyncio.get_running_loop(), queue))
+        return Subscription(self, topic, queue)
+
+    def _unsubscribe(self, topic: str, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(topic)
+            if not subscribers:
+                return
+            subscribers.difference_update({sub for sub in subscribers if sub[1] is queue})
+            if not subscribers:
+                del self._subscribers[topic]
+
+    def publish(self, topic: str, message: Any) -> int:
+        """Delivers `message` to every subscriber of `topic`. Returns the number of subscribers."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._deliver, queue, message)
+            except RuntimeError:  # Subscriber's loop already closed
+                self._unsubscribe(topic, queue)
+        return len(subscribers)
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, message: Any) -> None:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            pass
+
+
+# Broker for leave-status updates; topics are "leave:<request_id>"
+leave_events = PubSub()
+
+
+def leave_topic(request_id: int) -> str:
+    return f"leave:{request_id}"
@@ -0,0 +1,141 @@
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketLimiter:
+    """
+    In-memory token buckets keyed by string (IP address, username, ...).
+
+    Each key costs one small list in an LRU-ordered dict; once `max_keys` is reached the
+    least recently seen key is evicted, so memory stays bounded under key-rotation floods.
+    """
+
+    def __init__(self, capacity: int, refill_per_minute: float, max_keys: int = 100_000):
+        self.capacity = capacity
+        self.rate = refill_per_minute / 60.0  # Tokens per second
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str) -> float:
+        """Consumes one token. Returns 0 if allowed, otherwise seconds until a token is available."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(self.capacity), now]
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / self.rate
+
+
+# Same algorithm as TokenBucketLimiter, evaluated atomically inside Redis
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucketLimiter:
+    """Token buckets shared by every worker through Redis (optional `redis` dependency)."""
+
+    def __init__(self, client, prefix: str, capacity: int, refill_per_minute: float):
+        self.prefix = prefix
+        self.capacity = capacity
+        self.rate = refill_per_minute / 60.0
+        self._script = client.register_script(_REDIS_TOKEN_BUCKET)
+
+    def hit(self, key: str) -> float:
+        try:
+            return float(self._script(keys=[f"{self.prefix}:{key}"], args=[self.capacity, self.rate, time.time()]))
+        except Exception:
+            # Never lock everybody out because the shared backend is down
+            logger.exception("Rate limit backend unavailable; allowing request")
+            return 0.0
+
+
+_redis_client = None
+
+
+def build_limiter(name: str, capacity: int, refill_per_minute: float):
+    """Returns a shared Redis limiter when RATE_LIMIT_REDIS_URL is set, otherwise an in-memory one."""
+    global _redis_client
+    if capacity < 1 or refill_per_minute <= 0:
+        # A zero rate would never refill (and divides by zero computing Retry-After)
+        raise ValueError(f"Rate limit {name!r} needs a burst of at least 1 and a positive refill rate")
+    if settings.RATE_LIMIT_REDIS_URL:
+        if _redis_client is None:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError("RATE_LIMIT_REDIS_URL is set but the 'redis' package is not installed") from exc
+            _redis_client = redis.Redis.from_url(settings.RATE_LIMIT_REDIS_URL)
+        return RedisTokenBucketLimiter(_redis_client, f"ratelimit:{name}", capacity, refill_per_minute)
+    return TokenBucketLimiter(capacity, refill_per_minute, max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+def client_ip(request: Request) -> str:
+    """Client address as seen by the server (run uvicorn with --proxy-headers behind a proxy)."""
+    return request.client.host if request.client else "unknown"
+
+
+def raise_too_many_requests(retry_after: float, detail: str = "Too many requests. Try again later."):
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+# --- Login Protection ---
+login_ip_limiter = build_limiter(
+    "login-ip", settings.LOGIN_RATE_LIMIT_IP_BURST, settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE
+)
+login_username_limiter = build_limiter(
+    "login-user", settings.LOGIN_RATE_LIMIT_USERNAME_BURST, settings.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE
+)
+
+
+def enforce_login_rate_limit(request: Request, username: Optional[str]) -> None:
+    """
+    Rejects a login attempt with 429 before any database lookup or password hashing.
+
+    The per-IP bucket is checked first. The username bucket is keyed on (username, IP), so guessing
+    one account's password from an address is slowed further, but no client can exhaust the bucket
+    another client logs in with and lock that user out.
+    """
+    ip = client_ip(request)
+    retry_after = login_ip_limiter.hit(ip)
+    if retry_after:
+        raise_too_many_requests(retry_after, "Too many login attempts from this address. Try again later.")
+    retry_after = login_username_limiter.hit(f"{(username or '').strip().lower()}|{ip}")
+    if retry_after:
+        raise_too_many_requests(retry_after, "Too many login attempts for this user. Try again later.")
@@ -0,0 +1,108 @@
+"""
+Careers-page application intake.
+
+Public applications are validated, checked against a short-lived in-process list of open
+requisitions and appended to an in-memory queue; the request returns 202 without touching the
+database. A background thread drains the queue into `candidates` with multi-row INSERTs and
+updates the per-requisition stage counts in the same transaction, so a burst of applicants costs
+one round trip per batch instead of one transaction per submission.
+
+Queued applications live in process memory until the next flush (at most
+RECRUITMENT_FLUSH_INTERVAL_SECONDS); they are flushed on shutdown but lost on a crash. Once
+RECRUITMENT_MAX_BUFFER are waiting (the database is down or far behind) submissions get 503
+instead of waiting on a write from the request thread.
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.batching import BatchWriter, BufferFull
+from app.core.config import settings
+from app.core.rate_limit import build_limiter, client_ip, raise_too_many_requests
+from app.crud import crud_recruitment
+from app.db.session import SessionLocal
+from app.schemas.recruitment import ApplicationCreate, CareersRequisition
+
+
+class OpenRequisitionCache:
+    """The open requisitions, reloaded from the database at most once every `ttl` seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._requisitions: Dict[int, CareersRequisition] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Forces a reload on next use (this process only; other workers catch up within `ttl`)."""
+        self._loaded_at = None
+
+    def _current(self) -> Dict[int, CareersRequisition]:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.ttl:
+            return self._requisitions
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl:
+                with SessionLocal() as db:
+                    self._requisitions = {
+                        requisition.id: CareersRequisition.model_validate(requisition, from_attributes=True)
+                        for requisition in crud_recruitment.get_open_requisitions(db)
+                    }
+                self._loaded_at = time.monotonic()
+            return self._requisitions
+
+    def list(self) -> List[CareersRequisition]:
+        return list(self._current().values())
+
+    def is_open(self, requisition_id: int) -> bool:
+        return requisition_id in self._current()
+
+
+open_requisitions = OpenRequisitionCache(settings.RECRUITMENT_OPEN_CACHE_SECONDS)
+
+
+def _write_batch(applications: List[Dict[str, Any]]) -> None:
+    with SessionLocal() as db:
+        crud_recruitment.insert_applications(db, applications)
+        db.commit()
+
+
+applicant_writer = BatchWriter(
+    "applicants",
+    _write_batch,
+    batch_size=settings.RECRUITMENT_BATCH_SIZE,
+    flush_interval=settings.RECRUITMENT_FLUSH_INTERVAL_SECONDS,
+    max_buffer=settings.RECRUITMENT_MAX_BUFFER,
+    reject_when_full=True,
+)
+
+apply_ip_limiter = build_limiter(
+    "careers-apply-ip", settings.CAREERS_APPLY_RATE_LIMIT_IP_BURST, settings.CAREERS_APPLY_RATE_LIMIT_IP_PER_MINUTE
+)
+
+
+def enforce_apply_rate_limit(request: Request) -> None:
+    retry_after = apply_ip_limiter.hit(client_ip(request))
+    if retry_after:
+        raise_too_many_requests(retry_after, "Too many applications from this address. Try again later.")
+
+
+def submit_application(requisition_id: int, application: ApplicationCreate) -> None:
+    """Queues an application for the next batch insert; 503 when the queue is full."""
+    now = datetime.now(timezone.utc)
+    try:
+        applicant_writer.add({
+            **application.model_dump(),
+            "requisition_id": requisition_id,
+            "applied_at": now,
+            "updated_at": now,
+        })
+    except BufferFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Applications cannot be accepted right now. Try again later.",
+            headers={"Retry-After": "30"},
+        )
@@ -1,13 +1,14 @@
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Annotated
+from functools import lru_cache
+from typing import Optional, List, Annotated, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
 # from passlib.context import CryptContext # Moved to hashing.py
 from sqlalchemy.orm import Session # Import Session
-from app.core.hashing import verify_password # Import from new hashing module
+from app.core.hashing import verify_and_update # Import from new hashing module
 
 # Import models from the new location
 from app.schemas.token import Token, TokenData
@@ -17,9 +18,11 @@ from app import crud # Import crud module
 from app.db.session import get_db # Import get_db dependency
 # Import settings
 from app.core.config import settings
+from app.core.audit import current_actor_id # Attribute audit entries to the authenticated user
 
-# --- Configuration (Now loaded from settings) ---
-ALGORITHM = "HS256" # Keep algorithm hardcoded for now, or add to Settings
+from app.core.jwt_keys import key_ring # Signing/verification keys (HS256 secret or RS/ES key files)
+from app.core.permissions import Permission, has_any_role, has_permission, role_mask # Compiled role/permission masks
+from app.db.scoping import NO_BRANCH, set_branch_scope # Injects branch_id predicates into ORM queries
 
 # --- Password Hashing (Moved to app/core/hashing.py) ---
 # pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto") # Moved
@@ -45,7 +48,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES) # Use settings
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM) # Use settings
+    encoded_jwt = key_ring.sign(to_encode) # Adds the `kid` header for asymmetric keys
     return encoded_jwt
 
 # --- Database User Retrieval ---
@@ -75,8 +78,13 @@ def authenticate_user(db: Session, username: str, password: str) -> UserInDB | N
     user = get_user(db=db, username=username) # Pass db session to get_user
     if not user:
         return None
-    if not verify_password(password, user.hashed_password): # Uses imported verify_password
+    verified, new_hash = verify_and_update(password, user.hashed_password)
+    if not verified:
         return None
+    if new_hash:
+        # Transparently move the stored hash to the current scheme/cost
+        crud.user.update_password_hash(db, user_id=user.id, hashed_password=new_hash)
+        user.hashed_password = new_hash
     return user
 
 # --- Dependencies for Getting Current User ---
@@ -91,7 +99,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM]) # Use settings
+        payload = key_ring.decode(token) # Parsed keys are cached in-process
         username: Optional[str] = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -103,8 +111,20 @@ async def get_current_user(
     user = get_user(db=db, username=token_data.username)
     if user is None:
         raise credentials_exception
+    current_actor_id.set(user.id)
+    # The request's session is shared with the endpoint, so its queries only see this branch
+    set_branch_scope(db, branch_scope_for(user), user_id=user.id)
     return user
 
+def branch_scope_for(user: UserInDB) -> Optional[int]:
+    """
+    Branch a user's queries are restricted to. Only ALL_BRANCHES roles get None (unscoped); a user
+    without a branch gets NO_BRANCH and sees only their own rows (see app.db.scoping).
+    """
+    if has_permission(user, Permission.ALL_BRANCHES):
+        return None
+    return user.branch_id if user.branch_id is not None else NO_BRANCH
+
 async def get_current_active_user(
     current_user: Annotated[UserInDB, Depends(get_current_user)]
 ) -> UserInDB:
@@ -113,20 +133,36 @@ async def get_current_active_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     return current_user
 
-# --- Dependency for Role Checking ---
-def require_role(required_roles: List[str]): # Accept a list of roles
-    """Dependency factory to check if the current user has at least one of the specified roles."""
+# --- Dependencies for Role/Permission Checking ---
+# Both factories are cached, so routes declaring the same requirement share one checker, and the
+# checker itself is a single AND against masks compiled once in app.core.permissions.
+@lru_cache(maxsize=None)
+def _role_checker(required_roles: Tuple[str, ...]):
+    required_mask = role_mask(required_roles)
+    roles_str = " or ".join(f"'{r}'" for r in required_roles)
+
     async def role_checker(current_user: Annotated[UserInDB, Depends(get_current_active_user)]) -> UserInDB:
-        # Access roles directly from the UserInDB object
-        user_roles = current_user.roles
-        # Check if the user has *any* of the required roles
-        user_role_names = {role.name for role in user_roles}
-        if not any(req_role in user_role_names for req_role in required_roles):
-            # Construct a more informative error message
-            roles_str = " or ".join(f"'{r}'" for r in required_roles)
+        # Roles implied by the user's roles count too (admin satisfies 'manager', ...)
+        if not has_any_role(current_user, required_mask):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"User does not have the required role(s): {roles_str}"
             )
         return current_user
-    return role_checker
\ No newline at end of file
+    return role_checker
+
+def require_role(required_roles: List[str]): # Accept a list of roles
+    """Dependency factory to check if the current user has (or implies) at least one of the specified roles."""
+    return _role_checker(tuple(required_roles))
+
+@lru_cache(maxsize=None)
+def require_permission(permission: Permission):
+    """Dependency factory to check that the current user's roles grant `permission`."""
+    async def permission_checker(current_user: Annotated[UserInDB, Depends(get_current_active_user)]) -> UserInDB:
+        if not has_permission(current_user, permission):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"User does not have the required permission: '{permission.name.lower()}'"
+            )
+        return current_user
+    return permission_checker
@@ -0,0 +1,162 @@
+"""
+Application startup and shutdown pipeline (run from the FastAPI lifespan handler).
+
+Work a fresh worker would otherwise do lazily while serving its first requests happens here,
+in order, before the worker reports ready:
+
+1. mappers      - configure every SQLAlchemy mapper (relationships, loader strategies)
+2. connections  - open STARTUP_WARM_CONNECTIONS pooled connections (TCP, TLS, auth)
+3. reference    - load the reference cache and start its invalidation listener
+4. statements   - run the prebuilt hot statements once so their compiled SQL is cached
+5. background   - start the batch writers and the in-process job worker
+
+Each phase is timed; the timings are logged and served by GET /health/ready, which answers 503
+until the pipeline has finished so a load balancer only routes traffic to warm workers.
+Shutdown stops the started phases in reverse order.
+"""
+import inspect
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import configure_mappers
+
+from app.core.audit import audit_writer
+from app.core.config import settings
+from app.core.jobs import start_in_process_worker, stop_in_process_worker
+from app.core.recruitment import applicant_writer
+from app.db.reference_cache import reference_cache
+from app.db.scoping import set_branch_scope
+from app.db.session import SessionLocal, engine
+from app.db.statements import statements
+# Every model, so configure_mappers() sees the complete registry
+from app.db.models import (  # noqa: F401
+    audit, branch, change_log, department, employee, employee_history, job, leave, payroll, position,
+    recruitment, refresh_token, review, role, training, user, user_role_link,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Phase:
+    name: str
+    start: Callable[[], Any]
+    stop: Optional[Callable[[], Any]] = None
+    required: bool = True # A failing optional phase is logged and skipped; a required one aborts startup
+
+
+async def _call(function: Callable[[], Any]) -> None:
+    result = function()
+    if inspect.isawaitable(result):
+        await result
+
+
+class StartupPipeline:
+    def __init__(self, phases: List[Phase]):
+        self.phases = phases
+        self.ready = False
+        self.timings: Dict[str, float] = {} # Milliseconds per phase
+        self.failed: Dict[str, str] = {}
+        self._started: List[Phase] = []
+
+    def record(self, name: str, seconds: float) -> None:
+        """Adds an externally measured step (e.g. module imports) to the report."""
+        self.timings[name] = round(seconds * 1000, 1)
+
+    async def start(self) -> None:
+        pipeline_started = time.perf_counter()
+        for phase in self.phases:
+            phase_started = time.perf_counter()
+            try:
+                await _call(phase.start)
+            except Exception as exc:
+                if phase.required:
+                    logger.exception("Startup phase %r failed", phase.name)
+                    await self.stop()
+                    raise
+                logger.warning("Optional startup phase %r failed; continuing", phase.name, exc_info=True)
+                self.failed[phase.name] = str(exc)
+            else:
+                self._started.append(phase)
+            self.record(phase.name, time.perf_counter() - phase_started)
+        self.record("startup", time.perf_counter() - pipeline_started)
+        self.ready = True
+        logger.info("Worker ready; startup timings (ms): %s", self.timings)
+
+    async def stop(self) -> None:
+        self.ready = False
+        for phase in reversed(self._started):
+            if phase.stop is None:
+                continue
+            try:
+                await _call(phase.stop)
+            except Exception:
+                logger.exception("Shutdown of startup phase %r failed", phase.name)
+        self._started.clear()
+
+    def report(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "timings_ms": dict(self.timings), "failed": dict(self.failed)}
+
+
+# --- Phases ---
+def warm_connection_pool() -> None:
+    """Opens the first pooled connections now instead of on the first requests."""
+    connections = [engine.connect() for _ in range(settings.STARTUP_WARM_CONNECTIONS)]
+    try:
+        for connection in connections:
+            connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in connections:
+            connection.close() # Returned to the pool, still open
+
+
+def warm_reference_cache() -> None:
+    """Loads branches, departments, positions and roles into memory and starts the invalidation listener."""
+    with SessionLocal() as db:
+        reference_cache.warm(db)
+    reference_cache.start_listener()
+
+
+def warm_hot_statements() -> None:
+    """
+    Runs every registered hot statement unscoped and branch-scoped for a user (the two compiled
+    variants requests use), with keys that match nothing; each populates SQLAlchemy's compiled cache.
+    """
+    with SessionLocal() as db:
+        for branch_scope in (None, 0):
+            set_branch_scope(db, branch_scope, user_id=0)
+            statements.warm(db)
+            db.rollback()
+
+
+def start_background() -> Any:
+    audit_writer.start()
+    applicant_writer.start()
+    return start_in_process_worker() # No-op unless JOB_WORKER_IN_PROCESS is set
+
+
+async def stop_background() -> None:
+    await stop_in_process_worker()
+    applicant_writer.stop() # Flushes queued applications
+    audit_writer.stop() # Flushes buffered audit entries
+
+
+pipeline = StartupPipeline([
+    Phase("mappers", configure_mappers),
+    Phase("connections", warm_connection_pool, required=False),
+    Phase("reference", warm_reference_cache, reference_cache.stop_listener),
+    Phase("statements", warm_hot_statements, required=False),
+    Phase("background", start_background, stop_background),
+])
+
+
+@asynccontextmanager
+async def lifespan(app):
+    await pipeline.start()
+    try:
+        yield
+    finally:
+        await pipeline.stop()
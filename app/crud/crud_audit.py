@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.db.models.audit import AuditLog
+
+
+def get_audit_entries(
+    db: Session,
+    since: datetime,
+    until: datetime,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    actor_user_id: Optional[int] = None,
+    before: Optional[Tuple[datetime, int]] = None,
+    limit: int = 100,
+) -> List[AuditLog]:
+    """
+    Retrieves audit entries in a time range, newest first.
+
+    The bounded range lets Postgres prune to the matching monthly partitions, and keyset
+    pagination on (occurred_at, id) keeps deep pages as cheap as the first one.
+    """
+    statement = select(AuditLog).where(AuditLog.occurred_at >= since, AuditLog.occurred_at < until)
+    if entity_type is not None:
+        statement = statement.where(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        statement = statement.where(AuditLog.entity_id == entity_id)
+    if actor_user_id is not None:
+        statement = statement.where(AuditLog.actor_user_id == actor_user_id)
+    if before is not None:
+        statement = statement.where(tuple_(AuditLog.occurred_at, AuditLog.id) < tuple_(*before))
+    statement = statement.order_by(AuditLog.occurred_at.desc(), AuditLog.id.desc()).limit(limit)
+    return db.execute(statement).scalars().all()
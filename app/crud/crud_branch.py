@@ -1,21 +1,26 @@
 from sqlmodel import Session, select # Import Session and select from sqlmodel
 
+from app.db.dependents import move_dependents
 from app.db.models.branch import Branch
+from app.db.archive import INCLUDE_ARCHIVED, archived_options, soft_delete
+from app.db.reference_cache import reference_cache
 from app.schemas.branch import BranchCreate, BranchUpdate
+from app.schemas.deletion import DeleteResult
 
-def get_branch(db: Session, branch_id: int) -> Branch | None:
+def get_branch(db: Session, branch_id: int, include_archived: bool = False) -> Branch | None:
     # Use db.get() for primary key lookup if preferred and available
     # return db.get(Branch, branch_id)
-    statement = select(Branch).where(Branch.id == branch_id)
+    statement = select(Branch).where(Branch.id == branch_id).execution_options(**archived_options(include_archived))
     return db.exec(statement).first()
 
 def get_branch_by_name(db: Session, name: str) -> Branch | None:
-    statement = select(Branch).where(Branch.name == name)
+    # Includes deleted branches: names stay unique across all of them
+    statement = select(Branch).where(Branch.name == name).execution_options(**INCLUDE_ARCHIVED)
     return db.exec(statement).first()
 
-def get_branches(db: Session, skip: int = 0, limit: int = 100) -> list[Branch]:
-    statement = select(Branch).offset(skip).limit(limit)
-    return db.exec(statement).all()
+def get_branches(db: Session, skip: int = 0, limit: int = 100, include_archived: bool = False) -> list[Branch]:
+    statement = select(Branch).order_by(Branch.id).offset(skip).limit(limit)
+    return db.exec(statement.execution_options(**archived_options(include_archived))).all()
 
 def create_branch(db: Session, branch: BranchCreate) -> Branch:
     # SQLModel automatically handles attribute assignment from Pydantic models
@@ -24,6 +29,7 @@ def create_branch(db: Session, branch: BranchCreate) -> Branch:
     db.add(db_branch)
     db.commit()
     db.refresh(db_branch)
+    reference_cache.invalidate(Branch)
     return db_branch
 
 def update_branch(db: Session, db_branch: Branch, branch_in: BranchUpdate) -> Branch:
@@ -33,16 +39,29 @@ def update_branch(db: Session, db_branch: Branch, branch_in: BranchUpdate) -> Br
     db.add(db_branch)
     db.commit()
     db.refresh(db_branch)
+    reference_cache.invalidate(Branch)
     return db_branch
 
-def delete_branch(db: Session, branch_id: int) -> Branch | None:
+def delete_branch(
+    db: Session, branch_id: int, reassign_to: int | None = None, detach: bool = False
+) -> DeleteResult | None:
+    """
+    Archives a branch. By default its employees, users and leave keep pointing at it; with
+    `reassign_to` they move to another branch, with `detach` their branch is cleared, each
+    referencing column in one set-based UPDATE.
+    """
     db_branch = db.get(Branch, branch_id) # Use db.get() for efficiency
     # Or use the previous select method if db.get isn't suitable
     # statement = select(Branch).where(Branch.id == branch_id)
     # db_branch = db.exec(statement).first()
     if db_branch:
-        db.delete(db_branch)
+        affected = {}
+        if reassign_to is not None or detach:
+            affected = move_dependents(db, Branch, branch_id, reassign_to)
+        soft_delete(db_branch)
+        db_branch.is_active = False
+        db.add(db_branch)
         db.commit()
-        # Optionally return the deleted object or a confirmation
-        return db_branch
+        reference_cache.invalidate(Branch)
+        return DeleteResult(id=branch_id, deleted=False, reassigned_to=reassign_to, affected=affected)
     return None # Indicate branch not found
\ No newline at end of file
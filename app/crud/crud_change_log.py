@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import insert, literal_column, select, tuple_
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+from app.db.models.change_log import ChangeLogEntry
+
+# Oldest transaction ID still in progress; everything below it has committed or aborted
+_VISIBLE_HORIZON = literal_column("(pg_snapshot_xmin(pg_current_snapshot())::text)::bigint")
+
+
+def row_snapshot(obj: SQLModel) -> Dict[str, Any]:
+    """Returns the object's column values as JSON-friendly primitives (no relationship loads)."""
+    return values_snapshot({column.key: getattr(obj, column.key) for column in obj.__table__.columns})
+
+
+def values_snapshot(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """The same for a row returned by a Core statement (e.g. `UPDATE ... RETURNING`)."""
+    snapshot = {}
+    for key, value in values.items():
+        if hasattr(value, "value"):
+            value = value.value
+        elif isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        snapshot[key] = value
+    return snapshot
+
+
+def record_change(db: Session, entity_type: str, entity_id: int, operation: str, data: Optional[dict] = None) -> None:
+    """Adds a change entry to the caller's transaction (no commit)."""
+    db.add(ChangeLogEntry(entity_type=entity_type, entity_id=entity_id, operation=operation, data=data))
+
+
+def record_changes(db: Session, entity_type: str, operation: str, rows: Iterable[Tuple[int, Optional[dict]]]) -> None:
+    """Adds many change entries with one multi-row INSERT in the caller's transaction."""
+    values = [
+        {"entity_type": entity_type, "entity_id": entity_id, "operation": operation, "data": data}
+        for entity_id, data in rows
+    ]
+    if values:
+        db.execute(insert(ChangeLogEntry), values)
+
+
+def parse_token(token: Optional[str]) -> Tuple[int, int]:
+    """Tokens are '<txid>.<id>'; an empty token starts from the beginning of the log."""
+    if not token:
+        return 0, 0
+    txid, entry_id = token.split(".", 1)
+    return int(txid), int(entry_id)
+
+
+def format_token(txid: int, entry_id: int) -> str:
+    return f"{txid}.{entry_id}"
+
+
+def get_changes_since(db: Session, since: Tuple[int, int], limit: int = 500) -> List[ChangeLogEntry]:
+    """
+    Retrieves the next page of changes after `since`, in commit-safe order.
+
+    Only rows written by transactions older than the oldest still-running transaction are
+    returned, so later pages can never contain entries that sort before this one.
+    """
+    statement = (
+        select(ChangeLogEntry)
+        .where(tuple_(ChangeLogEntry.txid, ChangeLogEntry.id) > tuple_(*since))
+        .where(ChangeLogEntry.txid < _VISIBLE_HORIZON)
+        .order_by(ChangeLogEntry.txid, ChangeLogEntry.id)
+        .limit(limit)
+    )
+    return db.execute(statement).scalars().all()
@@ -1,7 +1,11 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
+from app.db.dependents import move_dependents
 from app.db.models.department import Department
+from app.db.reference_cache import reference_cache
+from app.schemas.deletion import DeleteResult
 from app.schemas.department import DepartmentCreate, DepartmentUpdate
 
 def get_department(db: Session, department_id: int) -> Optional[Department]:
@@ -18,6 +22,7 @@ def create_department(db: Session, department: DepartmentCreate) -> Department:
     db.add(db_department)
     db.commit()
     db.refresh(db_department)
+    reference_cache.invalidate(Department)
     return db_department
 
 def update_department(db: Session, department_id: int, department_update: DepartmentUpdate) -> Optional[Department]:
@@ -28,12 +33,18 @@ def update_department(db: Session, department_id: int, department_update: Depart
         setattr(db_department, key, value)
     db.commit()
     db.refresh(db_department)
+    reference_cache.invalidate(Department)
     return db_department
 
-def delete_department(db: Session, department_id: int) -> Optional[Department]:
-    db_department = get_department(db, department_id)
-    if not db_department:
+def delete_department(db: Session, department_id: int, reassign_to: Optional[int] = None) -> Optional[DeleteResult]:
+    """
+    Deletes a department after moving its employees (and requisitions, reviews) to `reassign_to`,
+    or detaching them when it is None, with one UPDATE per referencing column.
+    """
+    if get_department(db, department_id) is None:
         return None
-    db.delete(db_department)
+    affected = move_dependents(db, Department, department_id, reassign_to)
+    db.execute(delete(Department).where(Department.id == department_id))
     db.commit()
-    return db_department
\ No newline at end of file
+    reference_cache.invalidate(Department)
+    return DeleteResult(id=department_id, deleted=True, reassigned_to=reassign_to, affected=affected)
\ No newline at end of file
@@ -1,70 +1,95 @@
+from datetime import date
+
+from sqlalchemy import update
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
 from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest
 from app.db.models.position import Position
 from app.db.models.department import Department
+from app.db.reference_cache import reference_cache
+from app.db.scoping import UNSCOPED
+from app.db.archive import archived_options, soft_delete
+from app.db.statements import statements
+from app.core.jobs import enqueue
+from app.crud.crud_change_log import record_change, row_snapshot
+from app.crud import crud_employee_history
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate
-from app.schemas.position import Position
-from app.schemas.department import Department
 
-def get_employee(db: Session, employee_id: int) -> Optional[Employee]:
+def get_employee(db: Session, employee_id: int, include_archived: bool = False) -> Optional[Employee]:
     """
-    Retrieves a single employee by their ID.
+    Retrieves a single employee by their ID (terminated employees only with include_archived).
     """
-    return db.query(Employee).filter(Employee.id == employee_id).first()
+    params = {"employee_id": employee_id}
+    return statements.execute(db, "employee_by_id", params, **archived_options(include_archived)).scalars().first()
 
 def get_employee_by_email(db: Session, email: str) -> Optional[Employee]:
     """
     Retrieves a single employee by their email address.
+    Not branch-scoped and includes terminated employees: emails are unique across all of them.
+    """
+    return statements.execute(db, "employee_by_email", {"email": email}).scalars().first()
+
+def get_employee_by_user_id(db: Session, user_id: int) -> Optional[Employee]:
+    """
+    Retrieves the employee profile linked to a user account.
     """
-    return db.query(Employee).filter(Employee.email == email).first()
+    return statements.execute(db, "employee_by_user_id", {"user_id": user_id}).scalars().first()
 
-def get_employees(db: Session, skip: int = 0, limit: int = 100) -> List[Employee]:
+def get_employees(db: Session, skip: int = 0, limit: int = 100, include_archived: bool = False) -> List[Employee]:
     """
-    Retrieves a list of employees with pagination.
+    Retrieves a list of employees with pagination, ordered by id.
+    Only active employees unless include_archived is set.
     """
-    return db.query(Employee).offset(skip).limit(limit).all()
+    query = db.query(Employee).order_by(Employee.id).execution_options(**archived_options(include_archived))
+    return query.offset(skip).limit(limit).all()
+
+def _resolve_reference_id(db: Session, model, reference) -> Optional[int]:
+    """
+    Resolves a position/department reference (id, name, dict or schema) to an id
+    using the in-memory reference cache. Unknown names are created on the fly.
+    """
+    if reference is None:
+        return None
+    if isinstance(reference, int):
+        entry = reference_cache.get_by_id(db, model, reference)
+        return entry.id if entry else None
+
+    if isinstance(reference, str):
+        data = {"name": reference}
+    elif isinstance(reference, dict):
+        data = reference
+    else:
+        data = reference.model_dump()
+    entry = reference_cache.get_by_name(db, model, data["name"])
+    if entry:
+        return entry.id
+
+    db_reference = model(name=data["name"], description=data.get("description"))
+    db.add(db_reference)
+    db.commit()
+    db.refresh(db_reference)
+    reference_cache.invalidate(model)
+    return db_reference.id
 
 def create_employee(db: Session, employee: EmployeeCreate) -> Employee:
     """
     Creates a new employee in the database with position and department.
     """
     employee_data = employee.model_dump(exclude={"position", "department"})
-    
-    # Handle position if provided
-    position = None
-    if employee.position:
-        if isinstance(employee.position, int):
-            position = db.query(Position).get(employee.position)
-        else:
-            position = db.query(Position).filter_by(name=employee.position.name).first()
-            if not position:
-                position = Position(**employee.position.model_dump())
-                db.add(position)
-                db.commit()
-                db.refresh(position)
-    
-    # Handle department if provided
-    department = None
-    if employee.department:
-        if isinstance(employee.department, int):
-            department = db.query(Department).get(employee.department)
-        else:
-            department = db.query(Department).filter_by(name=employee.department.name).first()
-            if not department:
-                department = Department(**employee.department.model_dump())
-                db.add(department)
-                db.commit()
-                db.refresh(department)
-    
-    # Create employee with relationships
+
+    # Create employee with relationships resolved through the reference cache
     db_employee = Employee(
         **employee_data,
-        position=position,
-        department=department
+        position_id=_resolve_reference_id(db, Position, employee.position),
+        department_id=_resolve_reference_id(db, Department, employee.department),
     )
     db.add(db_employee)
+    db.flush() # Assign the ID so side effects can reference it
+    crud_employee_history.record_version(db, db_employee, db_employee.hire_date)
+    enqueue(db, "employee.created", {"employee_id": db_employee.id})
+    record_change(db, "employee", db_employee.id, "insert", row_snapshot(db_employee))
     db.commit()
     db.refresh(db_employee)
     return db_employee
@@ -78,53 +103,46 @@ def update_employee(db: Session, employee_id: int, employee_update: EmployeeUpda
         return None
 
     update_data = employee_update.model_dump(exclude={"position", "department"}, exclude_unset=True)
-    
-    # Handle position update if provided
+
+    # Handle position/department updates if provided
     if employee_update.position is not None:
-        if isinstance(employee_update.position, int):
-            position = db.query(Position).get(employee_update.position)
-        elif isinstance(employee_update.position, dict):
-            position = db.query(Position).filter_by(name=employee_update.position["name"]).first()
-            if not position:
-                position = Position(**employee_update.position)
-                db.add(position)
-                db.commit()
-                db.refresh(position)
-        else:
-            position = None
-        update_data["position"] = position
-    
-    # Handle department update if provided
+        update_data["position_id"] = _resolve_reference_id(db, Position, employee_update.position)
     if employee_update.department is not None:
-        if isinstance(employee_update.department, int):
-            department = db.query(Department).get(employee_update.department)
-        elif isinstance(employee_update.department, dict):
-            department = db.query(Department).filter_by(name=employee_update.department["name"]).first()
-            if not department:
-                department = Department(**employee_update.department)
-                db.add(department)
-                db.commit()
-                db.refresh(department)
-        else:
-            department = None
-        update_data["department"] = department
-    
+        update_data["department_id"] = _resolve_reference_id(db, Department, employee_update.department)
+
     # Apply all updates
+    branch_changed = "branch_id" in update_data and update_data["branch_id"] != db_employee.branch_id
+    previous_values = crud_employee_history.tracked_values(db_employee)
     for key, value in update_data.items():
         setattr(db_employee, key, value)
-    
+
     db.add(db_employee)
+    if branch_changed:
+        # Keep the denormalised branch on the employee's leave requests in step
+        db.execute(
+            update(LeaveRequest)
+            .where(LeaveRequest.employee_id == db_employee.id)
+            .values(branch_id=db_employee.branch_id)
+            .execution_options(synchronize_session=False, **UNSCOPED)
+        )
+    if crud_employee_history.tracked_values(db_employee) != previous_values:
+        # Keep the old salary/position/department answerable by as-of queries
+        crud_employee_history.record_version(db, db_employee, date.today())
+    record_change(db, "employee", db_employee.id, "update", row_snapshot(db_employee))
     db.commit()
     db.refresh(db_employee)
     return db_employee
 
 def delete_employee(db: Session, employee_id: int) -> Optional[Employee]:
     """
-    Deletes an employee from the database.
+    Terminates an employee: the row is archived (soft-deleted) rather than removed, so payslips,
+    reviews and leave history keep pointing at it.
     """
     db_employee = get_employee(db, employee_id)
     if not db_employee:
         return None
-    db.delete(db_employee)
+    soft_delete(db_employee)
+    crud_employee_history.close_versions(db, db_employee.id, date.today())
+    record_change(db, "employee", db_employee.id, "delete")
     db.commit()
     return db_employee
\ No newline at end of file
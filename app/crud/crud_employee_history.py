@@ -0,0 +1,133 @@
+from datetime import date, timedelta
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Date, Integer, any_, bindparam, exists, func, insert, literal, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.db.archive import INCLUDE_ARCHIVED
+from app.db.models.employee import Employee
+from app.db.models.employee_history import EmployeeHistory
+from app.db.scoping import UNSCOPED
+
+# Employee columns whose past values are kept in employee_history
+TRACKED_FIELDS = ("salary", "position_id", "department_id")
+
+# Must match the ix_employee_history_validity expression for the GiST index to be used
+_VALIDITY = func.daterange(EmployeeHistory.valid_from, EmployeeHistory.valid_to, literal_column("'[)'"))
+
+
+def tracked_values(employee: Employee) -> tuple:
+    return tuple(getattr(employee, field) for field in TRACKED_FIELDS)
+
+
+def _current_version(db: Session, employee_id: int) -> Optional[EmployeeHistory]:
+    return db.execute(
+        select(EmployeeHistory)
+        .where(EmployeeHistory.employee_id == employee_id, EmployeeHistory.valid_to.is_(None))
+        .with_for_update()
+    ).scalars().first()
+
+
+def record_version(db: Session, employee: Employee, effective_from: date) -> None:
+    """
+    Makes the employee's current tracked values the open version from `effective_from`, closing
+    the previous one. A second change on the same day replaces that day's version instead of
+    leaving a zero-length range. Runs inside the caller's transaction.
+    """
+    current = _current_version(db, employee.id)
+    values = dict(zip(TRACKED_FIELDS, tracked_values(employee)))
+    if current is not None and current.valid_from >= effective_from:
+        for field, value in values.items():
+            setattr(current, field, value)
+        return
+    if current is not None:
+        current.valid_to = effective_from
+    db.add(EmployeeHistory(employee_id=employee.id, valid_from=effective_from, **values))
+
+
+def record_versions(db: Session, employee_ids: Iterable[int], effective_from: date) -> None:
+    """
+    `record_version` for many employees after a bulk UPDATE, in three statements whatever their
+    number: same-day versions take the new values, older open versions are closed, and a version
+    from `effective_from` is inserted for every active employee left without one. Archived
+    employees keep their closed history. Runs inside the caller's transaction.
+    """
+    ids = sorted(set(employee_ids))
+    if not ids:
+        return
+    employees = Employee.__table__
+    history = EmployeeHistory.__table__
+    options = {**UNSCOPED, **INCLUDE_ARCHIVED}
+
+    def selected(column):
+        return column == any_(bindparam("employee_ids", ids, type_=ARRAY(Integer)))
+
+    db.execute(
+        update(history)
+        .where(selected(history.c.employee_id), history.c.valid_to.is_(None))
+        .where(history.c.valid_from >= effective_from, employees.c.id == history.c.employee_id)
+        .values({field: employees.c[field] for field in TRACKED_FIELDS})
+        .execution_options(**options)
+    )
+    db.execute(
+        update(history)
+        .where(selected(history.c.employee_id), history.c.valid_to.is_(None))
+        .where(history.c.valid_from < effective_from)
+        .values(valid_to=effective_from)
+        .execution_options(**options)
+    )
+    open_version = exists().where(history.c.employee_id == employees.c.id, history.c.valid_to.is_(None))
+    db.execute(
+        insert(history).from_select(
+            ["employee_id", *TRACKED_FIELDS, "valid_from"],
+            select(employees.c.id, *(employees.c[field] for field in TRACKED_FIELDS), literal(effective_from, Date))
+            .where(selected(employees.c.id), employees.c.deleted_at.is_(None), ~open_version),
+        ).execution_options(**options)
+    )
+
+
+def close_versions(db: Session, employee_id: int, effective_to: date) -> None:
+    """Ends the open version when an employee is removed, keeping the history."""
+    current = _current_version(db, employee_id)
+    if current is not None:
+        current.valid_to = max(effective_to, current.valid_from + timedelta(days=1))
+
+
+def get_employee_history(db: Session, employee_id: int) -> List[EmployeeHistory]:
+    """All versions of one employee, oldest first."""
+    return db.execute(
+        select(EmployeeHistory)
+        .where(EmployeeHistory.employee_id == employee_id)
+        .order_by(EmployeeHistory.valid_from)
+    ).scalars().all()
+
+
+def get_employee_as_of(db: Session, employee_id: int, as_of: date) -> Optional[EmployeeHistory]:
+    """
+    The version of one employee valid on `as_of`: a single descent of the
+    (employee_id, valid_from) index.
+    """
+    return db.execute(
+        select(EmployeeHistory)
+        .where(EmployeeHistory.employee_id == employee_id, EmployeeHistory.valid_from <= as_of)
+        .where(or_(EmployeeHistory.valid_to.is_(None), EmployeeHistory.valid_to > as_of))
+        .order_by(EmployeeHistory.valid_from.desc())
+        .limit(1)
+    ).scalars().first()
+
+
+def get_snapshot_as_of(
+    db: Session,
+    as_of: date,
+    after_employee_id: Optional[int] = None,
+    limit: int = 1000,
+) -> List[EmployeeHistory]:
+    """
+    The version of every employee valid on `as_of`, ordered by employee id, found with one scan
+    of the GiST validity index. Pass the last employee_id back as `after_employee_id` to page.
+    """
+    statement = select(EmployeeHistory).where(_VALIDITY.op("@>")(literal(as_of, Date)))
+    if after_employee_id is not None:
+        statement = statement.where(EmployeeHistory.employee_id > after_employee_id)
+    return db.execute(statement.order_by(EmployeeHistory.employee_id).limit(limit)).scalars().all()
@@ -1,14 +1,26 @@
+from sqlalchemy import Integer, any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import date
 
-from app.db.models.leave import LeaveRequest
-from app.schemas.leave import LeaveRequestCreate, LeaveStatus
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest, LeaveRequestArchive
+from app.db.scoping import UNSCOPED
+from app.db.partitioning import ensure_leave_partitions, leave_branch_required
+from app.db.statements import statements
+from app.core.jobs import enqueue
+from app.core import audit
+from app.core.pubsub import leave_events, leave_topic
+from app.crud.crud_change_log import record_change, record_changes, row_snapshot
+from app.schemas.leave import LEAVE_STATUS_TRANSITIONS, LeaveRequestCreate, LeaveStatus
+from app.schemas.leave import LeaveRequest as LeaveRequestSchema
 
 def get_leave_request(db: Session, request_id: int) -> Optional[LeaveRequest]:
     """
     Retrieves a single leave request by its ID.
     """
-    return db.query(LeaveRequest).filter(LeaveRequest.id == request_id).first()
+    return statements.execute(db, "leave_request_by_id", {"request_id": request_id}).scalars().first()
 
 def get_leave_requests(db: Session, skip: int = 0, limit: int = 100) -> List[LeaveRequest]:
     """
@@ -16,26 +28,143 @@ def get_leave_requests(db: Session, skip: int = 0, limit: int = 100) -> List[Lea
     """
     return db.query(LeaveRequest).offset(skip).limit(limit).all()
 
-def get_leave_requests_by_employee(db: Session, employee_id: int, skip: int = 0, limit: int = 100) -> List[LeaveRequest]:
+def _filter_by_status_and_dates(
+    query, status: Optional[LeaveStatus], start_from: Optional[date], start_to: Optional[date], model=LeaveRequest
+):
+    """Applies the optional inbox filters shared by the employee and team views."""
+    if status is not None:
+        query = query.filter(model.status == status)
+    if start_from is not None:
+        query = query.filter(model.start_date >= start_from)
+    if start_to is not None:
+        query = query.filter(model.start_date <= start_to)
+    return query
+
+def get_leave_requests_by_employee(
+    db: Session,
+    employee_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[LeaveStatus] = None,
+    start_from: Optional[date] = None,
+    start_to: Optional[date] = None,
+    include_archived: bool = False,
+) -> List[LeaveRequest]:
+    """
+    Retrieves a list of leave requests for a specific employee with pagination, newest first.
+    Served by the (employee_id, start_date) index; with include_archived the same page is also
+    read from leave_requests_archive (through its matching index) and the two are merged.
+    """
+    models = (LeaveRequest, LeaveRequestArchive) if include_archived else (LeaveRequest,)
+    rows = []
+    for model in models:
+        query = db.query(model).filter(model.employee_id == employee_id)
+        query = _filter_by_status_and_dates(query, status, start_from, start_to, model=model)
+        query = query.order_by(model.start_date.desc(), model.id.desc())
+        if include_archived:
+            query = query.limit(skip + limit)  # Each side contributes at most a full page
+        else:
+            query = query.offset(skip).limit(limit)
+        rows.extend(query.all())
+    if not include_archived:
+        return rows
+    rows.sort(key=lambda row: (row.start_date, row.id), reverse=True)
+    return rows[skip:skip + limit]
+
+def get_leave_requests_for_team(
+    db: Session,
+    department_id: Optional[int] = None,
+    branch_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[LeaveStatus] = LeaveStatus.PENDING,
+    start_from: Optional[date] = None,
+    start_to: Optional[date] = None,
+) -> List[LeaveRequest]:
     """
-    Retrieves a list of leave requests for a specific employee with pagination.
+    Retrieves leave requests of employees in a department and/or branch, oldest start date first.
+    With the default PENDING status this is served by the partial pending index.
     """
-    return db.query(LeaveRequest).filter(LeaveRequest.employee_id == employee_id).offset(skip).limit(limit).all()
+    query = db.query(LeaveRequest)
+    if department_id is not None:
+        query = query.join(Employee, Employee.id == LeaveRequest.employee_id).filter(Employee.department_id == department_id)
+    if branch_id is not None:
+        query = query.filter(LeaveRequest.branch_id == branch_id)
+    query = _filter_by_status_and_dates(query, status, start_from, start_to)
+    return query.order_by(LeaveRequest.start_date, LeaveRequest.id).offset(skip).limit(limit).all()
 
 def create_leave_request(db: Session, leave_request: LeaveRequestCreate) -> LeaveRequest:
     """
     Creates a new leave request in the database.
-    Status defaults to PENDING.
+    Status defaults to PENDING. Raises ValueError if leave is partitioned by branch and the
+    employee has none.
     """
+    # Denormalised for branch scoping; read unscoped so the copy is always the employee's real branch
+    branch_id = db.execute(
+        select(Employee.branch_id).where(Employee.id == leave_request.employee_id).execution_options(**UNSCOPED)
+    ).scalar_one_or_none()
+    if branch_id is None and leave_branch_required():
+        raise ValueError("The employee has no branch; assign one before requesting leave")
     db_leave_request = LeaveRequest(
         **leave_request.model_dump(),
+        branch_id=branch_id,
         status=LeaveStatus.PENDING # Explicitly set default status
     )
+    # With yearly partitions, make sure this year's exists rather than filling the default partition
+    ensure_leave_partitions(db.connection(), [db_leave_request.start_date])
     db.add(db_leave_request)
+    db.flush() # Assign the ID so side effects can reference it
+    enqueue(db, "leave.submitted", {"request_id": db_leave_request.id, "employee_id": db_leave_request.employee_id})
+    record_change(db, "leave_request", db_leave_request.id, "insert", row_snapshot(db_leave_request))
     db.commit()
     db.refresh(db_leave_request)
     return db_leave_request
 
-# TODO: Add functions for updating status and deleting requests
-# def update_leave_request_status(db: Session, request_id: int, status: LeaveStatus) -> Optional[LeaveRequest]: ...
-# def delete_leave_request(db: Session, request_id: int) -> Optional[LeaveRequest]: ...
\ No newline at end of file
+def update_leave_requests_status(db: Session, request_ids: List[int], status: LeaveStatus) -> List[LeaveRequestSchema]:
+    """
+    Moves a batch of leave requests to `status` in one transaction.
+
+    Uses a single UPDATE ... WHERE id = ANY(...) RETURNING, restricted to rows whose current
+    status allows the transition (see LEAVE_STATUS_TRANSITIONS). Rows in any other state are
+    left untouched and simply not returned.
+    """
+    source_statuses = [source for source, targets in LEAVE_STATUS_TRANSITIONS.items() if status in targets]
+    if not request_ids or not source_statuses:
+        return []
+
+    statement = (
+        update(LeaveRequest)
+        .where(LeaveRequest.id == any_(bindparam("request_ids", sorted(set(request_ids)), type_=ARRAY(Integer))))
+        .where(LeaveRequest.status.in_(source_statuses))
+        .values(status=status)
+        .returning(LeaveRequest)
+        .execution_options(synchronize_session=False)
+    )
+    updated = db.execute(statement).scalars().all()
+    # Snapshot before commit so the response does not trigger one refresh per row
+    result = [LeaveRequestSchema.model_validate(leave_request) for leave_request in updated]
+    if result:
+        # Bulk UPDATE bypasses flush events, so stage the audit entries explicitly
+        old_status = source_statuses[0] if len(source_statuses) == 1 else None
+        audit.stage(db, [
+            audit.make_entry("leave_request", r.id, "status", old_status, status) for r in result
+        ])
+        record_changes(db, "leave_request", "update", [(r.id, r.model_dump(mode="json")) for r in result])
+        # One job per batch keeps approval of 200 requests to a single extra insert
+        enqueue(db, "leave.status_changed", {"request_ids": [r.id for r in result], "status": status.value})
+    db.commit()
+    # Notify live subscribers only once the change is durable
+    for leave_request in result:
+        leave_events.publish(leave_topic(leave_request.id), leave_request.model_dump(mode="json"))
+    return result
+
+def update_leave_request_status(db: Session, request_id: int, status: LeaveStatus) -> Optional[LeaveRequestSchema]:
+    """
+    Moves a single leave request to `status`.
+    Returns None if the request does not exist or the transition is not allowed.
+    """
+    updated = update_leave_requests_status(db, [request_id], status)
+    return updated[0] if updated else None
+
+# TODO: Add function for deleting requests
+# def delete_leave_request(db: Session, request_id: int) -> Optional[LeaveRequest]: ...
@@ -0,0 +1,39 @@
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.payroll import PayrollRun, Payslip
+
+
+def get_payroll_run(db: Session, run_id: int) -> Optional[PayrollRun]:
+    return db.get(PayrollRun, run_id)
+
+
+def get_payroll_run_by_period(db: Session, period_start: date, period_end: date) -> Optional[PayrollRun]:
+    return db.execute(
+        select(PayrollRun).where(PayrollRun.period_start == period_start, PayrollRun.period_end == period_end)
+    ).scalars().first()
+
+
+def get_payroll_runs(db: Session, skip: int = 0, limit: int = 100) -> List[PayrollRun]:
+    """Retrieves payroll runs, most recent period first."""
+    statement = select(PayrollRun).order_by(PayrollRun.period_start.desc(), PayrollRun.id.desc())
+    return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+
+def get_payslips(
+    db: Session,
+    run_id: int,
+    after_employee_id: Optional[int] = None,
+    limit: int = 100,
+) -> List[Payslip]:
+    """
+    Retrieves a run's payslips ordered by employee id, using keyset pagination on the
+    (run_id, employee_id) index so deep pages of a 100k-employee run stay cheap.
+    """
+    statement = select(Payslip).where(Payslip.run_id == run_id)
+    if after_employee_id is not None:
+        statement = statement.where(Payslip.employee_id > after_employee_id)
+    return db.execute(statement.order_by(Payslip.employee_id).limit(limit)).scalars().all()
@@ -1,7 +1,11 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
+from app.db.dependents import move_dependents
 from app.db.models.position import Position
+from app.db.reference_cache import reference_cache
+from app.schemas.deletion import DeleteResult
 from app.schemas.position import PositionCreate, PositionUpdate
 
 def get_position(db: Session, position_id: int) -> Optional[Position]:
@@ -18,6 +22,7 @@ def create_position(db: Session, position: PositionCreate) -> Position:
     db.add(db_position)
     db.commit()
     db.refresh(db_position)
+    reference_cache.invalidate(Position)
     return db_position
 
 def update_position(db: Session, position_id: int, position_update: PositionUpdate) -> Optional[Position]:
@@ -28,12 +33,15 @@ def update_position(db: Session, position_id: int, position_update: PositionUpda
         setattr(db_position, key, value)
     db.commit()
     db.refresh(db_position)
+    reference_cache.invalidate(Position)
     return db_position
 
-def delete_position(db: Session, position_id: int) -> Optional[Position]:
-    db_position = get_position(db, position_id)
-    if not db_position:
+def delete_position(db: Session, position_id: int, reassign_to: Optional[int] = None) -> Optional[DeleteResult]:
+    """Deletes a position after moving (or, with no target, detaching) its employees and requisitions."""
+    if get_position(db, position_id) is None:
         return None
-    db.delete(db_position)
+    affected = move_dependents(db, Position, position_id, reassign_to)
+    db.execute(delete(Position).where(Position.id == position_id))
     db.commit()
-    return db_position
\ No newline at end of file
+    reference_cache.invalidate(Position)
+    return DeleteResult(id=position_id, deleted=True, reassigned_to=reassign_to, affected=affected)
\ No newline at end of file
@@ -0,0 +1,167 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.models.recruitment import Candidate, Requisition, RequisitionStageCount
+from app.db.scoping import UNSCOPED
+from app.schemas.recruitment import (
+    CandidateStageResult, PipelineCounts, PipelineStage, RequisitionCreate, RequisitionStatus, RequisitionUpdate,
+)
+
+# --- Requisitions ---
+def get_requisition(db: Session, requisition_id: int) -> Optional[Requisition]:
+    return db.execute(select(Requisition).where(Requisition.id == requisition_id)).scalars().first()
+
+def get_requisitions(
+    db: Session,
+    status: Optional[RequisitionStatus] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[Requisition]:
+    statement = select(Requisition)
+    if status is not None:
+        statement = statement.where(Requisition.status == status)
+    return db.execute(statement.order_by(Requisition.id).offset(skip).limit(limit)).scalars().all()
+
+def get_open_requisitions(db: Session) -> List[Requisition]:
+    """Every open requisition in every branch, for the public careers page."""
+    statement = select(Requisition).where(Requisition.status == RequisitionStatus.OPEN).order_by(Requisition.id)
+    return db.execute(statement.execution_options(**UNSCOPED)).scalars().all()
+
+def create_requisition(db: Session, requisition_in: RequisitionCreate) -> Requisition:
+    db_requisition = Requisition(**requisition_in.model_dump(), created_at=datetime.now(timezone.utc))
+    db.add(db_requisition)
+    db.commit()
+    db.refresh(db_requisition)
+    return db_requisition
+
+def update_requisition(db: Session, requisition: Requisition, requisition_in: RequisitionUpdate) -> Requisition:
+    for field, value in requisition_in.model_dump(exclude_unset=True).items():
+        setattr(requisition, field, value)
+    db.add(requisition)
+    db.commit()
+    db.refresh(requisition)
+    return requisition
+
+# --- Stage Counts ---
+def apply_stage_deltas(db: Session, deltas: Dict[Tuple[int, PipelineStage], int]) -> None:
+    """
+    Adds the deltas to requisition_stage_counts with one multi-row upsert, inside the caller's
+    transaction so the counts always match the candidates table.
+    """
+    rows = [
+        {"requisition_id": requisition_id, "stage": stage, "candidate_count": delta}
+        for (requisition_id, stage), delta in sorted(deltas.items()) if delta
+    ]
+    if not rows:
+        return
+    statement = pg_insert(RequisitionStageCount).values(rows)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=["requisition_id", "stage"],
+        set_={"candidate_count": RequisitionStageCount.candidate_count + statement.excluded.candidate_count},
+    ))
+
+def get_stage_counts(db: Session, requisition_id: int) -> PipelineCounts:
+    """Reads the maintained per-stage counts: at most one row per stage, no COUNT(*) over candidates."""
+    rows = db.execute(
+        select(RequisitionStageCount.stage, RequisitionStageCount.candidate_count)
+        .where(RequisitionStageCount.requisition_id == requisition_id)
+    ).all()
+    counts = {stage: 0 for stage in PipelineStage}
+    counts.update({stage: count for stage, count in rows})
+    return PipelineCounts(requisition_id=requisition_id, counts=counts, total=sum(counts.values()))
+
+def rebuild_stage_counts(db: Session, requisition_id: int) -> PipelineCounts:
+    """Recomputes one requisition's counts from the candidates table (repair tool)."""
+    db.execute(
+        RequisitionStageCount.__table__.delete().where(RequisitionStageCount.requisition_id == requisition_id)
+    )
+    rows = db.execute(
+        select(Candidate.stage, func.count())
+        .where(Candidate.requisition_id == requisition_id)
+        .group_by(Candidate.stage)
+        .execution_options(**UNSCOPED)
+    ).all()
+    apply_stage_deltas(db, {(requisition_id, stage): count for stage, count in rows})
+    db.commit()
+    return get_stage_counts(db, requisition_id)
+
+# --- Candidates ---
+def insert_applications(db: Session, applications: Iterable[Dict[str, Any]]) -> int:
+    """
+    Writes a batch of queued applications with one multi-row INSERT and bumps the APPLIED counts
+    in the same transaction. Applications to requisitions that closed (or vanished) since they
+    were queued are dropped, as are repeat submissions of an email to the same requisition.
+    Returns the number of candidates created.
+    """
+    applications = list(applications)
+    requisition_ids = {application["requisition_id"] for application in applications}
+    open_branches = dict(db.execute(
+        select(Requisition.id, Requisition.branch_id)
+        .where(Requisition.id.in_(requisition_ids), Requisition.status == RequisitionStatus.OPEN)
+        .execution_options(**UNSCOPED)
+    ).all())
+    rows = [
+        {**application, "branch_id": open_branches[application["requisition_id"]], "stage": PipelineStage.APPLIED}
+        for application in applications if application["requisition_id"] in open_branches
+    ]
+    if not rows:
+        return 0
+    inserted = db.execute(
+        pg_insert(Candidate)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_candidates_requisition_id_email")
+        .returning(Candidate.requisition_id)
+    ).scalars().all()
+    apply_stage_deltas(db, Counter((requisition_id, PipelineStage.APPLIED) for requisition_id in inserted))
+    return len(inserted)
+
+def get_candidate(db: Session, candidate_id: int) -> Optional[Candidate]:
+    return db.execute(select(Candidate).where(Candidate.id == candidate_id)).scalars().first()
+
+def get_candidates(
+    db: Session,
+    requisition_id: int,
+    stage: Optional[PipelineStage] = None,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+) -> List[Candidate]:
+    """One requisition's candidates by id, served by the (requisition_id, stage, id) index. Page with `after_id`."""
+    statement = select(Candidate).where(Candidate.requisition_id == requisition_id)
+    if stage is not None:
+        statement = statement.where(Candidate.stage == stage)
+    if after_id is not None:
+        statement = statement.where(Candidate.id > after_id)
+    return db.execute(statement.order_by(Candidate.id).limit(limit)).scalars().all()
+
+def move_candidates(db: Session, candidate_ids: List[int], stage: PipelineStage) -> CandidateStageResult:
+    """
+    Moves candidates to a pipeline stage with one locking SELECT and one UPDATE, adjusting the
+    cached stage counts in the same transaction.
+    """
+    current = db.execute(
+        select(Candidate.id, Candidate.requisition_id, Candidate.stage)
+        .where(Candidate.id.in_(candidate_ids), Candidate.stage != stage)
+        .order_by(Candidate.id)
+        .with_for_update()
+    ).all()
+    moved = [row.id for row in current]
+    if moved:
+        db.execute(
+            update(Candidate)
+            .where(Candidate.id.in_(moved))
+            .values(stage=stage, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        deltas: Counter = Counter()
+        for row in current:
+            deltas[(row.requisition_id, row.stage)] -= 1
+            deltas[(row.requisition_id, stage)] += 1
+        apply_stage_deltas(db, deltas)
+    db.commit()
+    moved_ids = set(moved)
+    return CandidateStageResult(moved=moved, skipped=[i for i in candidate_ids if i not in moved_ids])
@@ -0,0 +1,97 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.config import settings
+from app.db.models.refresh_token import RefreshToken
+from app.db.models.user import User
+from app.db.models.user_role_link import UserRoleLink
+
+
+def hash_token(raw_token: str) -> str:
+    """Refresh tokens are 256-bit random values, so a fast hash is enough (no bcrypt)."""
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
+def issue_refresh_token(db: Session, user_id: int, family_id: Optional[str] = None) -> str:
+    """Adds a new refresh token to the caller's transaction and returns the raw token (no commit)."""
+    raw_token = secrets.token_urlsafe(32)
+    now = datetime.now(timezone.utc)
+    db.add(RefreshToken(
+        token_hash=hash_token(raw_token),
+        family_id=family_id or uuid.uuid4().hex,
+        user_id=user_id,
+        created_at=now,
+        expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    return raw_token
+
+
+def revoke_family(db: Session, family_id: str) -> None:
+    """Revokes every still-active token in a family (no commit)."""
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+def rotate_refresh_token(db: Session, raw_token: str) -> Optional[Tuple[str, str, List[str]]]:
+    """
+    Exchanges a refresh token for a new one and returns (new_raw_token, username, role_names).
+
+    Costs one indexed lookup (token, user and roles in a single query) and one conditional
+    UPDATE. Returns None for unknown, expired or reused tokens; reuse revokes the whole family.
+    """
+    statement = (
+        select(RefreshToken)
+        .where(RefreshToken.token_hash == hash_token(raw_token))
+        .options(joinedload(RefreshToken.user).joinedload(User.role_links).joinedload(UserRoleLink.role))
+    )
+    token = db.execute(statement).unique().scalars().first()
+    if token is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    if token.revoked_at is not None:
+        revoke_family(db, token.family_id)  # Reuse detected: the token was stolen or replayed
+        db.commit()
+        return None
+    if token.expires_at <= now or token.user is None or token.user.disabled:
+        return None
+
+    # Conditional revoke so two concurrent refreshes with the same token cannot both succeed
+    revoked = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == token.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if revoked.rowcount != 1:
+        revoke_family(db, token.family_id)
+        db.commit()
+        return None
+
+    # Read what the access token needs before commit expires the loaded objects
+    username = token.user.username
+    role_names = [link.role.name for link in token.user.role_links if link.role]
+    new_raw_token = issue_refresh_token(db, user_id=token.user_id, family_id=token.family_id)
+    db.commit()
+    return new_raw_token, username, role_names
+
+
+def revoke_refresh_token(db: Session, raw_token: str) -> bool:
+    """Revokes the token's whole family (logout). Returns False if the token is unknown."""
+    token = db.execute(
+        select(RefreshToken).where(RefreshToken.token_hash == hash_token(raw_token))
+    ).scalars().first()
+    if token is None:
+        return False
+    revoke_family(db, token.family_id)
+    db.commit()
+    return True
@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
+
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.jobs import enqueue
+from app.db.models.employee import Employee
+from app.db.models.review import Review, ReviewCycle, ReviewForm
+from app.schemas.review import (
+    ReviewCycleCreate, ReviewCycleStatus, ReviewFormCreate, ReviewScoreSummary, ReviewStatus, ReviewSubmit,
+)
+
+# --- Forms ---
+def get_review_form(db: Session, form_id: int) -> Optional[ReviewForm]:
+    return db.get(ReviewForm, form_id)
+
+def get_review_forms(db: Session, skip: int = 0, limit: int = 100) -> List[ReviewForm]:
+    return db.execute(select(ReviewForm).order_by(ReviewForm.id).offset(skip).limit(limit)).scalars().all()
+
+def create_review_form(db: Session, form_in: ReviewFormCreate) -> ReviewForm:
+    db_form = ReviewForm(**form_in.model_dump())
+    db.add(db_form)
+    db.commit()
+    db.refresh(db_form)
+    return db_form
+
+# --- Cycles ---
+def get_review_cycle(db: Session, cycle_id: int) -> Optional[ReviewCycle]:
+    return db.get(ReviewCycle, cycle_id)
+
+def get_review_cycles(db: Session, skip: int = 0, limit: int = 100) -> List[ReviewCycle]:
+    statement = select(ReviewCycle).order_by(ReviewCycle.period_start.desc(), ReviewCycle.id.desc())
+    return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+def create_review_cycle(db: Session, cycle_in: ReviewCycleCreate) -> ReviewCycle:
+    db_cycle = ReviewCycle(**cycle_in.model_dump(), created_at=datetime.now(timezone.utc))
+    db.add(db_cycle)
+    db.commit()
+    db.refresh(db_cycle)
+    return db_cycle
+
+def launch_review_cycle(db: Session, cycle: ReviewCycle) -> int:
+    """
+    Creates a PENDING review for every active employee hired by the end of the cycle, assigned to
+    their manager, with one INSERT ... SELECT. The work stays inside Postgres however many
+    employees there are; ON CONFLICT makes a repeated launch add only newly eligible employees.
+    Returns the number of reviews created.
+    """
+    status_type = Review.__table__.c.status.type
+    rows = (
+        select(
+            literal(cycle.id).label("cycle_id"),
+            Employee.id,
+            Employee.manager_id,
+            Employee.department_id,
+            Employee.branch_id,
+            literal(ReviewStatus.PENDING, status_type).label("status"),
+        )
+        .where(Employee.hire_date <= cycle.period_end, Employee.deleted_at.is_(None))
+    )
+    statement = (
+        pg_insert(Review)
+        .from_select(["cycle_id", "employee_id", "reviewer_id", "department_id", "branch_id", "status"], rows)
+        .on_conflict_do_nothing(constraint="uq_reviews_cycle_id_employee_id")
+    )
+    created = db.execute(statement).rowcount
+    db.execute(
+        update(ReviewCycle)
+        .where(ReviewCycle.id == cycle.id)
+        .values(
+            status=ReviewCycleStatus.OPEN,
+            launched_at=func.coalesce(ReviewCycle.launched_at, func.now()),
+            review_count=ReviewCycle.review_count + created,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    # Reviewer notifications fan out in the background, one job per launch
+    enqueue(db, "review.cycle_launched", {"cycle_id": cycle.id, "created": created})
+    db.commit()
+    return created
+
+def close_review_cycle(db: Session, cycle: ReviewCycle) -> ReviewCycle:
+    """Closes an open cycle: its reviews can no longer be submitted and it cannot be relaunched."""
+    cycle.status = ReviewCycleStatus.CLOSED
+    db.add(cycle)
+    db.commit()
+    db.refresh(cycle)
+    return cycle
+
+# --- Reviews ---
+def get_review(db: Session, review_id: int) -> Optional[Review]:
+    return db.get(Review, review_id)
+
+def get_reviews_for_reviewer(
+    db: Session,
+    reviewer_id: int,
+    cycle_id: Optional[int] = None,
+    status: Optional[ReviewStatus] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[Review]:
+    """A reviewer's inbox, served by the (reviewer_id, cycle_id, status) index."""
+    statement = select(Review).where(Review.reviewer_id == reviewer_id)
+    if cycle_id is not None:
+        statement = statement.where(Review.cycle_id == cycle_id)
+    if status is not None:
+        statement = statement.where(Review.status == status)
+    return db.execute(statement.order_by(Review.id).offset(skip).limit(limit)).scalars().all()
+
+def submit_review(db: Session, review: Review, form: ReviewForm, review_in: ReviewSubmit) -> Review:
+    """Stores the scores and their weighted average. Scores must cover exactly the form's criteria."""
+    weights = {criterion["key"]: criterion["weight"] for criterion in form.criteria}
+    if set(review_in.scores) != set(weights):
+        raise ValueError(f"Scores must be given for exactly these criteria: {sorted(weights)}")
+    if any(not 1 <= score <= form.scale_max for score in review_in.scores.values()):
+        raise ValueError(f"Scores must be between 1 and {form.scale_max}")
+    total_weight = sum(weights.values())
+    review.scores = dict(review_in.scores)
+    review.overall_score = round(sum(review_in.scores[key] * weight for key, weight in weights.items()) / total_weight, 3)
+    review.comments = review_in.comments
+    review.status = ReviewStatus.SUBMITTED
+    review.submitted_at = datetime.now(timezone.utc)
+    db.add(review)
+    db.commit()
+    db.refresh(review)
+    return review
+
+def get_score_summary(
+    db: Session,
+    cycle_id: int,
+    group_by: Literal["department", "branch"] = "department",
+) -> List[ReviewScoreSummary]:
+    """
+    Per-department or per-branch counts and score statistics for a cycle, aggregated by
+    Postgres in one GROUP BY rather than by loading every review.
+    """
+    group_column = Review.department_id if group_by == "department" else Review.branch_id
+    submitted = Review.status == ReviewStatus.SUBMITTED
+    statement = (
+        select(
+            group_column.label("group_id"),
+            func.count().label("reviews"),
+            func.count().filter(submitted).label("submitted"),
+            func.avg(Review.overall_score).label("average_score"),
+            func.percentile_cont(0.5).within_group(Review.overall_score).label("median_score"),
+            func.min(Review.overall_score).label("min_score"),
+            func.max(Review.overall_score).label("max_score"),
+        )
+        .where(Review.cycle_id == cycle_id)
+        .group_by(group_column)
+        .order_by(group_column)
+    )
+    summaries = []
+    for row in db.execute(statement).mappings():
+        summary = dict(row)
+        for key in ("average_score", "median_score"):  # numeric/double -> rounded float
+            if summary[key] is not None:
+                summary[key] = round(float(summary[key]), 3)
+        summaries.append(ReviewScoreSummary(**summary))
+    return summaries
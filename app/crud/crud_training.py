@@ -0,0 +1,223 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.models.employee import Employee
+from app.db.models.training import Course, Enrolment, TrainingSession
+from app.schemas.training import BulkEnrolmentResult, CourseCreate, EnrolmentStatus, TrainingSessionCreate
+
+# --- Courses ---
+def get_course(db: Session, course_id: int) -> Optional[Course]:
+    return db.get(Course, course_id)
+
+def get_courses(db: Session, skip: int = 0, limit: int = 100) -> List[Course]:
+    return db.execute(select(Course).order_by(Course.id).offset(skip).limit(limit)).scalars().all()
+
+def create_course(db: Session, course_in: CourseCreate) -> Course:
+    db_course = Course(**course_in.model_dump())
+    db.add(db_course)
+    db.commit()
+    db.refresh(db_course)
+    return db_course
+
+# --- Sessions ---
+def get_training_session(db: Session, session_id: int) -> Optional[TrainingSession]:
+    return db.get(TrainingSession, session_id)
+
+def get_training_sessions(
+    db: Session,
+    course_id: Optional[int] = None,
+    starts_after: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[TrainingSession]:
+    statement = select(TrainingSession)
+    if course_id is not None:
+        statement = statement.where(TrainingSession.course_id == course_id)
+    if starts_after is not None:
+        statement = statement.where(TrainingSession.starts_at >= starts_after)
+    statement = statement.order_by(TrainingSession.starts_at, TrainingSession.id)
+    return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+def create_training_session(db: Session, session_in: TrainingSessionCreate) -> TrainingSession:
+    db_session = TrainingSession(**session_in.model_dump(), seats_remaining=session_in.capacity)
+    db.add(db_session)
+    db.commit()
+    db.refresh(db_session)
+    return db_session
+
+# --- Seats ---
+def _take_seat(db: Session, session_id: int) -> bool:
+    """
+    Atomically claims one seat: `seats_remaining = seats_remaining - 1 WHERE seats_remaining > 0`.
+    Postgres evaluates the condition against the latest committed row under its row lock, so
+    concurrent bookers can never take the same last seat.
+    """
+    claimed = db.execute(
+        update(TrainingSession)
+        .where(TrainingSession.id == session_id, TrainingSession.seats_remaining > 0)
+        .values(seats_remaining=TrainingSession.seats_remaining - 1)
+        .returning(TrainingSession.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    return claimed is not None
+
+def _lock_session(db: Session, session_id: int) -> int:
+    """Row-locks the session and returns its free seats; serializes waitlist changes."""
+    return db.execute(
+        select(TrainingSession.seats_remaining).where(TrainingSession.id == session_id).with_for_update()
+    ).scalar_one()
+
+def fill_from_waitlist(db: Session, session_id: int) -> int:
+    """
+    Grants every free seat to the longest-waiting employees with one UPDATE and gives the seats
+    up in another. Runs inside the caller's transaction; returns the number of seats granted.
+    """
+    seats = _lock_session(db, session_id)
+    if seats <= 0:
+        return 0
+    head = (
+        select(Enrolment.id)
+        .where(Enrolment.session_id == session_id, Enrolment.status == EnrolmentStatus.WAITLISTED)
+        .order_by(Enrolment.requested_at, Enrolment.id)
+        .limit(seats)
+    )
+    granted = len(db.execute(
+        update(Enrolment)
+        .where(Enrolment.id.in_(head))
+        .values(status=EnrolmentStatus.ENROLLED)
+        .returning(Enrolment.id)
+        .execution_options(synchronize_session=False)
+    ).all())
+    if granted:
+        db.execute(
+            update(TrainingSession)
+            .where(TrainingSession.id == session_id)
+            .values(seats_remaining=TrainingSession.seats_remaining - granted)
+            .execution_options(synchronize_session=False)
+        )
+    return granted
+
+# --- Enrolments ---
+def get_enrolment(db: Session, enrolment_id: int) -> Optional[Enrolment]:
+    return db.get(Enrolment, enrolment_id)
+
+def get_enrolments(
+    db: Session,
+    session_id: int,
+    status: Optional[EnrolmentStatus] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[Enrolment]:
+    """A session's enrolments in booking order (the waitlist order for WAITLISTED)."""
+    statement = select(Enrolment).where(Enrolment.session_id == session_id)
+    if status is not None:
+        statement = statement.where(Enrolment.status == status)
+    statement = statement.order_by(Enrolment.requested_at, Enrolment.id)
+    return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+def get_enrolments_by_employee(db: Session, employee_id: int, skip: int = 0, limit: int = 100) -> List[Enrolment]:
+    statement = select(Enrolment).where(Enrolment.employee_id == employee_id).order_by(Enrolment.id.desc())
+    return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+def enrol(db: Session, session_id: int, employee_id: int) -> Optional[Enrolment]:
+    """
+    Books a seat for the employee, or a waitlist place when the session is full. The seat is
+    claimed with a conditional decrement and the enrolment row is written in the same
+    transaction, so a failed insert gives the seat back. Returns None if the employee already
+    holds a seat or waitlist place (a cancelled enrolment is reactivated).
+    """
+    got_seat = _take_seat(db, session_id)
+    if not got_seat:
+        # Lock the session before joining the waitlist: a cancellation that committed meanwhile has
+        # freed its seat (claim it), and one that follows will wait for us and see our waitlist row.
+        _lock_session(db, session_id)
+        got_seat = _take_seat(db, session_id)
+    statement = pg_insert(Enrolment).values(
+        session_id=session_id,
+        employee_id=employee_id,
+        status=EnrolmentStatus.ENROLLED if got_seat else EnrolmentStatus.WAITLISTED,
+        requested_at=datetime.now(timezone.utc),
+    )
+    statement = statement.on_conflict_do_update(
+        constraint="uq_enrolments_session_id_employee_id",
+        set_={"status": statement.excluded.status, "requested_at": statement.excluded.requested_at},
+        where=Enrolment.status == EnrolmentStatus.CANCELLED,
+    ).returning(Enrolment.id)
+    enrolment_id = db.execute(statement).scalar()
+    if enrolment_id is None:
+        db.rollback() # Already enrolled or waitlisted; releases the claimed seat
+        return None
+    db.commit()
+    return db.get(Enrolment, enrolment_id)
+
+def cancel_enrolment(db: Session, enrolment: Enrolment) -> Enrolment:
+    """Cancels an enrolment; a freed seat goes to the head of the waitlist in the same transaction."""
+    locked = db.execute(
+        select(Enrolment).where(Enrolment.id == enrolment.id).with_for_update().execution_options(populate_existing=True)
+    ).scalars().one()
+    if locked.status != EnrolmentStatus.CANCELLED:
+        freed_seat = locked.status == EnrolmentStatus.ENROLLED
+        locked.status = EnrolmentStatus.CANCELLED
+        db.flush()
+        if freed_seat:
+            db.execute(
+                update(TrainingSession)
+                .where(TrainingSession.id == locked.session_id)
+                .values(seats_remaining=TrainingSession.seats_remaining + 1)
+                .execution_options(synchronize_session=False)
+            )
+            fill_from_waitlist(db, locked.session_id)
+    db.commit()
+    db.refresh(locked)
+    return locked
+
+def bulk_enrol_department(
+    db: Session,
+    session_id: int,
+    department_id: int,
+    branch_id: Optional[int] = None,
+) -> BulkEnrolmentResult:
+    """
+    Enrols a whole department with one INSERT ... SELECT: everyone joins the waitlist (in employee
+    id order, behind anyone already waiting), then free seats are granted from the head of the
+    waitlist. Employees already holding a seat or place are left alone.
+    """
+    _lock_session(db, session_id) # Taken first, as in enrol(), so the two cannot deadlock
+    status_type = Enrolment.__table__.c.status.type
+    employees = (
+        select(
+            literal(session_id).label("session_id"),
+            Employee.id,
+            literal(EnrolmentStatus.WAITLISTED, status_type).label("status"),
+            # Same timestamp for the whole batch; the serial ids follow employee id order
+            func.now().label("requested_at"),
+        )
+        .where(Employee.department_id == department_id, Employee.deleted_at.is_(None))
+        .order_by(Employee.id)
+    )
+    if branch_id is not None:
+        employees = employees.where(Employee.branch_id == branch_id)
+    statement = pg_insert(Enrolment).from_select(["session_id", "employee_id", "status", "requested_at"], employees)
+    statement = statement.on_conflict_do_update(
+        constraint="uq_enrolments_session_id_employee_id",
+        set_={"status": statement.excluded.status, "requested_at": statement.excluded.requested_at},
+        where=Enrolment.status == EnrolmentStatus.CANCELLED,
+    )
+    added = db.execute(statement).rowcount
+    enrolled = fill_from_waitlist(db, session_id)
+    waitlisted = db.execute(
+        select(func.count())
+        .select_from(Enrolment)
+        .join(Employee, Employee.id == Enrolment.employee_id)
+        .where(
+            Enrolment.session_id == session_id,
+            Enrolment.status == EnrolmentStatus.WAITLISTED,
+            Employee.department_id == department_id,
+        )
+    ).scalar_one()
+    db.commit()
+    return BulkEnrolmentResult(session_id=session_id, added=added, enrolled=enrolled, waitlisted=waitlisted)
@@ -3,6 +3,7 @@ from sqlmodel import select # Keep select from sqlmodel
 from typing import List
 
 from app.db.models.role import Role
+from app.db.reference_cache import reference_cache
 from app.schemas.role import RoleCreate
 
 def get_role(db: Session, role_id: int) -> Role | None:
@@ -36,6 +37,7 @@ def create_role(db: Session, *, role_in: RoleCreate) -> Role:
     db.add(db_role)
     db.commit()
     db.refresh(db_role)
+    reference_cache.invalidate(Role)
     return db_role
 
 # TODO: Implement update_role and delete_role functions if needed
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session, joinedload  # Use SQLAlchemy Session type hint, Import joinedload
 from sqlmodel import select  # Keep select from sqlmodel
+from sqlalchemy import update
 from typing import List
 from fastapi import HTTPException, status  # Import HTTPException
 
@@ -7,27 +8,27 @@ from app.db.models.user import User
 from app.db.models.user_role_link import UserRoleLink  # Import link model
 from app.db.models.role import Role  # Import Role model for joinedload path
 from app.schemas.user import UserCreate, UserUpdate  # Import UserUpdate
-from app import crud  # Import crud module to access role CRUD
 from app.core.hashing import get_password_hash  # Import from new hashing module
+from app.db.reference_cache import reference_cache  # Cached role lookups by id
+from app.db.archive import archived_options, soft_delete
+from app.db.statements import statements  # Prebuilt hot lookups
 # Assume security functions exist for password hashing
 # from app.core.security import get_password_hash # Removed import from security
 
 
-def get_user(db: Session, user_id: int) -> User | None:
-    """Gets a single user by ID."""
-    user = db.get(User, user_id)
+def get_user(db: Session, user_id: int, include_archived: bool = False) -> User | None:
+    """Gets a single user by ID (deleted users only with include_archived)."""
+    user = db.get(User, user_id, execution_options=archived_options(include_archived))
     return user
 
 
-def get_user_by_username(db: Session, username: str) -> User | None:
-    """Gets a single user by username, eagerly loading roles."""
-    statement = (
-        select(User)
-        .where(User.username == username)
-        # Eagerly load roles through the link table
-        # .options(joinedload(User.role_links).joinedload(UserRoleLink.role))
-    )
-    result = db.execute(statement)
+def get_user_by_username(db: Session, username: str, include_archived: bool = False) -> User | None:
+    """
+    Gets a single user by username, eagerly loading roles. Deleted users cannot log in;
+    pass include_archived when checking whether a username is taken.
+    """
+    # Prebuilt statement (unscoped); see app.db.statements
+    result = statements.execute(db, "user_by_username", {"username": username}, **archived_options(include_archived))
     # Use unique().scalars().first() to handle potential duplicate User rows from joins
     user = result.unique().scalars().first()
     return user
@@ -37,7 +38,8 @@ def get_users(
     db: Session,
     skip: int = 0,
     limit: int = 100,
-    role_name: str | None = None  # Add optional role_name filter
+    role_name: str | None = None,  # Add optional role_name filter
+    include_archived: bool = False,
 ) -> List[User]:
     """Gets multiple users with pagination, optionally filtering by role name."""
     statement = select(User).distinct()  # Select distinct users
@@ -51,7 +53,8 @@ def get_users(
             .where(Role.name == role_name)  # Filter on Role.name
         )
 
-    statement = statement.offset(skip).limit(limit)  # Apply pagination
+    statement = statement.order_by(User.id).offset(skip).limit(limit)  # Apply pagination
+    statement = statement.execution_options(**archived_options(include_archived))
 
     result = db.execute(statement)
     users = result.scalars().all()
@@ -71,7 +74,7 @@ def create_user(db: Session, *, user_in: UserCreate) -> User:
     # Link roles if role_ids are provided
     if user_in.role_ids:
         for role_id in user_in.role_ids:
-            role = crud.role.get_role(db, role_id=role_id)
+            role = reference_cache.get_by_id(db, Role, role_id)
             if not role:
                 # Option 1: Raise error if a role ID is invalid
                 raise HTTPException(
@@ -115,7 +118,7 @@ def update_user(db: Session, *, user_id: int, user_in: UserUpdate) -> User | Non
         # Add new roles if provided
         if role_ids:
             for role_id in role_ids:
-                role = crud.role.get_role(db, role_id=role_id)
+                role = reference_cache.get_by_id(db, Role, role_id)
                 if not role:
                     # Consider how to handle invalid role IDs during update
                     # Option 1: Raise error (consistent with create)
@@ -140,15 +143,20 @@ def update_user(db: Session, *, user_id: int, user_in: UserUpdate) -> User | Non
     return db_user
 
 
+def update_password_hash(db: Session, *, user_id: int, hashed_password: str) -> None:
+    """Replaces a user's password hash (used to upgrade outdated hashes after a successful login)."""
+    db.execute(update(User).where(User.id == user_id).values(hashed_password=hashed_password))
+    db.commit()
+
+
 def delete_user(db: Session, *, user_id: int) -> User | None:
-    """Deletes a user."""
+    """Deletes a user: the account is disabled and archived, keeping its audit trail."""
     db_user = get_user(db, user_id=user_id)
     if not db_user:
         return None
-    db.delete(db_user)
+    soft_delete(db_user)
+    db_user.disabled = True
+    db.add(db_user)
     db.commit()
-    # The user object is expired after deletion, but we can return it
-    # if needed (e.g., to confirm which user was deleted).
-    # If returning the object, ensure relationships are handled or detached.
-    # For simplicity, let's return the object as it was before deletion.
+    # Return the archived user so the caller can confirm which account was removed
     return db_user
@@ -0,0 +1,155 @@
+"""
+Soft deletion and the archive tier.
+
+Employees, users and branches are not hard-deleted by the API: deleting one stamps `deleted_at`,
+and every ORM SELECT, UPDATE and DELETE on those models gets `deleted_at IS NULL` injected (the
+same mechanism as the branch scope in app.db.scoping) unless the statement opts in with
+`.execution_options(**INCLUDE_ARCHIVED)`. The indexes behind default listings are partial on
+`deleted_at IS NULL`, so terminated staff do not grow the pages hot queries touch.
+
+Leave history is the high-volume table. `archive_leave` moves closed requests that ended before
+a cutoff, and every request of an employee archived before it, into `leave_requests_archive`
+in batches, each batch one `DELETE ... RETURNING` feeding an INSERT in its own short transaction:
+
+    python -m app.db.archive leave                 # cutoff: ARCHIVE_LEAVE_AFTER_YEARS ago
+    python -m app.db.archive leave --years 5 --batch-size 10000
+
+Employee, user and branch rows themselves stay in place: payslips, reviews, enrolments, history
+and leave (live and archived) reference them by foreign key.
+"""
+import argparse
+from datetime import date, datetime, time, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.core.config import settings
+from app.db.models.branch import Branch
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest
+from app.db.models.user import User
+from app.db.scoping import PRESCOPED_OPTION
+from app.schemas.leave import LeaveStatus
+
+_INCLUDE_OPTION = "include_archived"
+
+# Execution options that also return soft-deleted rows for a single statement
+INCLUDE_ARCHIVED = {_INCLUDE_OPTION: True}
+
+SOFT_DELETE_MODELS = (Branch, Employee, User)
+
+# The same for every statement, so built once
+ACTIVE_CRITERIA = tuple(
+    with_loader_criteria(model, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+    for model in SOFT_DELETE_MODELS
+)
+
+# Leave in these states is final and may be archived once it is old enough
+CLOSED_LEAVE_STATUSES = (LeaveStatus.APPROVED, LeaveStatus.REJECTED)
+
+
+def archived_options(include_archived: bool) -> dict:
+    """Execution options for CRUD functions that take an `include_archived` flag."""
+    return INCLUDE_ARCHIVED if include_archived else {}
+
+
+def includes_archived(execution_options: dict) -> bool:
+    return bool(execution_options.get(_INCLUDE_OPTION))
+
+
+def soft_delete(obj) -> None:
+    """Marks an employee, user or branch as archived (the caller commits)."""
+    obj.deleted_at = datetime.now(timezone.utc)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_archived(execute_state: ORMExecuteState) -> None:
+    options = execute_state.execution_options
+    if options.get(_INCLUDE_OPTION) or options.get(PRESCOPED_OPTION):
+        return
+    # Column refreshes and relationship lazy loads follow from rows that were already visible
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if not (execute_state.is_select or execute_state.is_update or execute_state.is_delete):
+        return
+    execute_state.statement = execute_state.statement.options(*ACTIVE_CRITERIA)
+
+
+# --- Leave Archive ---
+def _archive_leave_statement():
+    columns = ", ".join(column.name for column in LeaveRequest.__table__.columns)
+    closed = ", ".join(f"'{status.name}'" for status in CLOSED_LEAVE_STATUSES)  # Enums are stored by name
+    return text(f"""
+        WITH moved AS (
+            DELETE FROM leave_requests
+            WHERE id IN (
+                SELECT l.id
+                FROM leave_requests AS l
+                JOIN employees AS e ON e.id = l.employee_id
+                WHERE (l.status IN ({closed}) AND l.end_date < :cutoff) OR e.deleted_at < :cutoff_at
+                ORDER BY l.id
+                LIMIT :batch_size
+                FOR UPDATE OF l SKIP LOCKED
+            )
+            RETURNING {columns}
+        )
+        INSERT INTO leave_requests_archive ({columns}, archived_at)
+        SELECT {columns}, now() FROM moved
+    """)
+
+
+def archive_leave(
+    engine: Engine,
+    cutoff: date,
+    batch_size: Optional[int] = None,
+    echo: Callable[[str], None] = lambda message: None,
+) -> int:
+    """
+    Moves archivable leave into leave_requests_archive, one committed batch at a time so locks
+    and WAL per transaction stay bounded and the API keeps running. Rows locked by concurrent
+    approvals are skipped and picked up next run. Returns the number of rows moved.
+    """
+    statement = _archive_leave_statement()
+    params = {
+        "cutoff": cutoff,
+        "cutoff_at": datetime.combine(cutoff, time.min, tzinfo=timezone.utc),
+        "batch_size": batch_size or settings.ARCHIVE_BATCH_SIZE,
+    }
+    total = 0
+    while True:
+        with engine.begin() as conn:
+            moved = conn.execute(statement, params).rowcount
+        if not moved:
+            return total
+        total += moved
+        echo(f"archived {total} leave requests")
+
+
+def default_cutoff(years: Optional[int] = None) -> date:
+    years = settings.ARCHIVE_LEAVE_AFTER_YEARS if years is None else years
+    today = date.today()
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:  # 29 February
+        return today.replace(year=today.year - years, day=28)
+
+
+def _main(argv: Optional[List[str]] = None) -> None:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Move old data to the archive tier")
+    commands = parser.add_subparsers(dest="command", required=True)
+    leave = commands.add_parser("leave", help="Archive closed and terminated employees' leave requests")
+    leave.add_argument("--years", type=int, default=None, help="Default: ARCHIVE_LEAVE_AFTER_YEARS")
+    leave.add_argument("--batch-size", type=int, default=None, help="Default: ARCHIVE_BATCH_SIZE")
+    args = parser.parse_args(argv)
+
+    cutoff = default_cutoff(args.years)
+    moved = archive_leave(engine, cutoff, batch_size=args.batch_size, echo=print)
+    print(f"Moved {moved} leave requests from before {cutoff} to leave_requests_archive")
+
+
+if __name__ == "__main__":
+    _main()
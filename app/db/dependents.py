@@ -0,0 +1,102 @@
+"""
+Set-based handling of the rows that reference a branch, department or position.
+
+Deleting a parent through the ORM would load every child collection to null out its foreign
+keys, one UPDATE per row. Instead, every referencing column is re-pointed with a single
+`UPDATE ... SET col = :new WHERE col = :old`, either to a replacement (reassign) or to NULL
+(detach), and the parent is removed with one DELETE. The foreign keys themselves are declared
+ON DELETE SET NULL (except live leave's branch while leave is partitioned by branch, which is
+RESTRICT), so a delete issued directly in SQL cannot strand rows either, and the relationships
+use passive_deletes so the ORM leaves that to the database.
+
+Besides foreign keys, the list covers the branch/department copies kept for scoping and grouping
+(leave, candidates, reviews). Point-in-time records (payslips, closed employee_history versions)
+keep the value they had, and so does live leave when detaching while leave is partitioned by
+branch (its branch_id is then NOT NULL; see app.db.partitioning).
+
+Employees and leave requests are moved with `RETURNING`, so the same transaction also records
+what changed the way the per-row write paths do: a change_log entry per row for the change feed,
+audit entries for the moved employees and users, and, for department and position moves, a new
+employee_history version from today (see `crud_employee_history.record_versions`).
+"""
+from datetime import date
+from typing import Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core import audit
+from app.crud import crud_employee_history
+from app.crud.crud_change_log import record_changes, values_snapshot
+from app.db.archive import INCLUDE_ARCHIVED
+from app.db.models.branch import Branch
+from app.db.models.department import Department
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest, LeaveRequestArchive
+from app.db.models.position import Position
+from app.db.models.recruitment import Candidate, Requisition
+from app.db.models.review import Review
+from app.db.models.user import User
+from app.db.partitioning import leave_branch_required
+from app.db.scoping import UNSCOPED
+
+DEPENDENT_COLUMNS = {
+    Branch: (
+        Employee.__table__.c.branch_id,
+        User.__table__.c.branch_id,
+        LeaveRequest.__table__.c.branch_id,
+        LeaveRequestArchive.__table__.c.branch_id,
+        Requisition.__table__.c.branch_id,
+        Candidate.__table__.c.branch_id,
+        Review.__table__.c.branch_id,
+    ),
+    Department: (
+        Employee.__table__.c.department_id,
+        Requisition.__table__.c.department_id,
+        Review.__table__.c.department_id,
+    ),
+    Position: (
+        Employee.__table__.c.position_id,
+        Requisition.__table__.c.position_id,
+    ),
+}
+
+# Tables published on the change feed, and those whose moves are audited, by entity type
+CHANGE_FEED_TABLES = {Employee.__table__: "employee", LeaveRequest.__table__: "leave_request"}
+AUDITED_TABLES = {Employee.__table__: "employee", User.__table__: "user"}
+
+
+def move_dependents(db: Session, model, old_id: int, new_id: Optional[int]) -> Dict[str, int]:
+    """
+    Re-points every row referencing `model` row `old_id` to `new_id` (None detaches), one UPDATE
+    per column, across all branches and including archived rows, and records the moves (see the
+    module docstring). Runs inside the caller's transaction; returns the affected row count per
+    "table.column".
+    """
+    affected = {}
+    for column in DEPENDENT_COLUMNS[model]:
+        if new_id is None and column is LeaveRequest.__table__.c.branch_id and leave_branch_required():
+            continue
+        table = column.table
+        statement = (
+            update(table)
+            .where(column == old_id)
+            .values({column.name: new_id})
+            .execution_options(**UNSCOPED, **INCLUDE_ARCHIVED)
+        )
+        if table not in CHANGE_FEED_TABLES and table not in AUDITED_TABLES:
+            affected[f"{table.name}.{column.name}"] = db.execute(statement).rowcount
+            continue
+
+        returned = table.c if table in CHANGE_FEED_TABLES else (table.c.id,) # Snapshots only for the feed
+        rows = db.execute(statement.returning(*returned)).mappings().all()
+        affected[f"{table.name}.{column.name}"] = len(rows)
+        if table in CHANGE_FEED_TABLES:
+            record_changes(db, CHANGE_FEED_TABLES[table], "update", [(row["id"], values_snapshot(row)) for row in rows])
+        if table in AUDITED_TABLES:
+            audit.stage(db, [
+                audit.make_entry(AUDITED_TABLES[table], row["id"], column.name, old_id, new_id) for row in rows
+            ])
+        if column.name in crud_employee_history.TRACKED_FIELDS and table is Employee.__table__:
+            crud_employee_history.record_versions(db, [row["id"] for row in rows], date.today())
+    return affected
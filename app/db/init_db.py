@@ -3,12 +3,19 @@ from app.db.session import engine  # Local imports
 # Import all models so SQLModel discovers them
 from app.db.models import (
     employee, leave, department,
-    position, role, user, user_role_link
+    position, role, user, user_role_link,
+    branch, job, audit, change_log, refresh_token,
+    payroll, employee_history, review, recruitment, training
 )
 from app.db.models.user import User
 from app.db.models.role import Role
 from app.db.models.user_role_link import UserRoleLink
 from app.core.hashing import get_password_hash
+from app.core.audit import ensure_audit_partitions
+from app.core.config import settings
+from app.db.partitioning import migrate_leave_requests
+from app.db.migrations import upgrade
+from datetime import date
 
 
 def init_db():
@@ -16,6 +23,16 @@ def init_db():
     print("Creating database tables...")
     SQLModel.metadata.create_all(engine) # Use SQLModel's metadata
     print("Database tables created successfully")
+
+    # Bring existing tables up to date (revisions are idempotent, so a fresh database just records them)
+    upgrade(engine)
+
+    # Create this month's audit partition up front (later months are created on demand)
+    with engine.begin() as conn:
+        ensure_audit_partitions(conn, [date.today()])
+        # Optional: convert leave_requests to its partitioned layout (no-op once done)
+        if settings.LEAVE_PARTITION_STRATEGY:
+            migrate_leave_requests(conn, settings.LEAVE_PARTITION_STRATEGY)
     
     with Session(engine) as session:
         # Create system role if it doesn't exist
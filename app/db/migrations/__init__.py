@@ -0,0 +1,254 @@
+"""
+Versioned schema migrations.
+
+`create_all` only creates missing tables; every change to an existing table is a revision module
+in `app/db/migrations/versions/` (named `v<NNNN>_<slug>.py`) defining:
+
+    revision = "0002"
+    description = "What the revision does"
+    operations = [CreateTable(...), Sql(...), CreateIndex(...), Backfill(...), DropIndex(...)]
+
+Operations must be idempotent: a revision is recorded in `schema_migrations` only after all of
+its operations succeed, so a failed run simply resumes. Index builds use CONCURRENTLY and
+backfills commit in small batches, so neither blocks application traffic for long.
+
+    python -m app.db.migrations status
+    python -m app.db.migrations upgrade --dry-run   # print the plan without executing it
+    python -m app.db.migrations upgrade [--target 0002]
+"""
+import importlib
+import logging
+import pkgutil
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Set
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Echo = Callable[[str], None]
+
+
+def _set_lock_timeout(conn: Connection) -> None:
+    conn.execute(text(f"SET LOCAL lock_timeout = '{int(settings.MIGRATION_LOCK_TIMEOUT_SECONDS * 1000)}ms'"))
+
+
+# --- Operations ---
+class Operation(ABC):
+    @abstractmethod
+    def plan(self) -> List[str]:
+        """SQL (or a description of it) printed by --dry-run."""
+
+    @abstractmethod
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        """Runs the operation; must be safe to repeat."""
+
+
+class CreateTable(Operation):
+    """Creates a model's table with its indexes, as `create_all` would, if it does not exist yet."""
+
+    def __init__(self, model):
+        self.table = model.__table__
+
+    def plan(self) -> List[str]:
+        return [f"CREATE TABLE IF NOT EXISTS {self.table.name} (... as declared on the model, with its indexes)"]
+
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        with engine.begin() as conn:
+            self.table.create(conn, checkfirst=True)
+
+
+class Sql(Operation):
+    """One or more statements run in a single transaction with a short lock timeout."""
+
+    def __init__(self, *statements: str):
+        self.statements = statements
+
+    def plan(self) -> List[str]:
+        return list(self.statements)
+
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        with engine.begin() as conn:
+            _set_lock_timeout(conn)
+            for statement in self.statements:
+                conn.execute(text(statement))
+
+
+def _index_state(conn: Connection, name: str) -> Optional[bool]:
+    """None if the index does not exist, otherwise whether it is valid."""
+    return conn.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar()
+
+
+class CreateIndex(Operation):
+    """CREATE INDEX CONCURRENTLY; an invalid leftover from an interrupted build is dropped first."""
+
+    def __init__(self, name: str, table: str, columns: Sequence[str], where: Optional[str] = None, unique: bool = False):
+        self.name = name
+        self.table = table
+        self.columns = columns
+        self.where = where
+        self.unique = unique
+
+    def _statement(self) -> str:
+        statement = (
+            f"CREATE {'UNIQUE ' if self.unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {self.name} "
+            f"ON {self.table} ({', '.join(self.columns)})"
+        )
+        return statement + (f" WHERE {self.where}" if self.where else "")
+
+    def plan(self) -> List[str]:
+        return [self._statement()]
+
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        # CONCURRENTLY cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            state = _index_state(conn, self.name)
+            if state:
+                return
+            if state is False:
+                echo(f"  dropping invalid index {self.name} left by an interrupted build")
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {self.name}"))
+            conn.execute(text(self._statement()))
+
+
+class DropIndex(Operation):
+    def __init__(self, name: str):
+        self.name = name
+
+    def plan(self) -> List[str]:
+        return [f"DROP INDEX CONCURRENTLY IF EXISTS {self.name}"]
+
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(self.plan()[0]))
+
+
+class Backfill(Operation):
+    """
+    UPDATE in key order, one short transaction per batch of `batch_size` keys:
+
+        UPDATE <table> AS target SET <assignments> [FROM <from_>]
+        WHERE target.<key> > :after AND target.<key> <= :upto AND (<where>)
+
+    Row locks are held for one batch only, and a crash resumes from the start harmlessly as long
+    as `where` excludes rows that are already done.
+    """
+
+    def __init__(self, table: str, assignments: str, where: str = "TRUE", from_: Optional[str] = None,
+                 key: str = "id", batch_size: Optional[int] = None, pause_seconds: float = 0.0):
+        self.table = table
+        self.assignments = assignments
+        self.where = where
+        self.from_ = from_
+        self.key = key
+        self.batch_size = batch_size or settings.MIGRATION_BACKFILL_BATCH_SIZE
+        self.pause_seconds = pause_seconds
+
+    def _statement(self) -> str:
+        return (
+            f"UPDATE {self.table} AS target SET {self.assignments}"
+            + (f" FROM {self.from_}" if self.from_ else "")
+            + f" WHERE target.{self.key} > :after AND target.{self.key} <= :upto AND ({self.where})"
+        )
+
+    def plan(self) -> List[str]:
+        return [f"{self._statement()}  -- repeated in batches of {self.batch_size} keys"]
+
+    def apply(self, engine: Engine, echo: Echo) -> None:
+        next_upper_bound = text(
+            f"SELECT max({self.key}) FROM (SELECT {self.key} FROM {self.table} WHERE {self.key} > :after "
+            f"ORDER BY {self.key} LIMIT :limit) AS batch"
+        )
+        statement = text(self._statement())
+        after, updated = None, 0
+        while True:
+            with engine.begin() as conn:
+                _set_lock_timeout(conn)
+                if after is None:
+                    after = conn.execute(text(f"SELECT min({self.key}) - 1 FROM {self.table}")).scalar()
+                    if after is None:  # Empty table
+                        return
+                upto = conn.execute(next_upper_bound, {"after": after, "limit": self.batch_size}).scalar()
+                if upto is None:
+                    break
+                updated += conn.execute(statement, {"after": after, "upto": upto}).rowcount
+            after = upto
+            if self.pause_seconds:
+                time.sleep(self.pause_seconds)
+        echo(f"  backfilled {updated} rows in {self.table}")
+
+
+# --- Revisions ---
+@dataclass
+class Revision:
+    revision: str
+    description: str
+    operations: List[Operation]
+
+
+def load_revisions() -> List[Revision]:
+    from app.db.migrations import versions
+
+    revisions: List[Revision] = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        revisions.append(Revision(module.revision, module.description, list(module.operations)))
+    revisions.sort(key=lambda r: r.revision)
+    ids = [r.revision for r in revisions]
+    if len(ids) != len(set(ids)):
+        raise RuntimeError(f"Duplicate migration revisions: {ids}")
+    return revisions
+
+
+def _ensure_version_table(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "revision VARCHAR(32) PRIMARY KEY, description TEXT NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+        ))
+
+
+def applied_revisions(engine: Engine) -> Set[str]:
+    _ensure_version_table(engine)
+    with engine.connect() as conn:
+        return set(conn.execute(text("SELECT revision FROM schema_migrations")).scalars())
+
+
+def pending_revisions(engine: Engine, target: Optional[str] = None) -> List[Revision]:
+    applied = applied_revisions(engine)
+    return [
+        r for r in load_revisions()
+        if r.revision not in applied and (target is None or r.revision <= target)
+    ]
+
+
+def upgrade(engine: Engine, target: Optional[str] = None, dry_run: bool = False, echo: Echo = print) -> List[str]:
+    """Applies (or with dry_run, prints) pending revisions up to `target`. Returns their ids."""
+    pending = pending_revisions(engine, target)
+    for revision in pending:
+        echo(f"{'Would apply' if dry_run else 'Applying'} {revision.revision}: {revision.description}")
+        for operation in revision.operations:
+            for statement in operation.plan():
+                echo(f"  {statement}")
+            if not dry_run:
+                started = time.monotonic()
+                operation.apply(engine, echo)
+                logger.info("Migration %s: %s took %.2fs", revision.revision, type(operation).__name__,
+                            time.monotonic() - started)
+        if not dry_run:
+            with engine.begin() as conn:
+                conn.execute(
+                    text("INSERT INTO schema_migrations (revision, description) VALUES (:revision, :description)"),
+                    {"revision": revision.revision, "description": revision.description},
+                )
+    if not pending:
+        echo("Schema is up to date")
+    return [r.revision for r in pending]
@@ -0,0 +1,28 @@
+import argparse
+import logging
+
+from app.db.migrations import applied_revisions, load_revisions, upgrade
+from app.db.session import engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply versioned schema migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="List revisions and whether they are applied")
+    upgrade_parser = commands.add_parser("upgrade", help="Apply pending revisions")
+    upgrade_parser.add_argument("--target", help="Stop after this revision")
+    upgrade_parser.add_argument("--dry-run", action="store_true", help="Print the plan without executing it")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        applied = applied_revisions(engine)
+        for revision in load_revisions():
+            state = "applied" if revision.revision in applied else "pending"
+            print(f"{revision.revision}  {state:8}  {revision.description}")
+    else:
+        upgrade(engine, target=args.target, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1 @@
+# Revision modules are discovered automatically; name them v<NNNN>_<slug>.py
@@ -0,0 +1,20 @@
+"""Denormalised leave branch and branch-leading indexes for branch scoping."""
+from app.db.migrations import Backfill, CreateIndex, DropIndex, Sql
+
+revision = "0001"
+description = "Add leave_requests.branch_id and branch-leading indexes"
+
+operations = [
+    Sql("ALTER TABLE leave_requests ADD COLUMN IF NOT EXISTS branch_id INTEGER REFERENCES branches (id)"),
+    Backfill(
+        "leave_requests",
+        "branch_id = e.branch_id",
+        from_="employees AS e",
+        where="e.id = target.employee_id AND target.branch_id IS NULL AND e.branch_id IS NOT NULL",
+    ),
+    CreateIndex("ix_leave_requests_branch_id_status_start_date", "leave_requests", ["branch_id", "status", "start_date"]),
+    CreateIndex("ix_employees_branch_id_id", "employees", ["branch_id", "id"]),
+    CreateIndex("ix_users_branch_id_id", "users", ["branch_id", "id"]),
+    DropIndex("ix_employees_branch_id"),
+    DropIndex("ix_users_branch_id"),
+]
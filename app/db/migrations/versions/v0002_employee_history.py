@@ -0,0 +1,16 @@
+"""Temporal salary/position/department history, seeded with each employee's current values."""
+from app.db.migrations import CreateTable, Sql
+from app.db.models.employee_history import EmployeeHistory
+
+revision = "0002"
+description = "Create employee_history and seed it from employees"
+
+operations = [
+    CreateTable(EmployeeHistory),
+    # Values before this revision are unknown, so the current ones are assumed since hire
+    Sql(
+        "INSERT INTO employee_history (employee_id, salary, position_id, department_id, valid_from) "
+        "SELECT e.id, e.salary, e.position_id, e.department_id, e.hire_date FROM employees AS e "
+        "WHERE NOT EXISTS (SELECT 1 FROM employee_history AS h WHERE h.employee_id = e.id)"
+    ),
+]
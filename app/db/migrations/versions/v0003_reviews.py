@@ -0,0 +1,14 @@
+"""Line managers on employees and the performance review tables."""
+from app.db.migrations import CreateIndex, CreateTable, Sql
+from app.db.models.review import Review, ReviewCycle, ReviewForm
+
+revision = "0003"
+description = "Add employees.manager_id and review forms, cycles and reviews"
+
+operations = [
+    Sql("ALTER TABLE employees ADD COLUMN IF NOT EXISTS manager_id INTEGER REFERENCES employees (id)"),
+    CreateIndex("ix_employees_manager_id", "employees", ["manager_id"]),
+    CreateTable(ReviewForm),
+    CreateTable(ReviewCycle),
+    CreateTable(Review),
+]
@@ -0,0 +1,12 @@
+"""Recruitment requisitions, candidates and the cached per-stage candidate counts."""
+from app.db.migrations import CreateTable
+from app.db.models.recruitment import Candidate, Requisition, RequisitionStageCount
+
+revision = "0004"
+description = "Add requisitions, candidates and requisition_stage_counts"
+
+operations = [
+    CreateTable(Requisition),
+    CreateTable(Candidate),
+    CreateTable(RequisitionStageCount),
+]
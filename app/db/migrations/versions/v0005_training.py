@@ -0,0 +1,12 @@
+"""Training courses, sessions with seat counters, and enrolments."""
+from app.db.migrations import CreateTable
+from app.db.models.training import Course, Enrolment, TrainingSession
+
+revision = "0005"
+description = "Add courses, training_sessions and enrolments"
+
+operations = [
+    CreateTable(Course),
+    CreateTable(TrainingSession),
+    CreateTable(Enrolment),
+]
@@ -0,0 +1,21 @@
+"""Soft deletion for employees, users and branches, active-set partial indexes and the leave archive."""
+from app.db.migrations import CreateIndex, CreateTable, DropIndex, Sql
+from app.db.models.leave import LeaveRequestArchive
+
+revision = "0006"
+description = "Add deleted_at, partial active-set indexes and leave_requests_archive"
+
+operations = [
+    Sql(
+        "ALTER TABLE employees ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE",
+        "ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE",
+        "ALTER TABLE branches ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP WITH TIME ZONE",
+    ),
+    CreateIndex("ix_employees_active_id", "employees", ["id"], where="deleted_at IS NULL"),
+    CreateIndex("ix_employees_active_branch_id_id", "employees", ["branch_id", "id"], where="deleted_at IS NULL"),
+    CreateIndex("ix_users_active_id", "users", ["id"], where="deleted_at IS NULL"),
+    CreateIndex("ix_users_active_branch_id_id", "users", ["branch_id", "id"], where="deleted_at IS NULL"),
+    DropIndex("ix_employees_branch_id_id"),
+    DropIndex("ix_users_branch_id_id"),
+    CreateTable(LeaveRequestArchive),
+]
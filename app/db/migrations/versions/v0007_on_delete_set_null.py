@@ -0,0 +1,36 @@
+"""ON DELETE SET NULL on every foreign key to branches, departments and positions."""
+from app.db.migrations import Sql
+from app.db.partitioning import leave_branch_required
+
+
+def _set_null(table: str, column: str, target: str, validate_separately: bool = True) -> list:
+    """
+    Swaps the foreign key for an ON DELETE SET NULL one. The new constraint is added NOT VALID
+    (a brief lock, no scan) and validated in a second step that does not block writes.
+    Partitioned tables do not support NOT VALID foreign keys, so those are validated inline.
+    """
+    name = f"{table}_{column}_fkey"
+    add = (
+        f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}, "
+        f"ADD CONSTRAINT {name} FOREIGN KEY ({column}) REFERENCES {target} (id) ON DELETE SET NULL"
+    )
+    if not validate_separately:
+        return [Sql(add)]
+    return [Sql(add + " NOT VALID"), Sql(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")]
+
+
+revision = "0007"
+description = "Make foreign keys to branches, departments and positions ON DELETE SET NULL"
+
+operations = [
+    *_set_null("employees", "branch_id", "branches"),
+    *_set_null("employees", "department_id", "departments"),
+    *_set_null("employees", "position_id", "positions"),
+    *_set_null("users", "branch_id", "branches"),
+    # May be partitioned; when partitioned by branch, branch_id is NOT NULL and its key stays ON DELETE RESTRICT
+    *([] if leave_branch_required() else _set_null("leave_requests", "branch_id", "branches", validate_separately=False)),
+    *_set_null("leave_requests_archive", "branch_id", "branches"),
+    *_set_null("requisitions", "branch_id", "branches"),
+    *_set_null("requisitions", "department_id", "departments"),
+    *_set_null("requisitions", "position_id", "positions"),
+]
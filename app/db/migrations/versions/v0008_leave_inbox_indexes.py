@@ -0,0 +1,16 @@
+"""Inbox indexes on leave_requests for databases created before they were declared on the model."""
+from app.db.migrations import CreateIndex, DropIndex
+
+revision = "0008"
+description = "Add the leave inbox indexes and drop the single-column employee_id index"
+
+operations = [
+    CreateIndex("ix_leave_requests_employee_id_start_date", "leave_requests", ["employee_id", "start_date"]),
+    CreateIndex("ix_leave_requests_status_start_date", "leave_requests", ["status", "start_date"]),
+    CreateIndex(
+        "ix_leave_requests_pending_start_date", "leave_requests", ["start_date", "employee_id"],
+        where="status = 'PENDING'", # Enums are stored by name
+    ),
+    # Covered by the leading column of ix_leave_requests_employee_id_start_date
+    DropIndex("ix_leave_requests_employee_id"),
+]
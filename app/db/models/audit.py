@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class AuditLog(SQLModel, table=True):
+    """
+    Append-only audit trail, range-partitioned by month on `occurred_at`.
+
+    The primary key includes the partition key, as Postgres requires. Monthly partitions are
+    created on demand by `app.core.audit.ensure_audit_partitions` (see app.db.partitioning).
+    """
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        # Entity history lookups ("what happened to employee 42?")
+        Index("ix_audit_log_entity_occurred_at", "entity_type", "entity_id", "occurred_at", "id"),
+        # Time-range scans in keyset order
+        Index("ix_audit_log_occurred_at_id", "occurred_at", "id"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    occurred_at: datetime = Field(sa_column=Column(DateTime(timezone=True), primary_key=True, nullable=False))
+    entity_type: str = Field(max_length=50)
+    entity_id: int
+    field: str = Field(max_length=50)
+    old_value: Any | None = Field(default=None, sa_column=Column(JSONB))
+    new_value: Any | None = Field(default=None, sa_column=Column(JSONB))
+    actor_user_id: int | None = Field(default=None)
+
+    def __repr__(self):
+        return f"<AuditLog(id={self.id}, entity='{self.entity_type}:{self.entity_id}', field='{self.field}')>"
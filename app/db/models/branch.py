@@ -1,4 +1,6 @@
+from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import Column, DateTime
 from sqlmodel import Field, Relationship, SQLModel
 
 # Forward references for relationships
@@ -14,10 +16,12 @@ class Branch(SQLModel, table=True):
     name: str = Field(index=True, unique=True, max_length=100) # Added unique and max_length
     address: str | None = Field(default=None, max_length=255) # Added max_length
     is_active: bool = Field(default=True)
+    deleted_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True))) # Soft delete
 
     # Relationships: One Branch can have many Employees and Users
-    employees: List["Employee"] = Relationship(back_populates="branch")
-    users: List["User"] = Relationship(back_populates="branch")
+    # passive_deletes: the ON DELETE SET NULL foreign keys handle children, so the ORM never loads them to delete
+    employees: List["Employee"] = Relationship(back_populates="branch", passive_deletes=True)
+    users: List["User"] = Relationship(back_populates="branch", passive_deletes=True)
 
     def __repr__(self):
         return f"<Branch(id={self.id}, name='{self.name}')>"
\ No newline at end of file
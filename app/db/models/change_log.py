@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class ChangeLogEntry(SQLModel, table=True):
+    """
+    Row-level change feed written in the same transaction as the change itself.
+
+    Entries are ordered by (txid, id). `txid` is the writing transaction's ID, which lets the
+    feed hold back rows until every older transaction has finished, so a consumer never skips
+    a change that commits late.
+    """
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_txid_id", "txid", "id"),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    txid: int | None = Field(
+        default=None,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("(pg_current_xact_id()::text)::bigint")),
+    )
+    entity_type: str = Field(max_length=50)
+    entity_id: int
+    operation: str = Field(max_length=10) # insert / update / delete
+    changed_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    )
+    data: Any | None = Field(default=None, sa_column=Column(JSONB)) # Row snapshot after the change
+
+    def __repr__(self):
+        return f"<ChangeLogEntry(id={self.id}, entity='{self.entity_type}:{self.entity_id}', op='{self.operation}')>"
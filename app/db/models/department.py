@@ -16,7 +16,7 @@ class Department(SQLModel, table=True):
     description: str | None = Field(default=None, max_length=255)
 
     # Relationship to Employee (one-to-many)
-    employees: List["Employee"] = Relationship(back_populates="department")
+    employees: List["Employee"] = Relationship(back_populates="department", passive_deletes=True) # ON DELETE SET NULL
 
     def __repr__(self):
         return f"<Department(id={self.id}, name='{self.name}')>"
\ No newline at end of file
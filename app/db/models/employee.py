@@ -1,6 +1,7 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 
+from sqlalchemy import Column, DateTime, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 # Forward references for relationships
@@ -15,6 +16,12 @@ if TYPE_CHECKING:
 
 class Employee(SQLModel, table=True):
     __tablename__ = "employees"
+    __table_args__ = (
+        # Default listings only see the active set; these stay small however many staff are archived
+        Index("ix_employees_active_id", "id", postgresql_where=text("deleted_at IS NULL")),
+        # Branch-scoped listings: equality on branch_id, paginated by id
+        Index("ix_employees_active_branch_id_id", "branch_id", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: int | None = Field(default=None, primary_key=True, index=True)
     first_name: str = Field(max_length=50)
@@ -26,11 +33,14 @@ class Employee(SQLModel, table=True):
     salary: float | None = Field(default=None)
 
     # Foreign Keys
-    position_id: int | None = Field(default=None, foreign_key="positions.id", index=True)
-    department_id: int | None = Field(default=None, foreign_key="departments.id", index=True)
+    position_id: int | None = Field(default=None, foreign_key="positions.id", ondelete="SET NULL", index=True)
+    department_id: int | None = Field(default=None, foreign_key="departments.id", ondelete="SET NULL", index=True)
     user_id: int | None = Field(default=None, foreign_key="users.id", index=True, nullable=True) # Foreign key to User
 
-    branch_id: int | None = Field(default=None, foreign_key="branches.id", index=True) # <-- Add branch_id FK
+    branch_id: int | None = Field(default=None, foreign_key="branches.id", ondelete="SET NULL") # Indexed via ix_employees_active_branch_id_id
+    manager_id: int | None = Field(default=None, foreign_key="employees.id", index=True) # Reviewer/approver
+    # Set when the employee is terminated; archived rows are hidden from default queries (see app.db.archive)
+    deleted_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
 
     # Relationships
     position: Optional["Position"] = Relationship(back_populates="employees") # Assuming 'employees' in Position model
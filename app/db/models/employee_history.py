@@ -0,0 +1,34 @@
+from datetime import date
+
+from sqlalchemy import Index, text
+from sqlmodel import Field, SQLModel
+
+
+class EmployeeHistory(SQLModel, table=True):
+    """
+    Temporal record of an employee's salary, position and department.
+
+    Each row is valid over [valid_from, valid_to); the open row (valid_to NULL) is the current
+    version. Rows are maintained by the employee write path in `app.crud.crud_employee_history`.
+    `employee_id` is not a foreign key so history survives the employee's deletion.
+    """
+    __tablename__ = "employee_history"
+    __table_args__ = (
+        # Point-in-time lookup for one employee: latest version starting on or before the date
+        Index("ix_employee_history_employee_id_valid_from", "employee_id", "valid_from"),
+        # At most one open version per employee
+        Index("ix_employee_history_current", "employee_id", unique=True, postgresql_where=text("valid_to IS NULL")),
+        # Whole-company snapshots: validity range contains the date
+        Index("ix_employee_history_validity", text("daterange(valid_from, valid_to, '[)')"), postgresql_using="gist"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    employee_id: int
+    salary: float | None = Field(default=None)
+    position_id: int | None = Field(default=None)
+    department_id: int | None = Field(default=None)
+    valid_from: date
+    valid_to: date | None = Field(default=None) # Exclusive; NULL while current
+
+    def __repr__(self):
+        return f"<EmployeeHistory(employee_id={self.employee_id}, {self.valid_from}..{self.valid_to})>"
@@ -1,5 +1,6 @@
-from datetime import date
+from datetime import date, datetime
 
+from sqlalchemy import Column, DateTime, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.schemas.leave import LeaveStatus # Import the Enum from schema
@@ -12,6 +13,19 @@ if TYPE_CHECKING:
 
 class LeaveRequest(SQLModel, table=True):
     __tablename__ = "leave_requests"
+    __table_args__ = (
+        # "My requests" inbox: filter by employee, newest first
+        Index("ix_leave_requests_employee_id_start_date", "employee_id", "start_date"),
+        # Manager views filtered by status and date range
+        Index("ix_leave_requests_status_start_date", "status", "start_date"),
+        # Branch-scoped manager views touch only their own branch's rows
+        Index("ix_leave_requests_branch_id_status_start_date", "branch_id", "status", "start_date"),
+        # Pending requests are a tiny, hot subset of the full history
+        Index(
+            "ix_leave_requests_pending_start_date", "start_date", "employee_id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True, index=True)
     start_date: date
@@ -20,7 +34,9 @@ class LeaveRequest(SQLModel, table=True):
     status: LeaveStatus = Field(default=LeaveStatus.PENDING)
 
     # Foreign Key
-    employee_id: int = Field(foreign_key="employees.id", index=True)
+    employee_id: int = Field(foreign_key="employees.id") # Indexed via ix_leave_requests_employee_id_start_date
+    # Copied from the employee so branch-scoped queries need no join (kept in sync by crud_employee)
+    branch_id: int | None = Field(default=None, foreign_key="branches.id", ondelete="SET NULL") # Indexed via ix_leave_requests_branch_id_status_start_date
 
     # Relationship back to Employee
     employee: "Employee" = Relationship(back_populates="leave_requests")
@@ -28,6 +44,29 @@ class LeaveRequest(SQLModel, table=True):
     def __repr__(self):
         return f"<LeaveRequest(id={self.id}, employee_id={self.employee_id}, status='{self.status}')>"
 
+
+class LeaveRequestArchive(SQLModel, table=True):
+    """
+    Cold tier for leave history, filled in batches by `app.db.archive.archive_leave`. Same columns
+    as leave_requests (ids are kept) plus when the row was moved; never read by default queries.
+    """
+    __tablename__ = "leave_requests_archive"
+    __table_args__ = (
+        Index("ix_leave_requests_archive_employee_id_start_date", "employee_id", "start_date"),
+    )
+
+    id: int = Field(primary_key=True)
+    start_date: date
+    end_date: date
+    reason: str | None = Field(default=None)
+    status: LeaveStatus
+    employee_id: int = Field(foreign_key="employees.id")
+    branch_id: int | None = Field(default=None, foreign_key="branches.id", ondelete="SET NULL")
+    archived_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+
+    def __repr__(self):
+        return f"<LeaveRequestArchive(id={self.id}, employee_id={self.employee_id}, status='{self.status}')>"
+
 # Ensure the related Employee model (app/db/models/employee.py) has:
 # from typing import List
 # ...
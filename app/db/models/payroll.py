@@ -0,0 +1,52 @@
+from datetime import date, datetime
+
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class PayrollRun(SQLModel, table=True):
+    """One computed pay period; its payslips are written in bulk by `app.core.payroll.run_payroll`."""
+    __tablename__ = "payroll_runs"
+    __table_args__ = (
+        UniqueConstraint("period_start", "period_end", name="uq_payroll_runs_period"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    period_start: date
+    period_end: date
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    employee_count: int = Field(default=0)
+    total_gross: float = Field(default=0.0)
+    total_deductions: float = Field(default=0.0)
+    total_net: float = Field(default=0.0)
+    duration_seconds: float = Field(default=0.0)
+
+    def __repr__(self):
+        return f"<PayrollRun(id={self.id}, period={self.period_start}..{self.period_end})>"
+
+
+class Payslip(SQLModel, table=True):
+    """
+    Per-employee result of a payroll run. `employee_id` is deliberately not a foreign key: a
+    payslip is a historical record and must survive the employee's deletion.
+    """
+    __tablename__ = "payslips"
+    __table_args__ = (
+        Index("ix_payslips_run_id_employee_id", "run_id", "employee_id", unique=True),
+        Index("ix_payslips_employee_id_run_id", "employee_id", "run_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    run_id: int = Field(foreign_key="payroll_runs.id")
+    employee_id: int
+    branch_id: int | None = Field(default=None)
+    base_amount: float # Full-period pay before proration
+    worked_days: int # Days employed within the period
+    proration: float # worked_days / days in period
+    gross: float
+    unpaid_leave_days: int
+    deduction: float
+    net: float
+
+    def __repr__(self):
+        return f"<Payslip(id={self.id}, run_id={self.run_id}, employee_id={self.employee_id}, net={self.net})>"
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from app.schemas.recruitment import PipelineStage, RequisitionStatus # Import the Enums from schema
+
+
+class Requisition(SQLModel, table=True):
+    __tablename__ = "requisitions"
+    __table_args__ = (
+        # Careers page: open requisitions; branch-scoped recruiter lists
+        Index("ix_requisitions_status_id", "status", "id"),
+        Index("ix_requisitions_branch_id_id", "branch_id", "id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    title: str = Field(max_length=200)
+    description: str | None = Field(default=None)
+    position_id: int | None = Field(default=None, foreign_key="positions.id", ondelete="SET NULL")
+    department_id: int | None = Field(default=None, foreign_key="departments.id", ondelete="SET NULL")
+    branch_id: int | None = Field(default=None, foreign_key="branches.id", ondelete="SET NULL")
+    openings: int = Field(default=1)
+    status: RequisitionStatus = Field(default=RequisitionStatus.OPEN)
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+
+    def __repr__(self):
+        return f"<Requisition(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+class Candidate(SQLModel, table=True):
+    """An application to a requisition; inserted in batches by `app.core.recruitment`."""
+    __tablename__ = "candidates"
+    __table_args__ = (
+        # Repeat submissions of the same email to a requisition are ignored on insert
+        UniqueConstraint("requisition_id", "email", name="uq_candidates_requisition_id_email"),
+        # Pipeline board: candidates of a requisition in one stage
+        Index("ix_candidates_requisition_id_stage_id", "requisition_id", "stage", "id"),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True, autoincrement=True))
+    requisition_id: int = Field(foreign_key="requisitions.id")
+    branch_id: int | None = Field(default=None) # Copied from the requisition for branch scoping
+    full_name: str = Field(max_length=200)
+    email: str = Field(max_length=320)
+    phone: str | None = Field(default=None, max_length=30)
+    resume_url: str | None = Field(default=None, max_length=500)
+    cover_letter: str | None = Field(default=None)
+    stage: PipelineStage = Field(default=PipelineStage.APPLIED)
+    applied_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    updated_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+
+    def __repr__(self):
+        return f"<Candidate(id={self.id}, requisition_id={self.requisition_id}, stage='{self.stage}')>"
+
+
+class RequisitionStageCount(SQLModel, table=True):
+    """Maintained count of candidates per requisition and stage, so pipeline views never COUNT(*)."""
+    __tablename__ = "requisition_stage_counts"
+
+    requisition_id: int = Field(foreign_key="requisitions.id", primary_key=True)
+    stage: PipelineStage = Field(primary_key=True)
+    candidate_count: int = Field(default=0)
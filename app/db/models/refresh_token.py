@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime
+from sqlmodel import Field, Relationship, SQLModel
+
+# Forward references for relationships
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .user import User
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Long-lived refresh token, stored only as a SHA-256 hash.
+
+    Every use rotates the token: the old row is revoked and a new one is issued in the same
+    family. Presenting an already revoked token means it leaked, so the whole family is revoked.
+    """
+    __tablename__ = "refresh_tokens"
+
+    id: int | None = Field(default=None, primary_key=True)
+    token_hash: str = Field(max_length=64, unique=True, index=True)
+    family_id: str = Field(max_length=32, index=True)
+    user_id: int = Field(foreign_key="users.id", index=True)
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    expires_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    revoked_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+
+    user: "User" = Relationship()
+
+    def __repr__(self):
+        return f"<RefreshToken(id={self.id}, user_id={self.user_id}, family='{self.family_id}')>"
@@ -0,0 +1,70 @@
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import Column, DateTime, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+from app.schemas.review import ReviewCycleStatus, ReviewStatus # Import the Enums from schema
+
+
+class ReviewForm(SQLModel, table=True):
+    __tablename__ = "review_forms"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(max_length=100, unique=True)
+    description: str | None = Field(default=None)
+    scale_max: int = Field(default=5)
+    criteria: Any = Field(sa_column=Column(JSONB, nullable=False)) # [{"key", "label", "weight"}, ...]
+
+    def __repr__(self):
+        return f"<ReviewForm(id={self.id}, name='{self.name}')>"
+
+
+class ReviewCycle(SQLModel, table=True):
+    __tablename__ = "review_cycles"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(max_length=100)
+    form_id: int = Field(foreign_key="review_forms.id")
+    period_start: date
+    period_end: date
+    status: ReviewCycleStatus = Field(default=ReviewCycleStatus.DRAFT)
+    created_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    launched_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    review_count: int = Field(default=0)
+
+    def __repr__(self):
+        return f"<ReviewCycle(id={self.id}, name='{self.name}', status='{self.status}')>"
+
+
+class Review(SQLModel, table=True):
+    """
+    One employee's review within a cycle. Department and branch are copied from the employee at
+    launch, so per-group aggregation and branch scoping need no join and reflect the org at the time.
+    """
+    __tablename__ = "reviews"
+    __table_args__ = (
+        # One review per employee per cycle; also makes a repeated launch a no-op
+        UniqueConstraint("cycle_id", "employee_id", name="uq_reviews_cycle_id_employee_id"),
+        # Reviewer inbox
+        Index("ix_reviews_reviewer_id_cycle_id_status", "reviewer_id", "cycle_id", "status"),
+        # Per-department / per-branch aggregation within a cycle
+        Index("ix_reviews_cycle_id_department_id", "cycle_id", "department_id"),
+        Index("ix_reviews_branch_id_cycle_id", "branch_id", "cycle_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    cycle_id: int = Field(foreign_key="review_cycles.id")
+    employee_id: int = Field(foreign_key="employees.id")
+    reviewer_id: int | None = Field(default=None, foreign_key="employees.id")
+    department_id: int | None = Field(default=None)
+    branch_id: int | None = Field(default=None)
+    status: ReviewStatus = Field(default=ReviewStatus.PENDING)
+    scores: Any = Field(default_factory=dict, sa_column=Column(JSONB, nullable=False, server_default="{}"))
+    overall_score: float | None = Field(default=None)
+    comments: str | None = Field(default=None)
+    submitted_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+
+    def __repr__(self):
+        return f"<Review(id={self.id}, cycle_id={self.cycle_id}, employee_id={self.employee_id}, status='{self.status}')>"
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from app.schemas.training import EnrolmentStatus # Import the Enum from schema
+
+
+class Course(SQLModel, table=True):
+    __tablename__ = "courses"
+
+    id: int | None = Field(default=None, primary_key=True)
+    code: str = Field(max_length=50, unique=True)
+    title: str = Field(max_length=200)
+    description: str | None = Field(default=None)
+
+    def __repr__(self):
+        return f"<Course(id={self.id}, code='{self.code}')>"
+
+
+class TrainingSession(SQLModel, table=True):
+    """A scheduled run of a course. `seats_remaining` is only changed by conditional UPDATEs in crud_training."""
+    __tablename__ = "training_sessions"
+    __table_args__ = (
+        # The database refuses overbooking even if a code path forgets the conditional decrement
+        CheckConstraint("seats_remaining >= 0 AND seats_remaining <= capacity", name="ck_training_sessions_seats"),
+        Index("ix_training_sessions_course_id_starts_at", "course_id", "starts_at"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    course_id: int = Field(foreign_key="courses.id")
+    starts_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    ends_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+    location: str | None = Field(default=None, max_length=200)
+    capacity: int
+    seats_remaining: int
+
+    def __repr__(self):
+        return f"<TrainingSession(id={self.id}, course_id={self.course_id}, seats_remaining={self.seats_remaining})>"
+
+
+class Enrolment(SQLModel, table=True):
+    __tablename__ = "enrolments"
+    __table_args__ = (
+        UniqueConstraint("session_id", "employee_id", name="uq_enrolments_session_id_employee_id"),
+        # Waitlist order within a session
+        Index("ix_enrolments_session_id_status_requested_at", "session_id", "status", "requested_at"),
+        Index("ix_enrolments_employee_id", "employee_id"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    session_id: int = Field(foreign_key="training_sessions.id")
+    employee_id: int = Field(foreign_key="employees.id")
+    status: EnrolmentStatus
+    requested_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+
+    def __repr__(self):
+        return f"<Enrolment(id={self.id}, session_id={self.session_id}, employee_id={self.employee_id}, status='{self.status}')>"
@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 from typing import List, Optional
 
@@ -17,6 +20,12 @@ if TYPE_CHECKING:
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
+    __table_args__ = (
+        # Default listings only see the active set
+        Index("ix_users_active_id", "id", postgresql_where=text("deleted_at IS NULL")),
+        # Branch-scoped listings: equality on branch_id, paginated by id
+        Index("ix_users_active_branch_id_id", "branch_id", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: int | None = Field(default=None, primary_key=True, index=True)
     username: str = Field(index=True, unique=True, min_length=3)
@@ -25,7 +34,8 @@ class User(SQLModel, table=True):
     hashed_password: str = Field()
     disabled: bool | None = Field(default=False)
 
-    branch_id: int | None = Field(default=None, foreign_key="branches.id", index=True) # <-- Add branch_id FK
+    branch_id: int | None = Field(default=None, foreign_key="branches.id", ondelete="SET NULL") # Indexed via ix_users_active_branch_id_id
+    deleted_at: datetime | None = Field(default=None, sa_column=Column(DateTime(timezone=True))) # Soft delete
 
     # Relationship to Employee (optional one-to-one)
     # Assumes Employee model has: user: Optional["User"] = Relationship(back_populates="employee_profile")
@@ -0,0 +1,213 @@
+"""
+Declarative Postgres partitioning helpers.
+
+`RangePartitions` creates monthly/yearly range partitions (plus a DEFAULT catch-all) on demand;
+`audit_log` always uses it. `leave_requests` can optionally be partitioned, chosen with
+LEAVE_PARTITION_STRATEGY:
+
+- "start_date": yearly ranges, so recent-date queries prune to one partition
+- "branch_id":  HASH (branch_id) into LEAVE_PARTITION_HASH_MODULUS partitions, so branch-scoped
+                queries (see app.db.scoping) prune to one partition; every request needs a branch
+
+Tables are always created unpartitioned by `create_all`; `migrate` converts leave_requests in place
+(copying its rows) and is a no-op once it is partitioned:
+
+    python -m app.db.partitioning migrate
+    python -m app.db.partitioning ensure    # create upcoming yearly partitions; run from cron
+
+`employees` is not partitioned: Postgres requires every unique constraint on a partitioned table
+to include the partition key, which would break the global uniqueness of employee emails.
+"""
+import argparse
+import threading
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.schema import AddConstraint
+
+from app.core.config import settings
+from app.db.models.leave import LeaveRequest
+
+LEAVE_STRATEGIES = ("start_date", "branch_id")
+
+
+class RangePartitions:
+    """Creates range partitions of `table` for the months/years of given dates, remembering which exist."""
+
+    def __init__(self, table: str, interval: str):
+        if interval not in ("month", "year"):
+            raise ValueError("interval must be 'month' or 'year'")
+        self.table = table
+        self.interval = interval
+        self._known: set = set()
+        self._lock = threading.Lock()
+
+    def bounds(self, value: date) -> Tuple[date, date]:
+        if self.interval == "year":
+            return date(value.year, 1, 1), date(value.year + 1, 1, 1)
+        start = date(value.year, value.month, 1)
+        return start, date(value.year + (value.month == 12), value.month % 12 + 1, 1)
+
+    def partition_name(self, start: date) -> str:
+        if self.interval == "year":
+            return f"{self.table}_y{start.year}"
+        return f"{self.table}_y{start.year}m{start.month:02d}"
+
+    def ensure(self, conn, values: Iterable[date]) -> None:
+        """
+        Creates the partitions (and the default catch-all) covering `values` if missing, in the
+        caller's transaction. They are only remembered once that transaction commits: after a
+        rollback the next call issues the (idempotent) DDL again, so rows never fall through to
+        the default partition because a partition was assumed to exist.
+        """
+        with self._lock:
+            missing = sorted({self.bounds(value)[0] for value in values} - self._known)
+            if not missing:
+                return
+            conn.execute(text(f"CREATE TABLE IF NOT EXISTS {self.table}_default PARTITION OF {self.table} DEFAULT"))
+            for start in missing:
+                _, end = self.bounds(start)
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {self.partition_name(start)} PARTITION OF {self.table} "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                ))
+        event.listen(conn, "commit", lambda _conn: self._remember(missing), once=True)
+
+    def _remember(self, starts: Iterable[date]) -> None:
+        with self._lock:
+            self._known.update(starts)
+
+    def forget(self) -> None:
+        """Drops the in-memory record of existing partitions (after the table is recreated)."""
+        with self._lock:
+            self._known.clear()
+
+
+leave_partitions = RangePartitions("leave_requests", "year")
+
+
+def is_partitioned(conn, table: str) -> bool:
+    return conn.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+        {"table": table},
+    ).scalar()
+
+
+def _upcoming_years(years_ahead: int) -> List[date]:
+    today = date.today()
+    return [date(today.year + offset, 1, 1) for offset in range(years_ahead + 1)]
+
+
+def leave_branch_required() -> bool:
+    """
+    Partitioning by branch_id makes it part of the primary key, hence NOT NULL: every leave
+    request then needs a branch, detaching a branch leaves its leave requests in place, and the
+    foreign key to branches is ON DELETE RESTRICT rather than SET NULL.
+    """
+    return settings.LEAVE_PARTITION_STRATEGY == "branch_id"
+
+
+def ensure_leave_partitions(conn, start_dates: Iterable[date] = ()) -> None:
+    """Creates yearly leave partitions for the given dates; a no-op unless partitioned by start_date."""
+    if settings.LEAVE_PARTITION_STRATEGY == "start_date":
+        leave_partitions.ensure(conn, start_dates)
+
+
+def migrate_leave_requests(
+    conn,
+    strategy: str,
+    hash_modulus: int = settings.LEAVE_PARTITION_HASH_MODULUS,
+    years_ahead: int = settings.LEAVE_PARTITION_YEARS_AHEAD,
+) -> bool:
+    """
+    Rebuilds leave_requests as a partitioned table inside the caller's transaction.
+    Returns False if it is already partitioned. Holds an exclusive lock on the table while rows
+    are copied, so run it in a maintenance window on large tables.
+    """
+    if strategy not in LEAVE_STRATEGIES:
+        raise ValueError(f"Unknown leave partition strategy '{strategy}'; use one of {LEAVE_STRATEGIES}")
+    if is_partitioned(conn, "leave_requests"):
+        return False
+    if strategy == "branch_id":
+        unassigned = conn.execute(text("SELECT count(*) FROM leave_requests WHERE branch_id IS NULL")).scalar()
+        if unassigned:
+            raise RuntimeError(f"{unassigned} leave requests have no branch_id; assign branches before partitioning by branch")
+
+    # Free the table and index names for the new parent table
+    old_indexes = conn.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = 'leave_requests'"
+    )).scalars().all()
+    conn.execute(text("ALTER TABLE leave_requests RENAME TO leave_requests_unpartitioned"))
+    for name in old_indexes:
+        conn.execute(text(f'ALTER INDEX "{name}" RENAME TO "{name[:48]}_unpartitioned"'))
+
+    partition_by = "RANGE (start_date)" if strategy == "start_date" else "HASH (branch_id)"
+    conn.execute(text(
+        "CREATE TABLE leave_requests (LIKE leave_requests_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY {partition_by}"
+    ))
+    if strategy == "branch_id":
+        conn.execute(text("ALTER TABLE leave_requests ALTER COLUMN branch_id SET NOT NULL"))
+    # The primary key of a partitioned table must include the partition key
+    conn.execute(text(f"ALTER TABLE leave_requests ADD PRIMARY KEY (id, {strategy})"))
+    table = LeaveRequest.__table__
+    for foreign_key in table.foreign_key_constraints:
+        if strategy == "branch_id" and list(foreign_key.column_keys) == ["branch_id"]:
+            # ON DELETE SET NULL would only fail on the NOT NULL column; refuse the branch delete instead
+            conn.execute(text(
+                "ALTER TABLE leave_requests ADD CONSTRAINT leave_requests_branch_id_fkey "
+                "FOREIGN KEY (branch_id) REFERENCES branches (id) ON DELETE RESTRICT"
+            ))
+            continue
+        conn.execute(AddConstraint(foreign_key))
+    for index in table.indexes:
+        index.create(conn)  # Created on the parent, cascades to every partition
+
+    if strategy == "start_date":
+        leave_partitions.forget()
+        first, last = conn.execute(text("SELECT min(start_date), max(start_date) FROM leave_requests_unpartitioned")).one()
+        years = _upcoming_years(years_ahead)
+        if first is not None:
+            years += [date(year, 1, 1) for year in range(first.year, last.year + 1)]
+        leave_partitions.ensure(conn, years)
+    else:
+        for remainder in range(hash_modulus):
+            conn.execute(text(
+                f"CREATE TABLE leave_requests_p{remainder} PARTITION OF leave_requests "
+                f"FOR VALUES WITH (MODULUS {hash_modulus}, REMAINDER {remainder})"
+            ))
+
+    conn.execute(text("INSERT INTO leave_requests SELECT * FROM leave_requests_unpartitioned"))
+    # Keep the id sequence alive when the old table is dropped
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence('leave_requests_unpartitioned', 'id')")).scalar()
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY leave_requests.id"))
+    conn.execute(text("DROP TABLE leave_requests_unpartitioned"))
+    conn.execute(text("ANALYZE leave_requests"))
+    return True
+
+
+def _main(argv: Optional[List[str]] = None) -> None:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Manage partitioned tables")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("migrate", help="Partition leave_requests according to LEAVE_PARTITION_STRATEGY")
+    commands.add_parser("ensure", help="Create upcoming yearly leave partitions")
+    args = parser.parse_args(argv)
+
+    strategy = settings.LEAVE_PARTITION_STRATEGY
+    if not strategy:
+        raise SystemExit("LEAVE_PARTITION_STRATEGY is not set")
+    with engine.begin() as conn:
+        if args.command == "migrate":
+            migrated = migrate_leave_requests(conn, strategy)
+            print(f"leave_requests partitioned by {strategy}" if migrated else "leave_requests is already partitioned")
+        else:
+            ensure_leave_partitions(conn, _upcoming_years(settings.LEAVE_PARTITION_YEARS_AHEAD))
+            print("Leave partitions are up to date")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,148 @@
+import logging
+import select as select_module
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Type
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel, select
+
+from app.core.config import settings
+from app.db.models.branch import Branch
+from app.db.models.department import Department
+from app.db.models.position import Position
+from app.db.models.role import Role
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Small, nearly static lookup tables that are safe to keep in process memory
+REFERENCE_MODELS: Dict[str, Type[SQLModel]] = {
+    model.__tablename__: model for model in (Branch, Department, Position, Role)
+}
+
+
+@dataclass(frozen=True)
+class ReferenceEntry:
+    """Detached snapshot of a reference row (never an ORM instance)."""
+    id: int
+    name: str
+
+
+class _ReferenceTable:
+    def __init__(self, entries: list[ReferenceEntry]):
+        self.by_id = {entry.id: entry for entry in entries}
+        self.by_name = {entry.name: entry for entry in entries}
+
+
+class ReferenceCache:
+    """
+    Process-wide cache of branches, departments, positions and roles keyed by id and name.
+
+    Tables are loaded on first use (or eagerly via `warm`) and dropped on every write made
+    through the CRUD layer. When `REFERENCE_CACHE_NOTIFY_CHANNEL` is set, invalidations are
+    broadcast with Postgres NOTIFY so other workers drop their copy too.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tables: Dict[str, _ReferenceTable] = {}
+        self._listener: Optional[threading.Thread] = None
+        self._stop_listener = threading.Event()
+
+    # --- Loading ---
+    def _load(self, db: Session, tablename: str) -> _ReferenceTable:
+        model = REFERENCE_MODELS[tablename]
+        rows = db.execute(select(model.id, model.name)).all()
+        table = _ReferenceTable([ReferenceEntry(id=row.id, name=row.name) for row in rows])
+        with self._lock:
+            self._tables[tablename] = table
+        return table
+
+    def _table(self, db: Session, model: Type[SQLModel]) -> _ReferenceTable:
+        table = self._tables.get(model.__tablename__)
+        if table is None:
+            table = self._load(db, model.__tablename__)
+        return table
+
+    def warm(self, db: Session) -> None:
+        """Loads every reference table, e.g. at application startup."""
+        for tablename in REFERENCE_MODELS:
+            self._load(db, tablename)
+
+    # --- Lookups ---
+    def get_by_id(self, db: Session, model: Type[SQLModel], item_id: int) -> Optional[ReferenceEntry]:
+        return self._table(db, model).by_id.get(item_id)
+
+    def get_by_name(self, db: Session, model: Type[SQLModel], name: str) -> Optional[ReferenceEntry]:
+        return self._table(db, model).by_name.get(name)
+
+    # --- Invalidation ---
+    def invalidate_local(self, tablename: Optional[str] = None) -> None:
+        """Drops one cached table (or all of them) in this process only."""
+        with self._lock:
+            if tablename is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(tablename, None)
+
+    def invalidate(self, model: Type[SQLModel]) -> None:
+        """Drops a cached table here and, if configured, in every other worker."""
+        self.invalidate_local(model.__tablename__)
+        channel = settings.REFERENCE_CACHE_NOTIFY_CHANNEL
+        if channel:
+            # Separate short transaction so the caller's session state is untouched
+            with engine.begin() as conn:
+                conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": channel, "payload": model.__tablename__},
+                )
+
+    # --- Cross-process listener (Postgres LISTEN/NOTIFY) ---
+    def start_listener(self) -> None:
+        """Starts a daemon thread that applies invalidations published by other workers."""
+        channel = settings.REFERENCE_CACHE_NOTIFY_CHANNEL
+        if not channel or self._listener is not None:
+            return
+        self._stop_listener.clear()
+        self._listener = threading.Thread(
+            target=self._listen, args=(channel,), name="reference-cache-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        self._stop_listener.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def _listen(self, channel: str) -> None:
+        while not self._stop_listener.is_set():
+            try:
+                raw = engine.raw_connection()
+                try:
+                    dbapi_conn = raw.driver_connection
+                    dbapi_conn.autocommit = True
+                    with dbapi_conn.cursor() as cursor:
+                        cursor.execute(f'LISTEN "{channel}"')
+                    # Anything may have changed while we were not listening
+                    self.invalidate_local()
+                    while not self._stop_listener.is_set():
+                        ready, _, _ = select_module.select([dbapi_conn], [], [], 1.0)
+                        if not ready:
+                            continue
+                        dbapi_conn.poll()
+                        while dbapi_conn.notifies:
+                            notify = dbapi_conn.notifies.pop(0)
+                            tablename = notify.payload if notify.payload in REFERENCE_MODELS else None
+                            self.invalidate_local(tablename)
+                finally:
+                    raw.invalidate()  # Never hand a LISTENing connection back to the pool
+            except Exception:
+                logger.exception("Reference cache listener failed; reconnecting")
+                self.invalidate_local()
+                self._stop_listener.wait(5)
+
+
+reference_cache = ReferenceCache()
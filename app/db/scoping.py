@@ -0,0 +1,112 @@
+"""
+Branch row-scoping for ORM queries.
+
+When a session carries a branch scope (set by the authentication dependency for users who may not
+see every branch), every ORM SELECT, UPDATE and DELETE touching employees, users, leave requests,
+reviews, requisitions or candidates gets a `branch_id = :scope` predicate injected by the database
+query itself, so out-of-branch rows are never fetched, serialized or modified. Internal lookups that must see every branch (uniqueness
+checks, denormalisation) opt out with `.execution_options(**UNSCOPED)`.
+
+The signed-in user's own rows (their user and employee profile, their leave and the reviews of or
+by them) stay visible whatever the branch, so a user without a branch, or whose branch was
+detached, can still use the self-service endpoints.
+"""
+from typing import Optional
+
+from sqlalchemy import event, or_, select
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest, LeaveRequestArchive
+from app.db.models.recruitment import Candidate, Requisition
+from app.db.models.review import Review
+from app.db.models.user import User
+
+_SCOPE_KEY = "branch_scope"
+_USER_KEY = "branch_scope_user"
+_SKIP_OPTION = "skip_branch_scope"
+# Set on statements that already carry their branch and archive criteria (see app.db.statements);
+# both this hook and the one in app.db.archive leave them alone
+PRESCOPED_OPTION = "prescoped"
+
+# Execution options that bypass the branch scope for a single statement
+UNSCOPED = {_SKIP_OPTION: True}
+
+# Scope for users who are neither assigned a branch nor allowed all branches: no branch has id 0,
+# so every scoped query comes back empty instead of unrestricted
+NO_BRANCH = 0
+
+SCOPED_MODELS = (Candidate, Employee, LeaveRequest, LeaveRequestArchive, Requisition, Review, User)
+
+_employees = Employee.__table__
+
+
+def set_branch_scope(db: Session, branch_id: Optional[int], user_id: Optional[int] = None) -> None:
+    """
+    Restricts the session to one branch, plus the rows of `user_id` if given; None removes the
+    restriction.
+    """
+    if branch_id is None:
+        db.info.pop(_SCOPE_KEY, None)
+        db.info.pop(_USER_KEY, None)
+    else:
+        db.info[_SCOPE_KEY] = branch_id
+        db.info[_USER_KEY] = user_id
+
+
+def get_branch_scope(db: Session) -> Optional[int]:
+    return db.info.get(_SCOPE_KEY)
+
+
+def get_scope_user(db: Session) -> Optional[int]:
+    return db.info.get(_USER_KEY)
+
+
+def is_unscoped(execution_options: dict) -> bool:
+    return bool(execution_options.get(_SKIP_OPTION))
+
+
+def branch_criteria(branch_id: int, user_id: Optional[int] = None) -> tuple:
+    """The loader criteria that restrict a statement to one branch and, if given, the user's own rows."""
+    if user_id is None:
+        return tuple(
+            with_loader_criteria(model, lambda cls: cls.branch_id == branch_id, include_aliases=True)
+            for model in SCOPED_MODELS
+        )
+    # The profile subquery reads the table directly, so these criteria do not apply inside it
+    criteria = {
+        User: lambda cls: or_(cls.branch_id == branch_id, cls.id == user_id),
+        Employee: lambda cls: or_(cls.branch_id == branch_id, cls.user_id == user_id),
+        LeaveRequest: lambda cls: or_(
+            cls.branch_id == branch_id,
+            cls.employee_id.in_(select(_employees.c.id).where(_employees.c.user_id == user_id)),
+        ),
+        LeaveRequestArchive: lambda cls: or_(
+            cls.branch_id == branch_id,
+            cls.employee_id.in_(select(_employees.c.id).where(_employees.c.user_id == user_id)),
+        ),
+        Review: lambda cls: or_(
+            cls.branch_id == branch_id,
+            cls.employee_id.in_(select(_employees.c.id).where(_employees.c.user_id == user_id)),
+            cls.reviewer_id.in_(select(_employees.c.id).where(_employees.c.user_id == user_id)),
+        ),
+    }
+    return tuple(
+        with_loader_criteria(model, criteria.get(model, lambda cls: cls.branch_id == branch_id), include_aliases=True)
+        for model in SCOPED_MODELS
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _apply_branch_scope(execute_state: ORMExecuteState) -> None:
+    branch_id = execute_state.session.info.get(_SCOPE_KEY)
+    options = execute_state.execution_options
+    if branch_id is None or options.get(_SKIP_OPTION) or options.get(PRESCOPED_OPTION):
+        return
+    # Column refreshes and relationship lazy loads inherit the criteria from the parent query
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if not (execute_state.is_select or execute_state.is_update or execute_state.is_delete):
+        return
+    user_id = execute_state.session.info.get(_USER_KEY)
+    execute_state.statement = execute_state.statement.options(*branch_criteria(branch_id, user_id))
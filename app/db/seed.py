@@ -0,0 +1,333 @@
+"""
+Deterministic synthetic data at production scale, for testing query plans and index choices
+against realistic cardinalities.
+
+    python -m app.db.seed --scale 1m                       # ~1M rows (70k employees)
+    python -m app.db.seed --employees 250000 --leave-years 5 --seed 7
+
+Fills branches, departments, positions, users with their role links, employees with their current
+history version, and multi-year leave histories. Values come from numpy generators seeded from
+`--seed`, so the same arguments always produce the same rows. Rows are loaded with COPY, one
+transaction per chunk of employees, then the sequences are advanced and the tables ANALYZEd.
+
+The shape is meant to matter to the planner. Branch sizes are skewed, with a few large branches
+and a long tail of small ones. Roughly 8% of staff are terminated (archived). Every tenth employee
+of a branch manages the next nine. Leave density follows tenure, with a few future requests
+still pending.
+
+Run it against a freshly initialised database (python -m app.db.init_db). It refuses to run if
+branches, departments, positions or employees already hold rows.
+"""
+import argparse
+import csv
+import io
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.hashing import get_password_hash
+from app.db.partitioning import ensure_leave_partitions
+
+# Employees per preset; each employee brings ~15 rows (user, role links, history, leave)
+SCALES = {"10k": 700, "100k": 7_000, "1m": 70_000, "10m": 700_000}
+
+# Every seeded user can log in with this password (hashed once, not per user)
+SEED_PASSWORD = "ChangeMe123"
+
+HISTORY_YEARS = 15 # Hire dates are spread over this many years
+TERMINATED_SHARE = 0.08
+MANAGER_SPAN = 10 # Employees per manager group within a branch, the manager included
+ADMIN_SHARE = 0.002 # Users who are also admins
+
+FIRST_NAMES = (
+    "Alice", "Bui", "Carlos", "Dara", "Elena", "Farid", "Grace", "Hana", "Ivan", "Jia", "Kofi", "Lena",
+    "Malee", "Noah", "Olga", "Pedro", "Quang", "Rosa", "Somchai", "Tariq", "Uma", "Vilay", "Wei", "Yuki",
+)
+LAST_NAMES = (
+    "Anderson", "Bounmy", "Chen", "Dubois", "Evans", "Fischer", "Garcia", "Hoang", "Ivanova", "Jensen",
+    "Khan", "Lopez", "Meyer", "Nguyen", "Okafor", "Phommachanh", "Rossi", "Sato", "Tanaka", "Vongsa",
+)
+DEPARTMENTS = (
+    "Finance", "Human Resources", "IT", "Operations", "Sales", "Marketing", "Legal", "Procurement",
+    "Customer Service", "Logistics", "Research", "Quality", "Facilities", "Security", "Training",
+    "Compliance", "Treasury", "Audit", "Product", "Engineering",
+)
+POSITION_ROLES = (
+    "Accountant", "Analyst", "Engineer", "Officer", "Clerk", "Consultant", "Specialist", "Coordinator",
+    "Administrator", "Technician", "Representative", "Designer",
+)
+POSITION_LEVELS = ("Junior", "", "Senior", "Lead")
+LEAVE_REASONS = ("Annual leave", "Sick leave", "Family event", "Medical appointment", "Public duty", "Travel")
+
+
+@dataclass
+class SeedConfig:
+    employees: int
+    seed: int = 42
+    branches: Optional[int] = None # Default: one per 500 employees, between 1 and 500
+    user_ratio: float = 0.8 # Share of non-managers with a user account (managers always have one)
+    leave_years: int = 3 # Years of leave history per employee (bounded by tenure)
+    leave_per_year: float = 4.0 # Mean leave requests per employee per year
+    chunk_size: int = 50_000 # Employees per COPY transaction
+    today: date = field(default_factory=date.today)
+
+    @property
+    def branch_count(self) -> int:
+        return self.branches or min(max(self.employees // 500, 1), 500)
+
+
+def _rng(config: SeedConfig, stream: str) -> np.random.Generator:
+    """One generator per table, so changing one table's parameters leaves the others' rows as they were."""
+    return np.random.default_rng([config.seed, zlib.crc32(stream.encode())])
+
+
+def copy_rows(conn: Connection, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+    """Loads rows with COPY ... FROM STDIN (CSV, None becomes NULL) inside the connection's transaction."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow(["" if value is None else value for value in row])
+        count += 1
+    if not count:
+        return 0
+    statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"): # psycopg2
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+        else: # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+    return count
+
+
+class EmployeePlan:
+    """Per-employee columns for the whole run, generated up front as numpy arrays (ids start at 1)."""
+
+    def __init__(self, config: SeedConfig, user_offset: int, position_count: int):
+        count = config.employees
+        rng = _rng(config, "employees")
+        self.ids = np.arange(1, count + 1, dtype=np.int64)
+        # Day offsets from `origin`; ids follow hire order, as they would in production
+        self.origin = config.today - timedelta(days=HISTORY_YEARS * 365)
+        self.today_offset = (config.today - self.origin).days
+        self.hired = np.sort(rng.integers(0, self.today_offset + 1, count))
+        self.terminated = rng.random(count) < TERMINATED_SHARE
+        self.left = self.hired + (rng.random(count) * (self.today_offset - self.hired)).astype(np.int64)
+
+        # Zipf-like branch sizes: the first branches are large, the tail is small
+        weights = 1.0 / np.arange(1, config.branch_count + 1) ** 0.8
+        self.branch_ids = rng.choice(config.branch_count, size=count, p=weights / weights.sum()) + 1
+        self.department_ids = rng.integers(1, len(DEPARTMENTS) + 1, count)
+        self.position_ids = rng.integers(1, position_count + 1, count)
+        salaries = rng.lognormal(np.log(55_000), 0.35, count).round(2)
+        self.salaries = np.where(rng.random(count) < 0.01, np.nan, salaries) # Some without a salary
+        self.first_names = rng.integers(0, len(FIRST_NAMES), count)
+        self.last_names = rng.integers(0, len(LAST_NAMES), count)
+        self.phones = rng.integers(0, 10_000_000, count)
+
+        # Managers: the first of every MANAGER_SPAN employees of a branch, in id order
+        order = np.argsort(self.branch_ids, kind="stable")
+        sorted_branches = self.branch_ids[order]
+        group_start = np.searchsorted(sorted_branches, sorted_branches, side="left")
+        rank = np.arange(count) - group_start
+        manager_ids = np.zeros(count, dtype=np.int64)
+        manager_ids[order] = self.ids[order][group_start + rank // MANAGER_SPAN * MANAGER_SPAN]
+        self.is_manager = manager_ids == self.ids
+        self.manager_ids = np.where(self.is_manager, 0, manager_ids)
+
+        has_user = self.is_manager | (rng.random(count) < config.user_ratio)
+        self.user_ids = np.where(has_user, user_offset + np.cumsum(has_user), 0)
+        self.is_admin = has_user & (rng.random(count) < ADMIN_SHARE)
+
+    def day(self, offset: int) -> date:
+        return self.origin + timedelta(days=int(offset))
+
+    def deleted_at(self, index: int) -> Optional[str]:
+        return f"{self.day(self.left[index])} 17:00:00+00" if self.terminated[index] else None
+
+
+def _check_empty(conn: Connection) -> None:
+    for table in ("branches", "departments", "positions", "employees"):
+        if conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {table})")).scalar():
+            raise RuntimeError(f"{table} already has rows; seed a freshly initialised database")
+
+
+def _ensure_roles(conn: Connection) -> Dict[str, int]:
+    # init_db creates the system role with an explicit id, so move the sequence past it first
+    conn.execute(text("SELECT setval(pg_get_serial_sequence('roles', 'id'), (SELECT max(id) FROM roles))"))
+    names = ("employee", "manager", "admin")
+    conn.execute(
+        text("INSERT INTO roles (name, description) VALUES (:name, :name) ON CONFLICT (name) DO NOTHING"),
+        [{"name": name} for name in names],
+    )
+    statement = text("SELECT name, id FROM roles WHERE name IN :names").bindparams(bindparam("names", expanding=True))
+    rows = conn.execute(statement, {"names": list(names)})
+    return dict(rows.all())
+
+
+def _reference_rows(config: SeedConfig) -> Dict[str, tuple]:
+    rng = _rng(config, "branches")
+    branches = [
+        (index, f"Branch {index:04d}", f"{rng.integers(1, 999)} Main Road, District {rng.integers(1, 60)}", True)
+        for index in range(1, config.branch_count + 1)
+    ]
+    departments = [(index, name, f"{name} department") for index, name in enumerate(DEPARTMENTS, start=1)]
+    titles = [f"{level} {role}".strip() for role in POSITION_ROLES for level in POSITION_LEVELS]
+    positions = [(index, title, None) for index, title in enumerate(titles, start=1)]
+    return {"branches": branches, "departments": departments, "positions": positions}
+
+
+def _leave_rows(config: SeedConfig, plan: EmployeePlan, indexes: np.ndarray, rng: np.random.Generator, first_id: int):
+    """Leave requests for a chunk of employees, inside each one's tenure over the last leave_years."""
+    window_start = np.maximum(plan.hired[indexes], plan.today_offset - config.leave_years * 365)
+    window_end = np.where(plan.terminated[indexes], plan.left[indexes], plan.today_offset + 60) # Some booked ahead
+    active_days = np.maximum(window_end - window_start, 0)
+    counts = rng.poisson(config.leave_per_year * active_days / 365)
+    owners = np.repeat(indexes, counts)
+    starts = np.repeat(window_start, counts) + (rng.random(len(owners)) * np.repeat(active_days, counts)).astype(np.int64)
+    lengths = rng.geometric(0.3, len(owners)).clip(1, 20)
+    rejected = rng.random(len(owners)) < 0.12
+    reasons = rng.integers(0, len(LEAVE_REASONS), len(owners))
+    for offset, (index, start, length) in enumerate(zip(owners.tolist(), starts.tolist(), lengths.tolist())):
+        if start > plan.today_offset - 7:
+            status = "PENDING" # Enums are stored by name
+        else:
+            status = "REJECTED" if rejected[offset] else "APPROVED"
+        yield (
+            first_id + offset, plan.day(start), plan.day(start + length - 1), LEAVE_REASONS[reasons[offset]],
+            status, int(plan.ids[index]), int(plan.branch_ids[index]),
+        )
+
+
+def seed(engine: Engine, config: SeedConfig, echo: Callable[[str], None] = lambda message: None) -> Dict[str, int]:
+    """Generates and loads the dataset; returns the number of rows written per table."""
+    started = time.perf_counter()
+    counts: Dict[str, int] = {}
+
+    def add(table: str, written: int) -> None:
+        counts[table] = counts.get(table, 0) + written
+
+    reference = _reference_rows(config)
+    with engine.begin() as conn:
+        _check_empty(conn)
+        role_ids = _ensure_roles(conn)
+        user_offset = conn.execute(text("SELECT coalesce(max(id), 0) FROM users")).scalar()
+        add("branches", copy_rows(conn, "branches", ("id", "name", "address", "is_active"), reference["branches"]))
+        add("departments", copy_rows(conn, "departments", ("id", "name", "description"), reference["departments"]))
+        add("positions", copy_rows(conn, "positions", ("id", "name", "description"), reference["positions"]))
+
+    plan = EmployeePlan(config, user_offset, len(reference["positions"]))
+    position_names = [row[1] for row in reference["positions"]]
+    hashed_password = get_password_hash(SEED_PASSWORD)
+    leave_rng = _rng(config, "leave")
+    next_leave_id = 1
+
+    for chunk_start in range(0, config.employees, config.chunk_size):
+        indexes = np.arange(chunk_start, min(chunk_start + config.chunk_size, config.employees))
+        users, links, employees, history = [], [], [], []
+        for index in indexes.tolist():
+            employee_id = int(plan.ids[index])
+            first, last = FIRST_NAMES[plan.first_names[index]], LAST_NAMES[plan.last_names[index]]
+            email = f"{first.lower()}.{last.lower()}.{employee_id}@example.com"
+            branch_id = int(plan.branch_ids[index])
+            deleted_at = plan.deleted_at(index)
+            user_id = int(plan.user_ids[index]) or None
+            if user_id:
+                users.append((
+                    user_id, f"seed{employee_id}", email, f"{first} {last}", hashed_password,
+                    deleted_at is not None, branch_id, deleted_at,
+                ))
+                links.append((user_id, role_ids["employee"]))
+                if plan.is_manager[index]:
+                    links.append((user_id, role_ids["manager"]))
+                if plan.is_admin[index]:
+                    links.append((user_id, role_ids["admin"]))
+            salary = None if np.isnan(plan.salaries[index]) else float(plan.salaries[index])
+            hired = plan.day(plan.hired[index])
+            position_id, department_id = int(plan.position_ids[index]), int(plan.department_ids[index])
+            employees.append((
+                employee_id, first, last, email, f"+1555{plan.phones[index]:07d}", hired,
+                position_names[position_id - 1], salary, position_id, department_id, user_id, branch_id,
+                int(plan.manager_ids[index]) or None, deleted_at,
+            ))
+            left = plan.day(plan.left[index]) if plan.terminated[index] else None
+            history.append((employee_id, salary, position_id, department_id, hired, left))
+
+        leave = list(_leave_rows(config, plan, indexes, leave_rng, next_leave_id))
+        next_leave_id += len(leave)
+        with engine.begin() as conn:
+            add("users", copy_rows(conn, "users", (
+                "id", "username", "email", "full_name", "hashed_password", "disabled", "branch_id", "deleted_at",
+            ), users))
+            add("user_role_link", copy_rows(conn, "user_role_link", ("user_id", "role_id"), links))
+            add("employees", copy_rows(conn, "employees", (
+                "id", "first_name", "last_name", "email", "phone", "hire_date", "job_title", "salary",
+                "position_id", "department_id", "user_id", "branch_id", "manager_id", "deleted_at",
+            ), employees))
+            add("employee_history", copy_rows(conn, "employee_history", (
+                "employee_id", "salary", "position_id", "department_id", "valid_from", "valid_to",
+            ), history))
+            ensure_leave_partitions(conn, {date(row[1].year, 1, 1) for row in leave})
+            add("leave_requests", copy_rows(conn, "leave_requests", (
+                "id", "start_date", "end_date", "reason", "status", "employee_id", "branch_id",
+            ), leave))
+        elapsed = time.perf_counter() - started
+        total = sum(counts.values())
+        echo(f"{indexes[-1] + 1}/{config.employees} employees, {total:,} rows ({total / elapsed:,.0f} rows/s)")
+
+    with engine.begin() as conn:
+        # Rows were written with explicit ids; move each sequence past them
+        for table in ("branches", "departments", "positions", "users", "employees", "leave_requests"):
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), greatest(max(id), 1), max(id) IS NOT NULL) FROM {table}"
+            ))
+        # Fresh statistics, so plans reflect the new cardinalities straight away
+        conn.execute(text("ANALYZE " + ", ".join(counts)))
+    return counts
+
+
+def _main(argv: Optional[List[str]] = None) -> None:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Fill a fresh database with deterministic synthetic data")
+    parser.add_argument("--scale", choices=SCALES, default="100k", help="Approximate total rows")
+    parser.add_argument("--employees", type=int, default=None, help="Overrides --scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--branches", type=int, default=None, help="Default: one per 500 employees (1-500)")
+    parser.add_argument("--user-ratio", type=float, default=0.8)
+    parser.add_argument("--leave-years", type=int, default=3)
+    parser.add_argument("--leave-per-year", type=float, default=4.0)
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Employees per transaction")
+    parser.add_argument("--today", type=date.fromisoformat, default=date.today(), help="Fix for identical dates across days")
+    args = parser.parse_args(argv)
+
+    config = SeedConfig(
+        employees=args.employees or SCALES[args.scale],
+        seed=args.seed,
+        branches=args.branches,
+        user_ratio=args.user_ratio,
+        leave_years=args.leave_years,
+        leave_per_year=args.leave_per_year,
+        chunk_size=args.chunk_size,
+        today=args.today,
+    )
+    started = time.perf_counter()
+    counts = seed(engine, config, echo=print)
+    for table, written in counts.items():
+        print(f"{table:>18}: {written:,}")
+    print(f"Seeded {sum(counts.values()):,} rows in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    _main()
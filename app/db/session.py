@@ -1,10 +1,16 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings # Import settings to get DB URL
 
 # Create the SQLAlchemy engine using the database URL from settings
 # The pool_pre_ping=True argument helps handle dropped connections
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+# psycopg 3 prepares a query server-side after prepare_threshold executions on a connection;
+# psycopg2 has no such option, so nothing is passed to it
+connect_args = {}
+if make_url(settings.SQLALCHEMY_DATABASE_URI).get_driver_name() == "psycopg":
+    connect_args["prepare_threshold"] = settings.DB_PREPARE_THRESHOLD if settings.DB_PREPARED_STATEMENTS else None
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True, connect_args=connect_args)
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,143 @@
+"""
+Prebuilt statements for the hottest lookups.
+
+A `select()` or `db.query()` built inside a CRUD function costs Python time on every call:
+constructing the expression and computing its cache key before SQLAlchemy can look up the
+compiled SQL. The statements below are built once, at import, with bound parameters.
+
+The branch-scope and archive hooks would still rebuild each one with `.options(...)` on every
+execution, so `execute` adds the same criteria itself and keeps the result per (statement, branch
+scope, scoped user, include archived) in `_variants`, marked PRESCOPED_OPTION so the hooks leave it alone. A
+lookup then only binds values: the cache key is memoized on the cached variant. (Lambda
+statements were not used: they do not support `.options()`.)
+
+Executions are tagged with `statement_name`, and an engine event counts how the compiled cache
+answered for each one (`cache_hit`, `cache_miss`, ...); see `statements.stats()` and
+GET /health/statements. These count the engine's compiled cache, which per-call `select()`s hit
+just as often; they show that warm-up worked and, with psycopg 3, that prepares can kick in, not
+the Python time saved above.
+
+Server-side prepared statements are a driver feature: with psycopg 3 (POSTGRES_DRIVER=psycopg)
+the server prepares a statement once a connection has run it DB_PREPARE_THRESHOLD times, which
+also skips parsing and planning. psycopg2 has no equivalent.
+"""
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
+
+from app.db.archive import ACTIVE_CRITERIA, INCLUDE_ARCHIVED, includes_archived
+from app.db.models.employee import Employee
+from app.db.models.leave import LeaveRequest
+from app.db.models.user import User
+from app.db.scoping import PRESCOPED_OPTION, UNSCOPED, branch_criteria, get_branch_scope, get_scope_user, is_unscoped
+
+_NAME_OPTION = "statement_name"
+# Scoped variants are per signed-in user; beyond this many they are built per call, as the hooks would
+MAX_VARIANTS = 10_000
+
+
+class StatementRegistry:
+    def __init__(self):
+        self._statements: Dict[str, Executable] = {}
+        self._warm_params: Dict[str, Dict[str, Any]] = {}
+        self._variants: Dict[Tuple[str, Optional[int], Optional[int], bool], Executable] = {}
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def register(self, name: str, statement: Executable, warm_params: Dict[str, Any]) -> Executable:
+        """
+        Adds a statement under `name`. `warm_params` are values that match no row, used by
+        `warm` to get the compiled form cached at startup.
+        """
+        if name in self._statements:
+            raise ValueError(f"Statement {name!r} is already registered")
+        statement = statement.execution_options(**{_NAME_OPTION: name})
+        self._statements[name] = statement
+        self._warm_params[name] = warm_params
+        return statement
+
+    def execute(self, db: Session, name: str, params: Dict[str, Any], **execution_options: Any) -> Result:
+        return db.execute(self._scoped(db, name, execution_options), params, execution_options=execution_options)
+
+    def _scoped(self, db: Session, name: str, execution_options: Dict[str, Any]) -> Executable:
+        """The statement with the criteria the hooks would add for this session, built once."""
+        statement = self._statements[name]
+        options = {**statement.get_execution_options(), **execution_options}
+        branch_id = None if is_unscoped(options) else get_branch_scope(db)
+        user_id = get_scope_user(db) if branch_id is not None else None
+        include_archived = includes_archived(options)
+        key = (name, branch_id, user_id, include_archived)
+        variant = self._variants.get(key)
+        if variant is None:
+            criteria = branch_criteria(branch_id, user_id) if branch_id is not None else ()
+            if not include_archived:
+                criteria += ACTIVE_CRITERIA
+            variant = statement.options(*criteria).execution_options(**{PRESCOPED_OPTION: True})
+            if len(self._variants) < MAX_VARIANTS:
+                self._variants[key] = variant
+        return variant
+
+    def warm(self, db: Session) -> None:
+        """Executes every registered statement once so its compiled SQL is cached."""
+        for name, params in self._warm_params.items():
+            self.execute(db, name, params).all()
+
+    # --- Compile cache statistics ---
+    def record(self, name: str, outcome: str) -> None:
+        with self._lock:
+            self._stats[name][outcome] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(counter) for name, counter in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+statements = StatementRegistry()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count_cache_outcome(conn, cursor, statement, parameters, context, executemany) -> None:
+    name: Optional[str] = context.execution_options.get(_NAME_OPTION) if context is not None else None
+    if name is None:
+        return
+    outcome = getattr(context, "cache_hit", None)  # CacheStats member, e.g. CACHE_HIT / CACHE_MISS
+    statements.record(name, getattr(outcome, "name", str(outcome)).lower())
+
+
+# --- Hot Statements ---
+USER_BY_USERNAME = statements.register(
+    "user_by_username",
+    # Usernames are unique across branches
+    select(User).where(User.username == bindparam("username")).execution_options(**UNSCOPED),
+    warm_params={"username": ""},
+)
+EMPLOYEE_BY_ID = statements.register(
+    "employee_by_id",
+    select(Employee).where(Employee.id == bindparam("employee_id")),
+    warm_params={"employee_id": 0},
+)
+EMPLOYEE_BY_EMAIL = statements.register(
+    "employee_by_email",
+    # Emails are unique across branches and terminated employees
+    select(Employee).where(Employee.email == bindparam("email")).execution_options(**UNSCOPED, **INCLUDE_ARCHIVED),
+    warm_params={"email": ""},
+)
+EMPLOYEE_BY_USER_ID = statements.register(
+    "employee_by_user_id",
+    select(Employee).where(Employee.user_id == bindparam("user_id")),
+    warm_params={"user_id": 0},
+)
+LEAVE_REQUEST_BY_ID = statements.register(
+    "leave_request_by_id",
+    select(LeaveRequest).where(LeaveRequest.id == bindparam("request_id")),
+    warm_params={"request_id": 0},
+)
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Any, List, Optional
+
+# Schema for a single audit entry (output)
+class AuditEntry(BaseModel):
+    id: int
+    occurred_at: datetime
+    entity_type: str
+    entity_id: int
+    field: str
+    old_value: Optional[Any] = None
+    new_value: Optional[Any] = None
+    actor_user_id: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Schema for a page of audit entries, newest first
+class AuditPage(BaseModel):
+    items: List[AuditEntry] = []
+    next_cursor: Optional[str] = None # Pass back as `cursor` to fetch the next (older) page
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, ConfigDict
+from datetime import datetime
 from typing import Optional
 
 # Shared properties
@@ -18,6 +19,7 @@ class BranchUpdate(BranchBase):
 # Properties shared by models stored in DB
 class BranchInDBBase(BranchBase):
     id: int
+    deleted_at: Optional[datetime] = None # Set once the branch is archived
     model_config = ConfigDict(from_attributes=True) # Use orm_mode in older Pydantic versions
 
 # Properties to return to client
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, List, Optional
+
+# Schema for a single change (output)
+class ChangeEntry(BaseModel):
+    token: str # Resume position; pass the last one seen as `since`
+    entity_type: str
+    entity_id: int
+    operation: str
+    changed_at: datetime
+    data: Optional[Any] = None
+
+# Schema for a page of the change feed
+class ChangeFeedPage(BaseModel):
+    changes: List[ChangeEntry] = []
+    next_token: str # Pass back as `since`; unchanged when there was nothing new
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+# Outcome of deleting a branch, department or position together with its dependent rows
+class DeleteResult(BaseModel):
+    id: int
+    deleted: bool # False when the row was archived (soft-deleted) rather than removed
+    reassigned_to: Optional[int] = None # None: dependents were detached (or left in place)
+    affected: Dict[str, int] = {} # "table.column" -> rows re-pointed by one UPDATE
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict # <-- Import ConfigDict
 from typing import Optional, List, Union
-from datetime import date
+from datetime import date, datetime
 from app.schemas.position import Position, PositionCreate
 from app.schemas.department import Department, DepartmentCreate
 from app.schemas.branch import Branch, BranchCreate # <-- Import Branch schemas
@@ -17,6 +17,7 @@ class EmployeeBase(BaseModel):
 
     branch_id: Optional[int] = None # <-- Add branch_id
     branch: Optional[Union[Branch, BranchCreate]] = None # <-- Add nested branch
+    manager_id: Optional[int] = None # Employee id of the line manager (reviews their performance)
 
 # Schema for creating an employee (inherits from Base)
 # No 'id' here as it's generated upon creation
@@ -37,11 +38,13 @@ class EmployeeUpdate(BaseModel):
     salary: Optional[float] = None # Added based on model
 
     branch_id: Optional[int] = None # <-- Add branch_id for update
+    manager_id: Optional[int] = None
 
 # Schema for reading/representing an employee (inherits from Base)
 # Includes the 'id'
 class Employee(EmployeeBase):
     id: int
+    deleted_at: Optional[datetime] = None # Set once the employee is terminated (archived)
 
     # Use model_config for Pydantic v2
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import date
+from typing import Optional
+
+# Schema for one version of an employee's salary/position/department (output)
+class EmployeeVersion(BaseModel):
+    employee_id: int
+    salary: Optional[float] = None
+    position_id: Optional[int] = None
+    department_id: Optional[int] = None
+    valid_from: date
+    valid_to: Optional[date] = None # Exclusive; None while current
+
+    model_config = ConfigDict(from_attributes=True)
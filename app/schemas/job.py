@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from enum import Enum
+from typing import Dict
+
+# Enum for background job status
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed" # Exhausted all attempts (dead letter)
+
+# Schema for worker metrics exposed by the API
+class JobMetrics(BaseModel):
+    claimed: int = 0
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    handler_seconds: float = 0.0
+    queue_depth: Dict[str, int] = {} # Rows per status currently in the jobs table
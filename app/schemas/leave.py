@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
 from enum import Enum
-from typing import Optional
+from typing import Optional, List
 
 # Enum for Leave Status
 class LeaveStatus(str, Enum):
@@ -26,4 +26,20 @@ class LeaveRequest(LeaveRequestBase):
     status: LeaveStatus = LeaveStatus.PENDING # Default status
 
     class Config:
-        from_attributes = True # For ORM mode compatibility if needed later
\ No newline at end of file
+        from_attributes = True # For ORM mode compatibility if needed later
+
+# Allowed status transitions for the approval workflow (source -> targets)
+LEAVE_STATUS_TRANSITIONS = {
+    LeaveStatus.PENDING: {LeaveStatus.APPROVED, LeaveStatus.REJECTED},
+    LeaveStatus.APPROVED: set(),
+    LeaveStatus.REJECTED: set(),
+}
+
+# Schema for batched manager actions (approve/reject many requests at once)
+class LeaveBatchAction(BaseModel):
+    request_ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+# Schema for the result of a batched action
+class LeaveBatchResult(BaseModel):
+    updated: List[LeaveRequest] = []
+    skipped: List[int] = [] # IDs not found or not in a state that allows the transition
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, ConfigDict, model_validator
+from datetime import date, datetime
+from typing import Optional
+
+# Schema for starting a payroll run (input)
+class PayrollRunCreate(BaseModel):
+    period_start: date
+    period_end: date
+
+    @model_validator(mode="after")
+    def check_period(self):
+        if self.period_end < self.period_start:
+            raise ValueError("period_end must not be before period_start")
+        return self
+
+# Schema for a payroll run summary (output)
+class PayrollRun(BaseModel):
+    id: int
+    period_start: date
+    period_end: date
+    created_at: datetime
+    employee_count: int
+    total_gross: float
+    total_deductions: float
+    total_net: float
+    duration_seconds: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Schema for a single payslip (output)
+class Payslip(BaseModel):
+    id: int
+    run_id: int
+    employee_id: int
+    branch_id: Optional[int] = None
+    base_amount: float
+    worked_days: int
+    proration: float
+    gross: float
+    unpaid_leave_days: int
+    deduction: float
+    net: float
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,98 @@
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+
+# Enum for requisition status
+class RequisitionStatus(str, Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+# Enum for a candidate's position in the hiring pipeline
+class PipelineStage(str, Enum):
+    APPLIED = "applied"
+    SCREENING = "screening"
+    INTERVIEW = "interview"
+    OFFER = "offer"
+    HIRED = "hired"
+    REJECTED = "rejected"
+
+# --- Requisitions ---
+class RequisitionCreate(BaseModel):
+    title: str = Field(..., min_length=1, max_length=200)
+    description: Optional[str] = None
+    position_id: Optional[int] = None
+    department_id: Optional[int] = None
+    branch_id: Optional[int] = None
+    openings: int = Field(1, ge=1)
+
+class RequisitionUpdate(BaseModel):
+    title: Optional[str] = Field(default=None, min_length=1, max_length=200)
+    description: Optional[str] = None
+    openings: Optional[int] = Field(default=None, ge=1)
+    status: Optional[RequisitionStatus] = None
+
+class Requisition(RequisitionCreate):
+    id: int
+    status: RequisitionStatus
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Public view of an open requisition on the careers page
+class CareersRequisition(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    branch_id: Optional[int] = None
+
+# --- Applications / Candidates ---
+class ApplicationCreate(BaseModel):
+    full_name: str = Field(..., min_length=1, max_length=200)
+    email: EmailStr
+    phone: Optional[str] = Field(default=None, max_length=30)
+    resume_url: Optional[str] = Field(default=None, max_length=500)
+    cover_letter: Optional[str] = Field(default=None, max_length=10_000)
+
+    @field_validator("full_name", "phone", "resume_url", "cover_letter", mode="before")
+    @classmethod
+    def strip_nul(cls, value):
+        # Postgres text cannot hold NUL characters; left in, the insert of the whole batch fails
+        return value.replace("\x00", "") if isinstance(value, str) else value
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return value.lower() # Duplicate applications are detected per requisition and email
+
+class ApplicationAccepted(BaseModel):
+    status: str = "received" # Queued; written to the database in the next batch
+
+class Candidate(BaseModel):
+    id: int
+    requisition_id: int
+    branch_id: Optional[int] = None
+    full_name: str
+    email: str
+    phone: Optional[str] = None
+    resume_url: Optional[str] = None
+    cover_letter: Optional[str] = None
+    stage: PipelineStage
+    applied_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CandidateStageUpdate(BaseModel):
+    candidate_ids: List[int] = Field(..., min_length=1, max_length=1000)
+    stage: PipelineStage
+
+class CandidateStageResult(BaseModel):
+    moved: List[int] = []
+    skipped: List[int] = [] # Unknown, out of scope, or already in that stage
+
+# Cached candidate counts per pipeline stage for one requisition
+class PipelineCounts(BaseModel):
+    requisition_id: int
+    counts: Dict[PipelineStage, int] = {}
+    total: int = 0
@@ -0,0 +1,95 @@
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from datetime import date, datetime
+from enum import Enum
+from typing import Dict, List, Optional
+
+# Enum for review cycle status
+class ReviewCycleStatus(str, Enum):
+    DRAFT = "draft"
+    OPEN = "open" # Launched: one review per employee exists
+    CLOSED = "closed" # No more submissions or launches
+
+# Enum for individual review status
+class ReviewStatus(str, Enum):
+    PENDING = "pending"
+    SUBMITTED = "submitted"
+
+# --- Review Forms ---
+class ReviewCriterion(BaseModel):
+    key: str = Field(..., min_length=1, max_length=50)
+    label: str
+    weight: float = Field(1.0, gt=0)
+
+class ReviewFormCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+    scale_max: int = Field(5, ge=2, le=10) # Scores range from 1 to scale_max
+    criteria: List[ReviewCriterion] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def check_unique_keys(self):
+        keys = [criterion.key for criterion in self.criteria]
+        if len(set(keys)) != len(keys):
+            raise ValueError("criterion keys must be unique")
+        return self
+
+class ReviewForm(ReviewFormCreate):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+# --- Review Cycles ---
+class ReviewCycleCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    form_id: int
+    period_start: date
+    period_end: date
+
+    @model_validator(mode="after")
+    def check_period(self):
+        if self.period_end < self.period_start:
+            raise ValueError("period_end must not be before period_start")
+        return self
+
+class ReviewCycle(ReviewCycleCreate):
+    id: int
+    status: ReviewCycleStatus
+    created_at: datetime
+    launched_at: Optional[datetime] = None
+    review_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ReviewLaunchResult(BaseModel):
+    cycle_id: int
+    created: int # Reviews inserted by this launch (0 if it was already launched)
+
+# --- Reviews ---
+class Review(BaseModel):
+    id: int
+    cycle_id: int
+    employee_id: int
+    reviewer_id: Optional[int] = None
+    department_id: Optional[int] = None
+    branch_id: Optional[int] = None
+    status: ReviewStatus
+    scores: Dict[str, float] = {}
+    overall_score: Optional[float] = None
+    comments: Optional[str] = None
+    submitted_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ReviewSubmit(BaseModel):
+    scores: Dict[str, float] # criterion key -> score on the form's scale
+    comments: Optional[str] = None
+
+# Aggregated scores of one department or branch within a cycle
+class ReviewScoreSummary(BaseModel):
+    group_id: Optional[int] = None # department_id / branch_id (None: unassigned)
+    reviews: int
+    submitted: int
+    average_score: Optional[float] = None
+    median_score: Optional[float] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
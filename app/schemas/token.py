@@ -9,4 +9,9 @@ class TokenData(BaseModel):
 # Schema for the response when requesting a token
 class Token(BaseModel):
     access_token: str
-    token_type: str
\ No newline at end of file
+    token_type: str
+    refresh_token: Optional[str] = None # Exchange at /auth/refresh instead of logging in again
+
+# Schema for refreshing or revoking a session
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
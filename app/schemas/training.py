@@ -0,0 +1,63 @@
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+# Enum for an employee's place in a training session
+class EnrolmentStatus(str, Enum):
+    ENROLLED = "enrolled"
+    WAITLISTED = "waitlisted"
+    CANCELLED = "cancelled"
+
+# --- Courses ---
+class CourseCreate(BaseModel):
+    code: str = Field(..., min_length=1, max_length=50)
+    title: str = Field(..., min_length=1, max_length=200)
+    description: Optional[str] = None
+
+class Course(CourseCreate):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+# --- Sessions ---
+class TrainingSessionCreate(BaseModel):
+    course_id: int
+    starts_at: datetime
+    ends_at: datetime
+    location: Optional[str] = Field(default=None, max_length=200)
+    capacity: int = Field(..., ge=1)
+
+    @model_validator(mode="after")
+    def check_times(self):
+        if self.ends_at <= self.starts_at:
+            raise ValueError("ends_at must be after starts_at")
+        return self
+
+class TrainingSession(TrainingSessionCreate):
+    id: int
+    seats_remaining: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+# --- Enrolments ---
+class Enrolment(BaseModel):
+    id: int
+    session_id: int
+    employee_id: int
+    status: EnrolmentStatus
+    requested_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class EnrolmentCreate(BaseModel):
+    employee_id: Optional[int] = None # Defaults to the caller's own employee profile
+
+class BulkEnrolmentCreate(BaseModel):
+    department_id: int
+
+class BulkEnrolmentResult(BaseModel):
+    session_id: int
+    added: int # New enrolments (enrolled or waitlisted)
+    enrolled: int # Seats granted by this call, in waitlist order
+    waitlisted: int # Employees of the department still waiting for a seat
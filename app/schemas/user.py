@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+from typing import List, Tuple
 
 from .role import RoleRead # Import the Role schema for reading
 from .branch import Branch # <-- Import Branch schema
@@ -49,7 +49,9 @@ class UserCreate(BaseModel): # Inherit directly from BaseModel for creation
 
 
 class UserInDB(UserBase): # Inherits roles from UserBase
+    id: int | None = None  # Needed to resolve the user's own employee profile
     hashed_password: str  # Stored in the database
+    _masks: Optional[Tuple[int, int]] = PrivateAttr(default=None)  # Cached by app.core.permissions
 
 
 class UserUpdate(BaseModel):
@@ -0,0 +1 @@
+# Command-line benchmarks; run as modules from the repository root (python -m benchmarks.<name>)
@@ -0,0 +1,68 @@
+"""
+Measures password verify latency per hashing scheme and cost on this host.
+
+    python -m benchmarks.password_hashing
+    python -m benchmarks.password_hashing --bcrypt-rounds 10 11 12 13 --argon2-time-cost 2 3 --budget-ms 250
+
+Pick the highest cost whose p99 stays under the login latency budget, then set
+PASSWORD_HASH_SCHEMES / BCRYPT_ROUNDS / ARGON2_* accordingly.
+"""
+import argparse
+import statistics
+import time
+
+from app.core.hashing import build_context
+
+
+def measure(context, iterations: int, password: str = "correct horse battery staple"):
+    hashed = context.hash(password)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        context.verify(password, hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p99_index = min(len(timings) - 1, int(round(0.99 * (len(timings) - 1))))
+    return statistics.mean(timings), statistics.median(timings), timings[p99_index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schemes", nargs="+", default=["bcrypt", "argon2"], choices=["bcrypt", "argon2"])
+    parser.add_argument("--bcrypt-rounds", nargs="+", type=int, default=[10, 11, 12, 13])
+    parser.add_argument("--argon2-time-cost", nargs="+", type=int, default=[2, 3, 4])
+    parser.add_argument("--argon2-memory-cost", type=int, default=65536, help="KiB")
+    parser.add_argument("--argon2-parallelism", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--budget-ms", type=float, default=None, help="Flag configurations whose p99 exceeds this")
+    args = parser.parse_args()
+
+    configs = []
+    if "bcrypt" in args.schemes:
+        configs += [(f"bcrypt rounds={rounds}", build_context(["bcrypt"], bcrypt_rounds=rounds))
+                    for rounds in args.bcrypt_rounds]
+    if "argon2" in args.schemes:
+        configs += [
+            (
+                f"argon2 t={time_cost} m={args.argon2_memory_cost} p={args.argon2_parallelism}",
+                build_context(
+                    ["argon2"], argon2_time_cost=time_cost,
+                    argon2_memory_cost=args.argon2_memory_cost, argon2_parallelism=args.argon2_parallelism,
+                ),
+            )
+            for time_cost in args.argon2_time_cost
+        ]
+
+    print(f"{'configuration':<40} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for label, context in configs:
+        try:
+            mean, p50, p99 = measure(context, args.iterations)
+        except Exception as exc:  # e.g. argon2-cffi not installed
+            print(f"{label:<40} unavailable: {exc}")
+            continue
+        flag = "  over budget" if args.budget_ms is not None and p99 > args.budget_ms else ""
+        print(f"{label:<40} {mean:>9.1f} {p50:>9.1f} {p99:>9.1f}{flag}")
+
+
+if __name__ == "__main__":
+    main()
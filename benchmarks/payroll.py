@@ -0,0 +1,55 @@
+"""
+Measures the vectorized payroll computation on synthetic employees (no database needed).
+
+    python -m benchmarks.payroll --employees 100000
+
+Reports the time for the array computation alone; a real run adds loading the columns and the
+bulk payslip INSERT.
+"""
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+
+from app.core.payroll import EmployeeColumns, compute_payslips
+
+
+def synthetic_columns(count: int, period_start: date, seed: int = 42) -> EmployeeColumns:
+    rng = np.random.default_rng(seed)
+    salaries = rng.normal(60_000, 15_000, count).clip(20_000, None)
+    salaries[rng.random(count) < 0.01] = np.nan # Some employees without a salary
+    hire_offsets = rng.integers(-3650, 30, count) # Mostly long-standing, some mid-period hires
+    leave_dates = np.full(count, np.datetime64("NaT"), dtype="datetime64[D]")
+    leaving = rng.random(count) < 0.01 # Some leave during the period
+    leave_dates[leaving] = np.datetime64(period_start, "D") + rng.integers(0, 28, int(leaving.sum()))
+    return EmployeeColumns(
+        ids=np.arange(1, count + 1, dtype=np.int64),
+        salaries=salaries,
+        hire_dates=np.datetime64(period_start, "D") + hire_offsets,
+        leave_dates=leave_dates,
+        branch_ids=rng.integers(1, 300, count),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--period-start", type=date.fromisoformat, default=date(2026, 10, 1))
+    parser.add_argument("--period-end", type=date.fromisoformat, default=date(2026, 10, 31))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    columns = synthetic_columns(args.employees, args.period_start)
+    leave_days = np.random.default_rng(7).poisson(0.5, args.employees)
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = compute_payslips(columns, leave_days, args.period_start, args.period_end, 12)
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"{len(result['employee_id'])} payslips, net total {result['net'].sum():,.2f}")
+    print(f"compute: best {min(timings):.1f} ms, worst {max(timings):.1f} ms over {args.repeat} runs")
+
+
+if __name__ == "__main__":
+    main()
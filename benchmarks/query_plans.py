@@ -0,0 +1,353 @@
+"""
+Query-plan regression checks for the CRUD read functions, run against a seeded database
+(see app.db.seed).
+
+    python -m app.db.seed --scale 1m
+    python -m benchmarks.query_plans --update-baseline     # record the current plans
+    python -m benchmarks.query_plans                       # check; exits 1 on a regression
+    python -m benchmarks.query_plans --case leave_by_employee --show-plans
+
+Each case calls one CRUD function inside a transaction that is rolled back. Every SELECT it sends
+is captured and re-run under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON). The case then asserts:
+
+- the statement count stays under a bound, so a loop of per-row queries (N+1) fails
+- no plan node loops more than --max-loops times, so a per-row nested loop fails
+- the named tables are never read with a sequential scan, and the expected indexes are used
+  (fnmatch patterns, so partition indexes of leave_requests match too)
+- rows read by scans, counting rows removed by filters, stay under a bound
+
+Plans are compared with the baseline file. A case also fails when the rows it reads grow past
+--tolerance of the baseline. A changed plan shape is printed as a diff; with --strict it fails too.
+"""
+import argparse
+import difflib
+import fnmatch
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.crud import crud_employee, crud_employee_history, crud_leave
+from app.crud import user as crud_user
+from app.db.scoping import set_branch_scope
+
+DEFAULT_BASELINE = Path(__file__).with_name("query_plans_baseline.json")
+
+
+@dataclass
+class Fixtures:
+    """Keys of representative rows in the seeded database, looked up once per run."""
+    employee_id: int
+    email: str
+    user_id: int
+    username: str
+    leave_request_id: int
+    large_branch_id: int
+    small_branch_id: int
+    department_id: int
+    as_of: date
+
+
+@dataclass
+class PlanCase:
+    name: str
+    run: Callable[[Session, Fixtures], Any]
+    branch_scope: Optional[Callable[[Fixtures], int]] = None # Runs the case as a branch-scoped user
+    max_statements: int = 1
+    no_seq_scan: Sequence[str] = () # Tables (and their partitions) that must be read through an index
+    indexes: Sequence[str] = () # Index name patterns; each must appear in some plan
+    max_rows: Optional[int] = None # Rows read by all scans of all statements
+
+
+@dataclass
+class CaseResult:
+    name: str
+    statements: int
+    rows_read: int
+    max_loops: int
+    buffers: Dict[str, int]
+    execution_ms: float
+    shape: List[str]
+    plans: List[Any] = field(repr=False, default_factory=list)
+    failures: List[str] = field(default_factory=list)
+
+
+# --- Cases ---
+CASES: List[PlanCase] = [
+    PlanCase(
+        "user_by_username",
+        lambda db, f: crud_user.get_user_by_username(db, f.username),
+        indexes=["ix_users_username"], no_seq_scan=["users"], max_rows=5,
+    ),
+    PlanCase("user_by_id", lambda db, f: crud_user.get_user(db, f.user_id), no_seq_scan=["users"], max_rows=5),
+    PlanCase(
+        "users_page",
+        lambda db, f: crud_user.get_users(db, limit=100),
+        no_seq_scan=["users"], max_rows=1_000,
+    ),
+    PlanCase("employee_by_id", lambda db, f: crud_employee.get_employee(db, f.employee_id), no_seq_scan=["employees"], max_rows=5),
+    PlanCase(
+        "employee_by_email",
+        lambda db, f: crud_employee.get_employee_by_email(db, f.email),
+        indexes=["ix_employees_email"], no_seq_scan=["employees"], max_rows=5,
+    ),
+    PlanCase(
+        "employee_by_user_id",
+        lambda db, f: crud_employee.get_employee_by_user_id(db, f.user_id),
+        indexes=["ix_employees_user_id"], no_seq_scan=["employees"], max_rows=5,
+    ),
+    PlanCase(
+        "employees_page",
+        lambda db, f: crud_employee.get_employees(db, skip=1_000, limit=100),
+        indexes=["ix_employees_active_id"], no_seq_scan=["employees"], max_rows=2_000,
+    ),
+    PlanCase(
+        "employees_page_branch_scoped",
+        lambda db, f: crud_employee.get_employees(db, limit=100),
+        branch_scope=lambda f: f.large_branch_id,
+        indexes=["ix_employees_active_branch_id_id"], no_seq_scan=["employees"], max_rows=1_000,
+    ),
+    PlanCase(
+        "leave_request_by_id",
+        lambda db, f: crud_leave.get_leave_request(db, f.leave_request_id),
+        no_seq_scan=["leave_requests"], max_rows=5,
+    ),
+    PlanCase(
+        "leave_by_employee",
+        lambda db, f: crud_leave.get_leave_requests_by_employee(db, f.employee_id, limit=50),
+        indexes=["*employee_id_start_date*"], no_seq_scan=["leave_requests"], max_rows=500,
+    ),
+    PlanCase(
+        "leave_by_employee_with_archive",
+        lambda db, f: crud_leave.get_leave_requests_by_employee(db, f.employee_id, limit=50, include_archived=True),
+        max_statements=2, indexes=["*employee_id_start_date*"],
+        no_seq_scan=["leave_requests", "leave_requests_archive"], max_rows=1_000,
+    ),
+    PlanCase(
+        "pending_leave_small_branch",
+        lambda db, f: crud_leave.get_leave_requests_for_team(db, branch_id=f.small_branch_id),
+        no_seq_scan=["leave_requests"], max_rows=2_000,
+    ),
+    PlanCase(
+        "pending_leave_large_branch_scoped",
+        lambda db, f: crud_leave.get_leave_requests_for_team(db, branch_id=f.large_branch_id),
+        branch_scope=lambda f: f.large_branch_id,
+        no_seq_scan=["leave_requests"], max_rows=5_000,
+    ),
+    PlanCase(
+        "pending_leave_department",
+        lambda db, f: crud_leave.get_leave_requests_for_team(db, department_id=f.department_id),
+        no_seq_scan=["leave_requests"],
+    ),
+    PlanCase(
+        "employee_history",
+        lambda db, f: crud_employee_history.get_employee_history(db, f.employee_id),
+        indexes=["ix_employee_history_employee_id_valid_from"], no_seq_scan=["employee_history"], max_rows=50,
+    ),
+    PlanCase(
+        "employee_as_of",
+        lambda db, f: crud_employee_history.get_employee_as_of(db, f.employee_id, f.as_of),
+        indexes=["ix_employee_history_employee_id_valid_from"], no_seq_scan=["employee_history"], max_rows=50,
+    ),
+    PlanCase(
+        "snapshot_as_of",
+        lambda db, f: crud_employee_history.get_snapshot_as_of(db, f.as_of, limit=1_000),
+        no_seq_scan=["employee_history"],
+    ),
+]
+
+
+def load_fixtures(conn: Connection) -> Fixtures:
+    """Picks deterministic representative keys: the active employee with a user nearest the middle id, etc."""
+    employee = conn.execute(text("""
+        SELECT e.id, e.email, e.user_id, e.department_id, u.username
+        FROM employees AS e JOIN users AS u ON u.id = e.user_id
+        WHERE e.deleted_at IS NULL AND e.id >= (SELECT max(id) / 2 FROM employees)
+        ORDER BY e.id
+        LIMIT 1
+    """)).one_or_none()
+    if employee is None:
+        raise RuntimeError("No active employee with a user account; seed the database first (python -m app.db.seed)")
+    branches = conn.execute(text("""
+        SELECT branch_id FROM employees WHERE branch_id IS NOT NULL
+        GROUP BY branch_id ORDER BY count(*) DESC, branch_id
+    """)).scalars().all()
+    leave_request_id = conn.execute(
+        text("SELECT min(id) FROM leave_requests WHERE employee_id = :employee_id"), {"employee_id": employee.id}
+    ).scalar()
+    return Fixtures(
+        employee_id=employee.id,
+        email=employee.email,
+        user_id=employee.user_id,
+        username=employee.username,
+        leave_request_id=leave_request_id or 0,
+        large_branch_id=branches[0],
+        small_branch_id=branches[-1],
+        department_id=employee.department_id,
+        as_of=date.today() - timedelta(days=365),
+    )
+
+
+# --- Plan inspection ---
+def _nodes(node: Dict[str, Any], depth: int = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from _nodes(child, depth + 1)
+
+
+def _is_table(relation: str, table: str) -> bool:
+    """The table itself or one of its partitions (see app.db.partitioning for the naming)."""
+    return relation == table or re.fullmatch(rf"{re.escape(table)}_(y\d+(m\d\d)?|p\d+|default)", relation) is not None
+
+
+def _node_label(node: Dict[str, Any]) -> str:
+    label = node["Node Type"]
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+    return label
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> Dict[str, Any]:
+    result = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters).scalar()
+    return (json.loads(result) if isinstance(result, str) else result)[0]
+
+
+def run_case(engine: Engine, case: PlanCase, fixtures: Fixtures, max_loops: int) -> CaseResult:
+    captured: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            db = Session(bind=conn) # Joins the outer transaction, so everything is rolled back
+            set_branch_scope(db, case.branch_scope(fixtures) if case.branch_scope else None)
+            event.listen(conn, "before_cursor_execute", capture)
+            try:
+                case.run(db, fixtures)
+            finally:
+                event.remove(conn, "before_cursor_execute", capture)
+                db.close()
+            explained = [_explain(conn, statement, parameters) for statement, parameters in captured]
+        finally:
+            transaction.rollback()
+
+    result = CaseResult(
+        name=case.name, statements=len(captured), rows_read=0, max_loops=0,
+        buffers={"hit": 0, "read": 0}, execution_ms=0.0, shape=[], plans=explained,
+    )
+    used_indexes, seq_scanned = set(), set()
+    for number, explain in enumerate(explained, start=1):
+        plan = explain["Plan"]
+        result.execution_ms += explain.get("Execution Time", 0.0)
+        result.buffers["hit"] += plan.get("Shared Hit Blocks", 0) # Top node totals include its children
+        result.buffers["read"] += plan.get("Shared Read Blocks", 0)
+        result.shape.append(f"-- statement {number}")
+        for depth, node in _nodes(plan):
+            result.shape.append("  " * depth + _node_label(node))
+            loops = node.get("Actual Loops", 1)
+            result.max_loops = max(result.max_loops, loops)
+            if "Index Name" in node:
+                used_indexes.add(node["Index Name"])
+            relation = node.get("Relation Name")
+            if relation is None: # Bitmap index scans are counted by their heap scan
+                continue
+            removed = node.get("Rows Removed by Filter", 0) + node.get("Rows Removed by Index Recheck", 0)
+            result.rows_read += (node.get("Actual Rows", 0) + removed) * loops
+            if node["Node Type"] == "Seq Scan":
+                seq_scanned.add(relation)
+
+    if result.statements > case.max_statements:
+        result.failures.append(f"{result.statements} statements (max {case.max_statements}); N+1 queries?")
+    if result.max_loops > max_loops:
+        result.failures.append(f"a plan node ran {result.max_loops} loops (max {max_loops}); per-row nested loop?")
+    for table in case.no_seq_scan:
+        scanned = sorted(relation for relation in seq_scanned if _is_table(relation, table))
+        if scanned:
+            result.failures.append(f"sequential scan on {', '.join(scanned)}")
+    for pattern in case.indexes:
+        if not any(fnmatch.fnmatch(index, pattern) for index in used_indexes):
+            result.failures.append(f"no index matching {pattern!r} used (used: {', '.join(sorted(used_indexes)) or 'none'})")
+    if case.max_rows is not None and result.rows_read > case.max_rows:
+        result.failures.append(f"{result.rows_read} rows read (max {case.max_rows})")
+    return result
+
+
+def compare_with_baseline(result: CaseResult, baseline: Optional[Dict[str, Any]], tolerance: float, strict: bool) -> List[str]:
+    """Adds regressions against the recorded run to result.failures; returns the plan diff lines."""
+    if baseline is None:
+        return []
+    allowed = baseline["rows_read"] * (1 + tolerance) + 100 # Absolute slack for tiny row counts
+    if result.rows_read > allowed:
+        result.failures.append(f"{result.rows_read} rows read, baseline {baseline['rows_read']}")
+    if result.statements > baseline["statements"]:
+        result.failures.append(f"{result.statements} statements, baseline {baseline['statements']}")
+    diff = list(difflib.unified_diff(baseline["shape"], result.shape, "baseline", "current", lineterm=""))
+    if diff and strict:
+        result.failures.append("plan shape changed")
+    return diff
+
+
+def _main(argv: Optional[List[str]] = None) -> int:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--case", action="append", choices=[case.name for case in CASES], help="Repeatable; default all")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Record the current plans as the baseline")
+    parser.add_argument("--strict", action="store_true", help="Also fail when a plan's shape changed")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed growth of rows read over the baseline")
+    parser.add_argument("--max-loops", type=int, default=1_000)
+    parser.add_argument("--show-plans", action="store_true", help="Print the full EXPLAIN output")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.case or case.name in args.case]
+    baselines = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    with engine.connect() as conn:
+        fixtures = load_fixtures(conn)
+
+    results, failed = [], 0
+    print(f"{'case':<36}{'stmts':>6}{'rows read':>11}{'loops':>7}{'hit':>8}{'read':>7}{'ms':>9}  result")
+    for case in cases:
+        result = run_case(engine, case, fixtures, args.max_loops)
+        diff = [] if args.update_baseline else compare_with_baseline(
+            result, baselines.get(case.name), args.tolerance, args.strict,
+        )
+        failed += bool(result.failures)
+        status = "FAIL" if result.failures else ("changed" if diff else "ok")
+        print(
+            f"{case.name:<36}{result.statements:>6}{result.rows_read:>11}{result.max_loops:>7}"
+            f"{result.buffers['hit']:>8}{result.buffers['read']:>7}{result.execution_ms:>9.2f}  {status}"
+        )
+        for failure in result.failures:
+            print(f"    - {failure}")
+        for line in diff:
+            print(f"    {line}")
+        if args.show_plans:
+            print(json.dumps(result.plans, indent=2, default=str))
+        results.append(result)
+
+    if args.update_baseline:
+        baselines.update({
+            result.name: {"statements": result.statements, "rows_read": result.rows_read, "shape": result.shape}
+            for result in results
+        })
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    print(f"{len(results) - failed}/{len(results)} cases passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -0,0 +1,85 @@
+"""
+Measures concurrent enrolment throughput against a real database (DATABASE_URL from settings).
+
+    python -m benchmarks.training_booking --employees 500 --capacity 100 --concurrency 32
+
+Creates a throwaway course and session, has `--employees` existing employees book it from
+`--concurrency` threads at once, then checks that exactly `--capacity` seats were granted, the
+rest were waitlisted and no seat counter went negative. The session is removed afterwards.
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from app.crud import crud_training
+from app.db.models.employee import Employee
+from app.db.models.training import Course, Enrolment, TrainingSession
+from app.db.session import SessionLocal
+from app.schemas.training import EnrolmentStatus
+
+
+def _book(session_id: int, employee_id: int) -> float:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        crud_training.enrol(db, session_id, employee_id)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=500, help="Existing employees that try to book")
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32, help="Threads booking at once (keep <= pool size)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        employee_ids = db.execute(select(Employee.id).order_by(Employee.id).limit(args.employees)).scalars().all()
+        if len(employee_ids) < args.employees:
+            parser.error(f"only {len(employee_ids)} employees in the database")
+        now = datetime.now(timezone.utc)
+        course = Course(code=f"bench-{now:%Y%m%d%H%M%S%f}", title="Booking benchmark")
+        db.add(course)
+        db.flush()
+        training_session = TrainingSession(
+            course_id=course.id, starts_at=now + timedelta(days=30), ends_at=now + timedelta(days=30, hours=2),
+            capacity=args.capacity, seats_remaining=args.capacity,
+        )
+        db.add(training_session)
+        db.commit()
+        course_id, session_id = course.id, training_session.id
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            timings = sorted(pool.map(lambda employee_id: _book(session_id, employee_id), employee_ids))
+        elapsed = time.perf_counter() - started
+
+        with SessionLocal() as db:
+            counts = dict(db.execute(
+                select(Enrolment.status, func.count()).where(Enrolment.session_id == session_id).group_by(Enrolment.status)
+            ).all())
+            seats_remaining = db.get(TrainingSession, session_id).seats_remaining
+        enrolled = counts.get(EnrolmentStatus.ENROLLED, 0)
+        waitlisted = counts.get(EnrolmentStatus.WAITLISTED, 0)
+        expected = min(args.capacity, args.employees)
+        p99 = timings[min(len(timings) - 1, int(round(0.99 * (len(timings) - 1))))]
+        print(f"{len(timings)} bookings from {args.concurrency} threads in {elapsed:.2f} s "
+              f"({len(timings) / elapsed:,.0f} bookings/s)")
+        print(f"latency: p50 {statistics.median(timings):.1f} ms, p99 {p99:.1f} ms")
+        print(f"enrolled {enrolled} (expected {expected}), waitlisted {waitlisted}, seats left {seats_remaining}")
+        if enrolled != expected or enrolled + waitlisted != args.employees or seats_remaining != args.capacity - enrolled:
+            raise SystemExit("FAILED: seat accounting is inconsistent")
+    finally:
+        with SessionLocal() as db:
+            db.execute(delete(Enrolment).where(Enrolment.session_id == session_id))
+            db.execute(delete(TrainingSession).where(TrainingSession.id == session_id))
+            db.execute(delete(Course).where(Course.id == course_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
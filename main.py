@@ -1,14 +1,21 @@
+import time
+_imports_started = time.perf_counter() # Module imports (settings, models, routers) are reported as a startup phase
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import routers and settings
-from app.api.v1.endpoints import employees, auth, leave, department, position, user, role, branch # Import branch router
+from app.api.v1.endpoints import employees, auth, leave, department, position, user, role, branch, jobs, audit, changes, jwks, payroll, reviews, recruitment, careers, training, health # Import branch router
 from app.core.config import settings
+from app.core.startup import lifespan, pipeline
+
+pipeline.record("imports", time.perf_counter() - _imports_started)
 
 app = FastAPI(
     title=settings.PROJECT_NAME, # Use project name from settings
     description="Backend API for the HR System, now with a structured layout.",
-    version="0.2.0"
+    version="0.2.0",
+    lifespan=lifespan, # Startup pipeline: mappers, connections, caches, compiled statements, background writers
 )
 
 # --- Middleware ---
@@ -31,6 +38,16 @@ app.include_router(position.router)
 app.include_router(user.router, prefix="/api/v1/users", tags=["users"]) # Add user router
 app.include_router(role.router, prefix="/api/v1/roles", tags=["roles"]) # Add role router
 app.include_router(branch.router, prefix="/api/v1/branches", tags=["branches"]) # Add branch router
+app.include_router(jobs.router)
+app.include_router(audit.router)
+app.include_router(changes.router)
+app.include_router(jwks.router)
+app.include_router(payroll.router)
+app.include_router(reviews.router)
+app.include_router(recruitment.router)
+app.include_router(careers.router)
+app.include_router(training.router)
+app.include_router(health.router)
 # Add other routers here (e.g., departments, internal) as needed
 
 @app.get("/")
@@ -42,4 +59,4 @@ async def read_root():
 
 # --- Optional: Add global dependencies or middleware here if needed ---
 # Example: app.add_middleware(...)
-# Example: app.add_event_handler("startup", ...)
\ No newline at end of file
+# Startup/shutdown work goes into the pipeline in app/core/startup.py
\ No newline at end of file